@@ -6,8 +6,14 @@ import { MetricsPage } from './components/MetricsPage';
 import { DatabaseBrowserPage, initialDatabaseBrowserState } from './components/DatabaseBrowserPage';
 import type { DatabaseBrowserState } from './components/DatabaseBrowserPage';
 import { ADSORPTION_MODELS } from './adsorptionModels';
-import { loadDataset, startFitting } from './services';
-import type { DatasetPayload, FittingPayload, ModelParameters, ModelConfiguration } from './types';
+import { cancelFitting, loadDataset, streamFitting } from './services';
+import type {
+    DatasetPayload,
+    FittingExperimentEvent,
+    FittingPayload,
+    ModelParameters,
+    ModelConfiguration,
+} from './types';
 import './index.css';
 
 interface ModelState {
@@ -16,6 +22,8 @@ interface ModelState {
 }
 
 type PageType = 'config' | 'models' | 'metrics' | 'browser';
+
+const MAX_STREAMED_STATUS_LINES = 20;
 type OptimizationMethod = FittingPayload['optimization_method'];
 
 function App() {
@@ -24,6 +32,7 @@ function App() {
     const [optimizationMethod, setOptimizationMethod] = useState<OptimizationMethod>('LSS');
     const [datasetStats, setDatasetStats] = useState('No dataset loaded.');
     const [fittingStatus, setFittingStatus] = useState('');
+    const [activeJobId, setActiveJobId] = useState<string | null>(null);
     const [dataset, setDataset] = useState<DatasetPayload | null>(null);
     const [datasetName, setDatasetName] = useState<string | null>(null);
     const [datasetSamples, setDatasetSamples] = useState(0);
@@ -128,16 +137,53 @@ function App() {
             dataset,
         };
 
-        const result = await startFitting(payload);
+        // Results are rendered as each experiment completes instead of after the full job.
+        const recentLines: string[] = [];
+        let progressLine = '[INFO] Fitting in progress...';
+        const renderProgress = () => {
+            setFittingStatus([progressLine, ...recentLines].join('\n'));
+        };
+
+        const result = await streamFitting(payload, {
+            onStarted: setActiveJobId,
+            onProgress: (completed, total) => {
+                progressLine = `[INFO] Fitting in progress: ${completed}/${total} experiments completed`;
+                renderProgress();
+            },
+            onExperiment: (event: FittingExperimentEvent) => {
+                let bestModel: string | null = null;
+                let bestScore = Infinity;
+                Object.entries(event.models).forEach(([modelName, summary]) => {
+                    if (summary.aicc !== null && summary.aicc < bestScore) {
+                        bestScore = summary.aicc;
+                        bestModel = modelName;
+                    }
+                });
+                const label = bestModel ? `${bestModel} (AICc ${bestScore.toFixed(2)})` : 'no valid fit';
+                recentLines.unshift(`${event.experiment}: ${label}`);
+                recentLines.splice(MAX_STREAMED_STATUS_LINES);
+                renderProgress();
+            },
+        });
+        setActiveJobId(null);
         setFittingStatus(result.message);
     }, [dataset, modelStates, maxIterations, optimizationMethod]);
 
+    const handleStopFitting = useCallback(async () => {
+        if (!activeJobId) {
+            return;
+        }
+        const message = await cancelFitting(activeJobId);
+        setFittingStatus((current) => `${message}\n${current}`);
+    }, [activeJobId]);
+
     const methodLabels: Record<OptimizationMethod, string> = {
         LSS: 'Least Squares',
         BFGS: 'BFGS',
         'L-BFGS-B': 'L-BFGS-B',
         'Nelder-Mead': 'Nelder-Mead',
         Powell: 'Powell',
+        AUTO: 'Automatic',
     };
 
     const optimizationLabel = methodLabels[optimizationMethod];
@@ -173,6 +219,8 @@ function App() {
                             optimizationLabel={optimizationLabel}
                             onDatasetUpload={handleDatasetUpload}
                             onStartFitting={handleStartFitting}
+                            isFitting={activeJobId !== null}
+                            onStopFitting={handleStopFitting}
                             onResetFittingStatus={handleResetFittingStatus}
                         />
                     )}
@@ -16,6 +16,8 @@ interface ConfigPageProps {
     optimizationLabel: string;
     onDatasetUpload: (file: File) => void;
     onStartFitting: () => void;
+    isFitting: boolean;
+    onStopFitting: () => void;
     onResetFittingStatus: () => void;
 }
 
@@ -31,6 +33,8 @@ export const ConfigPage: React.FC<ConfigPageProps> = ({
     optimizationLabel,
     onDatasetUpload,
     onStartFitting,
+    isFitting,
+    onStopFitting,
     onResetFittingStatus,
 }) => {
     const datasetBadge = datasetName || 'No dataset loaded';
@@ -70,6 +74,7 @@ export const ConfigPage: React.FC<ConfigPageProps> = ({
                                 <option value="L-BFGS-B">L-BFGS-B</option>
                                 <option value="Nelder-Mead">Nelder-Mead</option>
                                 <option value="Powell">Powell</option>
+                                <option value="AUTO">Automatic (fallback ladder)</option>
                             </select>
                         </div>
 
@@ -123,9 +128,15 @@ export const ConfigPage: React.FC<ConfigPageProps> = ({
                                 <button className="ghost-button" onClick={onResetFittingStatus}>
                                     Reset
                                 </button>
-                                <button className="primary" onClick={onStartFitting}>
-                                    Start fitting
-                                </button>
+                                {isFitting ? (
+                                    <button className="ghost-button" onClick={onStopFitting}>
+                                        Stop fitting
+                                    </button>
+                                ) : (
+                                    <button className="primary" onClick={onStartFitting}>
+                                        Start fitting
+                                    </button>
+                                )}
                             </div>
                         </div>
                         <div className="panel-body log-scroll">
@@ -1,6 +1,13 @@
 // API service for dataset and fitting endpoints
 
-import type { DatasetPayload, DatasetResponse, FittingPayload, FittingResponse } from './types';
+import type {
+    DatasetPayload,
+    DatasetResponse,
+    FittingExperimentEvent,
+    FittingPayload,
+    FittingResponse,
+    FittingStreamHandlers,
+} from './types';
 import { API_BASE_URL } from './constants';
 
 const HTTP_TIMEOUT = 120000; // 120 seconds
@@ -76,50 +83,136 @@ export async function loadDataset(file: File): Promise<{ dataset: DatasetPayload
     }
 }
 
-export async function startFitting(payload: FittingPayload): Promise<{ message: string; data: FittingResponse | null }> {
+export async function cancelFitting(jobId: string): Promise<string> {
     try {
         const response = await fetchWithTimeout(
-            `${API_BASE_URL}/fitting/run`,
-            {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify(payload),
-            },
+            `${API_BASE_URL}/fitting/jobs/${encodeURIComponent(jobId)}/cancel`,
+            { method: 'POST' },
             HTTP_TIMEOUT
         );
-
         if (!response.ok) {
             const data = await response.json().catch(() => ({}));
-            const message = extractErrorMessage(response, data);
-            return { message: `[ERROR] ${message}`, data: null };
+            return `[ERROR] ${extractErrorMessage(response, data)}`;
+        }
+        return '[INFO] Stopping fitting; results completed so far will be kept.';
+    } catch (error) {
+        if (error instanceof Error) {
+            return `[ERROR] Failed to reach ADSORFIT backend: ${error.message}`;
         }
+        return '[ERROR] An unknown error occurred.';
+    }
+}
 
-        const data = (await response.json()) as FittingResponse;
+function describeFittingResponse(data: FittingResponse): { message: string; data: FittingResponse | null } {
+    if (data.status !== 'success') {
+        const detail = data.detail || data.message || 'Unknown error';
+        return { message: `[ERROR] ${detail}`, data };
+    }
 
-        if (data.status !== 'success') {
-            const detail = data.detail || data.message || 'Unknown error';
-            return { message: `[ERROR] ${detail}`, data };
-        }
+    if (data.summary) {
+        return { message: data.summary, data };
+    }
 
-        if (data.summary) {
-            return { message: data.summary, data };
-        }
+    const lines: string[] = [
+        data.partial
+            ? `[WARNING] Fitting stopped early (${data.stop_reason ?? 'interrupted'}); results are partial.`
+            : '[INFO] Fitting completed successfully.',
+    ];
+    if (typeof data.processed_rows === 'number') {
+        lines.push(`Processed experiments: ${data.processed_rows}`);
+    }
+    if (typeof data.best_model_saved === 'boolean') {
+        lines.push(`Best model saved: ${data.best_model_saved ? 'Yes' : 'No'}`);
+    }
+    if (Array.isArray(data.models) && data.models.length > 0) {
+        lines.push('Configured models:');
+        data.models.forEach((model) => lines.push(`  - ${model}`));
+    }
+
+    return { message: lines.join('\n'), data };
+}
 
-        const lines: string[] = ['[INFO] Fitting completed successfully.'];
-        if (typeof data.processed_rows === 'number') {
-            lines.push(`Processed experiments: ${data.processed_rows}`);
+function parseEventBlock(block: string): { event: string; data: unknown } | null {
+    let event = 'message';
+    const dataLines: string[] = [];
+    block.split('\n').forEach((line) => {
+        if (line.startsWith('event:')) {
+            event = line.slice(6).trim();
+        } else if (line.startsWith('data:')) {
+            dataLines.push(line.slice(5).trim());
         }
-        if (typeof data.best_model_saved === 'boolean') {
-            lines.push(`Best model saved: ${data.best_model_saved ? 'Yes' : 'No'}`);
+    });
+    if (dataLines.length === 0) {
+        return null;
+    }
+    try {
+        return { event, data: JSON.parse(dataLines.join('\n')) };
+    } catch {
+        return null;
+    }
+}
+
+// Streams a fitting job from the Server-Sent Events endpoint. Per-experiment results
+// and progress are forwarded to the handlers while the job runs.
+export async function streamFitting(
+    payload: FittingPayload,
+    handlers: FittingStreamHandlers
+): Promise<{ message: string; data: FittingResponse | null }> {
+    try {
+        const response = await fetch(`${API_BASE_URL}/fitting/stream`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                Accept: 'text/event-stream',
+            },
+            body: JSON.stringify(payload),
+        });
+
+        if (!response.ok || !response.body) {
+            const data = await response.json().catch(() => ({}));
+            const message = extractErrorMessage(response, data);
+            return { message: `[ERROR] ${message}`, data: null };
         }
-        if (Array.isArray(data.models) && data.models.length > 0) {
-            lines.push('Configured models:');
-            data.models.forEach((model) => lines.push(`  - ${model}`));
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let result: { message: string; data: FittingResponse | null } = {
+            message: '[ERROR] Fitting stream ended before the job completed.',
+            data: null,
+        };
+
+        for (;;) {
+            const { value, done } = await reader.read();
+            if (done) {
+                break;
+            }
+            buffer += decoder.decode(value, { stream: true });
+            let boundary = buffer.indexOf('\n\n');
+            while (boundary !== -1) {
+                const parsed = parseEventBlock(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                boundary = buffer.indexOf('\n\n');
+                if (!parsed) {
+                    continue;
+                }
+                const data = parsed.data as Record<string, unknown>;
+                if (parsed.event === 'started') {
+                    handlers.onStarted?.(String(data.job_id));
+                } else if (parsed.event === 'progress') {
+                    handlers.onProgress?.(Number(data.completed), Number(data.total));
+                } else if (parsed.event === 'experiment') {
+                    handlers.onExperiment?.(parsed.data as FittingExperimentEvent);
+                } else if (parsed.event === 'complete') {
+                    result = describeFittingResponse(parsed.data as FittingResponse);
+                } else if (parsed.event === 'error') {
+                    const detail = typeof data.detail === 'string' ? data.detail : 'Unknown error';
+                    result = { message: `[ERROR] ${detail}`, data: null };
+                }
+            }
         }
 
-        return { message: lines.join('\n'), data };
+        return result;
     } catch (error) {
         if (error instanceof Error) {
             return { message: `[ERROR] Failed to reach ADSORFIT backend: ${error.message}`, data: null };
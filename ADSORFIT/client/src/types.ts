@@ -22,7 +22,7 @@ export interface ModelConfiguration {
 
 export interface FittingPayload {
     max_iterations: number;
-    optimization_method: 'LSS' | 'BFGS' | 'L-BFGS-B' | 'Nelder-Mead' | 'Powell';
+    optimization_method: 'LSS' | 'BFGS' | 'L-BFGS-B' | 'Nelder-Mead' | 'Powell' | 'AUTO';
     parameter_bounds: Record<string, ModelConfiguration>;
     dataset: DatasetPayload;
 }
@@ -43,6 +43,34 @@ export interface FittingResponse {
     processed_rows?: number;
     best_model_saved?: boolean;
     models?: string[];
+    job_id?: string | null;
+    total_experiments?: number | null;
+    partial?: boolean;
+    stop_reason?: string | null;
+    result_source?: 'computed' | 'shared' | 'cached';
+    peak_memory_mb?: number | null;
+}
+
+export interface ModelFitSummary {
+    score: number | null;
+    aic: number | null;
+    aicc: number | null;
+    optimization_method: string | null;
+    parameters: Record<string, number | null>;
+    errors: Record<string, number | null>;
+    error?: string;
+}
+
+export interface FittingExperimentEvent {
+    index: number;
+    experiment: string;
+    models: Record<string, ModelFitSummary>;
+}
+
+export interface FittingStreamHandlers {
+    onStarted?: (jobId: string) => void;
+    onProgress?: (completed: number, total: number) => void;
+    onExperiment?: (event: FittingExperimentEvent) => void;
 }
 
 export type ParameterKey = [string, string, string]; // [model, parameter, bound_type]
@@ -1,21 +1,74 @@
 from __future__ import annotations
 
+import time
+
+APP_IMPORT_STARTED = time.perf_counter()
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 
-from ADSORFIT.server.utils.constants import DOCS_ENDPOINT, ROOT_ENDPOINT
+from ADSORFIT.server.database.database import database
+from ADSORFIT.server.utils.constants import (
+    DOCS_ENDPOINT,
+    ROOT_ENDPOINT,
+    WORKER_WARMUP_MODULES,
+)
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.startup import (
+    format_timings,
+    preimport_modules,
+    run_timed_steps,
+)
 from ADSORFIT.server.utils.variables import env_variables
 from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.routes.datasets import get_dataset_service
 from ADSORFIT.server.routes.datasets import router as dataset_router
+from ADSORFIT.server.routes.fitting import get_pipeline
 from ADSORFIT.server.routes.fitting import router as fit_router
 from ADSORFIT.server.routes.browser import router as browser_router
 
+APP_IMPORT_SECONDS = time.perf_counter() - APP_IMPORT_STARTED
+
+
+# -------------------------------------------------------------------------
+def warm_up_worker() -> None:
+    """Load the numerical stack and build service singletons before serving.
+
+    Keyword arguments:
+    None.
+
+    Return value:
+    None.
+    """
+    import_timings = preimport_modules(WORKER_WARMUP_MODULES)
+    service_timings = run_timed_steps(
+        {
+            "database": database.initialize,
+            "fitting_pipeline": get_pipeline,
+            "dataset_service": get_dataset_service,
+        }
+    )
+    logger.info("Application modules imported in %.3fs", APP_IMPORT_SECONDS)
+    logger.info("Worker warm-up imports: %s", format_timings(import_timings))
+    logger.info("Worker warm-up services: %s", format_timings(service_timings))
+
+
+# -------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    warm_up_worker()
+    yield
+
 
 ###############################################################################
 app = FastAPI(
     title=server_settings.fastapi.title,
     version=server_settings.fastapi.version,
     description=server_settings.fastapi.description,
+    lifespan=lifespan,
 )
 
 app.include_router(dataset_router)
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any, Protocol
 
 import pandas as pd
 
 from ADSORFIT.server.utils.configurations import DatabaseSettings, server_settings
 from ADSORFIT.server.utils.logger import logger
-from ADSORFIT.server.database.postgres import PostgresRepository
-from ADSORFIT.server.database.schema import Base
-from ADSORFIT.server.database.sqlite import SQLiteRepository
 
 
 ###############################################################################
@@ -29,16 +27,25 @@ class DatabaseBackend(Protocol):
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int: ...
 
+    # -------------------------------------------------------------------------
+    def write_lock(self) -> AbstractContextManager[None]: ...
+
 
 BackendFactory = Callable[[DatabaseSettings], DatabaseBackend]
 
 
+# SQLAlchemy and the repository modules are imported inside the factories so that
+# importing this module (and every route depending on it) stays cheap.
 # -------------------------------------------------------------------------
 def build_sqlite_backend(settings: DatabaseSettings) -> DatabaseBackend:
+    from ADSORFIT.server.database.sqlite import SQLiteRepository
+
     return SQLiteRepository(settings)
 
 # -------------------------------------------------------------------------
 def build_postgres_backend(settings: DatabaseSettings) -> DatabaseBackend:
+    from ADSORFIT.server.database.postgres import PostgresRepository
+
     return PostgresRepository(settings)
 
 
@@ -52,7 +59,20 @@ BACKEND_FACTORIES: dict[str, BackendFactory] = {
 class ADSORFITDatabase:
     def __init__(self) -> None:
         self.settings = server_settings.database
-        self.backend = self._build_backend(self.settings.embedded_database)
+        self._backend: DatabaseBackend | None = None
+
+    # -------------------------------------------------------------------------
+    @property
+    def backend(self) -> DatabaseBackend:
+        # Engine creation and table checks are deferred until the first query (or
+        # the application warm-up) instead of running at import time.
+        if self._backend is None:
+            self._backend = self._build_backend(self.settings.embedded_database)
+        return self._backend
+
+    # -------------------------------------------------------------------------
+    def initialize(self) -> DatabaseBackend:
+        return self.backend
 
     # -------------------------------------------------------------------------
     def _build_backend(self, is_embedded: bool) -> DatabaseBackend:
@@ -84,6 +104,10 @@ class ADSORFITDatabase:
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int:
         return self.backend.count_rows(table_name)
-   
+
+    # -------------------------------------------------------------------------
+    def write_lock(self) -> AbstractContextManager[None]:
+        return self.backend.write_lock()
+
 
 database = ADSORFITDatabase()
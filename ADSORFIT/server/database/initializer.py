@@ -51,6 +51,9 @@ def clone_settings_with_database(
         ssl_ca=settings.ssl_ca,
         connect_timeout=settings.connect_timeout,
         insert_batch_size=settings.insert_batch_size,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        write_lock_timeout=settings.write_lock_timeout,
     )
 
 
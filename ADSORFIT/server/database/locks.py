@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ADSORFIT.server.utils.locks import ReentrantWriteLock, wait_for_lock
+
+
+###############################################################################
+class AdvisoryWriteLock(ReentrantWriteLock):
+    def __init__(self, engine: Any, key: int, timeout: float) -> None:
+        super().__init__(f"pg_advisory({key})", timeout)
+        self.engine = engine
+        self.key = key
+        self.connection: Any = None
+
+    # -------------------------------------------------------------------------
+    def try_lock_connection(self) -> bool:
+        import sqlalchemy
+
+        acquired = self.connection.execute(
+            sqlalchemy.text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+        ).scalar()
+        self.connection.commit()
+        return bool(acquired)
+
+    # -------------------------------------------------------------------------
+    def acquire_process_lock(self) -> None:
+        self.connection = self.engine.connect()
+        try:
+            wait_for_lock(self.try_lock_connection, self.timeout, self.name)
+        except Exception:
+            self.connection.close()
+            self.connection = None
+            raise
+
+    # -------------------------------------------------------------------------
+    def release_process_lock(self) -> None:
+        if self.connection is None:
+            return
+        import sqlalchemy
+
+        try:
+            self.connection.execute(
+                sqlalchemy.text("SELECT pg_advisory_unlock(:key)"), {"key": self.key}
+            )
+            self.connection.commit()
+        finally:
+            self.connection.close()
+            self.connection = None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import urllib.parse
+import zlib
+from contextlib import AbstractContextManager
 from typing import Any
 
 import pandas as pd
@@ -11,6 +13,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from ADSORFIT.server.utils.configurations import DatabaseSettings
+from ADSORFIT.server.database.locks import AdvisoryWriteLock
 from ADSORFIT.server.database.schema import Base
 from ADSORFIT.server.database.utils import normalize_postgres_engine
 from ADSORFIT.server.utils.logger import logger
@@ -48,11 +51,23 @@ class PostgresRepository:
             future=True,
             connect_args=connect_args,
             pool_pre_ping=True,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
         )
         self.Session = sessionmaker(bind=self.engine, future=True)
         self.insert_batch_size = settings.insert_batch_size
+        # Multi-table saves from several workers are serialized with a session-level
+        # advisory lock keyed on the database name.
+        lock_key = zlib.crc32(settings.database_name.encode("utf-8"))
+        self.writer_lock = AdvisoryWriteLock(
+            self.engine, lock_key, settings.write_lock_timeout
+        )
         Base.metadata.create_all(self.engine, checkfirst=True)
 
+    # -------------------------------------------------------------------------
+    def write_lock(self) -> AbstractContextManager[None]:
+        return self.writer_lock.hold()
+
     # -------------------------------------------------------------------------
     def get_table_class(self, table_name: str) -> Any:
         for cls in Base.__subclasses__():
@@ -103,7 +118,7 @@ class PostgresRepository:
 
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None:
-        with self.engine.begin() as conn:
+        with self.write_lock(), self.engine.begin() as conn:
             inspector = inspect(conn)
             table_cls = None
             try:
@@ -131,7 +146,8 @@ class PostgresRepository:
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         table_cls = self.get_table_class(table_name)
-        self.upsert_dataframe(df, table_cls)
+        with self.write_lock():
+            self.upsert_dataframe(df, table_cls)
 
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int:
@@ -68,13 +68,18 @@ class AdsorptionLangmuirResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     qsat = Column("qsat", Float)
     qsat_error = Column("qsat error", Float)
+    qsat_ci_lower = Column("qsat ci lower", Float)
+    qsat_ci_upper = Column("qsat ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -89,15 +94,22 @@ class AdsorptionSipsResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     qsat = Column("qsat", Float)
     qsat_error = Column("qsat error", Float)
+    qsat_ci_lower = Column("qsat ci lower", Float)
+    qsat_ci_upper = Column("qsat ci upper", Float)
     exponent = Column("exponent", Float)
     exponent_error = Column("exponent error", Float)
+    exponent_ci_lower = Column("exponent ci lower", Float)
+    exponent_ci_upper = Column("exponent ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -112,13 +124,18 @@ class AdsorptionFreundlichResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     exponent = Column("exponent", Float)
     exponent_error = Column("exponent error", Float)
+    exponent_ci_lower = Column("exponent ci lower", Float)
+    exponent_ci_upper = Column("exponent ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -133,13 +150,18 @@ class AdsorptionTemkinResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     beta = Column("beta", Float)
     beta_error = Column("beta error", Float)
+    beta_ci_lower = Column("beta ci lower", Float)
+    beta_ci_upper = Column("beta ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -154,15 +176,22 @@ class AdsorptionTothResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     qsat = Column("qsat", Float)
     qsat_error = Column("qsat error", Float)
+    qsat_ci_lower = Column("qsat ci lower", Float)
+    qsat_ci_upper = Column("qsat ci upper", Float)
     exponent = Column("exponent", Float)
     exponent_error = Column("exponent error", Float)
+    exponent_ci_lower = Column("exponent ci lower", Float)
+    exponent_ci_upper = Column("exponent ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -177,13 +206,18 @@ class AdsorptionDubininRadushkevichResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     qsat = Column("qsat", Float)
     qsat_error = Column("qsat error", Float)
+    qsat_ci_lower = Column("qsat ci lower", Float)
+    qsat_ci_upper = Column("qsat ci upper", Float)
     beta = Column("beta", Float)
     beta_error = Column("beta error", Float)
+    beta_ci_lower = Column("beta ci lower", Float)
+    beta_ci_upper = Column("beta ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -198,17 +232,26 @@ class AdsorptionDualSiteLangmuirResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k1 = Column("k1", Float)
     k1_error = Column("k1 error", Float)
+    k1_ci_lower = Column("k1 ci lower", Float)
+    k1_ci_upper = Column("k1 ci upper", Float)
     qsat1 = Column("qsat1", Float)
     qsat1_error = Column("qsat1 error", Float)
+    qsat1_ci_lower = Column("qsat1 ci lower", Float)
+    qsat1_ci_upper = Column("qsat1 ci upper", Float)
     k2 = Column("k2", Float)
     k2_error = Column("k2 error", Float)
+    k2_ci_lower = Column("k2 ci lower", Float)
+    k2_ci_upper = Column("k2 ci upper", Float)
     qsat2 = Column("qsat2", Float)
     qsat2_error = Column("qsat2 error", Float)
+    qsat2_ci_lower = Column("qsat2 ci lower", Float)
+    qsat2_ci_upper = Column("qsat2 ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -223,15 +266,22 @@ class AdsorptionRedlichPetersonResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     a = Column("a", Float)
     a_error = Column("a error", Float)
+    a_ci_lower = Column("a ci lower", Float)
+    a_ci_upper = Column("a ci upper", Float)
     beta = Column("beta", Float)
     beta_error = Column("beta error", Float)
+    beta_ci_lower = Column("beta ci lower", Float)
+    beta_ci_upper = Column("beta ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
@@ -246,13 +296,18 @@ class AdsorptionJovanovicResults(Base):
         Integer, ForeignKey("ADSORPTION_EXPERIMENT.id"), nullable=False
     )
     optimization_method = Column("optimization method", String)
+    status = Column("status", String)
     score = Column("score", Float)
     aic = Column("AIC", Float)
     aicc = Column("AICc", Float)
     k = Column("k", Float)
     k_error = Column("k error", Float)
+    k_ci_lower = Column("k ci lower", Float)
+    k_ci_upper = Column("k ci upper", Float)
     qsat = Column("qsat", Float)
     qsat_error = Column("qsat error", Float)
+    qsat_ci_lower = Column("qsat ci lower", Float)
+    qsat_ci_upper = Column("qsat ci upper", Float)
     __table_args__ = (
         UniqueConstraint("id"),
         UniqueConstraint("experiment_id"),
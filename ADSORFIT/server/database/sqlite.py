@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import os
+from contextlib import AbstractContextManager
 from typing import Any
 
 import pandas as pd
 import sqlalchemy
-from sqlalchemy import UniqueConstraint, inspect
+from sqlalchemy import UniqueConstraint, event, inspect
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
@@ -13,6 +14,7 @@ from sqlalchemy.orm import sessionmaker
 from ADSORFIT.server.utils.configurations import DatabaseSettings
 from ADSORFIT.server.utils.constants import DATA_PATH, DATABASE_FILENAME
 from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.locks import FileWriteLock
 from ADSORFIT.server.database.schema import Base
 
 
@@ -21,12 +23,43 @@ class SQLiteRepository:
     def __init__(self, settings: DatabaseSettings) -> None:  
         self.db_path: str | None = os.path.join(DATA_PATH, DATABASE_FILENAME)
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.busy_timeout = settings.connect_timeout
+        # Each worker process owns its engine, so the pool only has to cover the
+        # threads of a single worker.
         self.engine: Engine = sqlalchemy.create_engine(
-            f"sqlite:///{self.db_path}", echo=False, future=True
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            future=True,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            connect_args={"timeout": self.busy_timeout, "check_same_thread": False},
         )
+        event.listen(self.engine, "connect", self.configure_connection)
         self.Session = sessionmaker(bind=self.engine, future=True)
         self.insert_batch_size = settings.insert_batch_size
-        Base.metadata.create_all(self.engine, checkfirst=True)  
+        # Writers from every worker coordinate through a lock file next to the
+        # database, so DELETE/INSERT sequences never interleave across processes.
+        self.writer_lock = FileWriteLock(
+            f"{self.db_path}.lock", settings.write_lock_timeout
+        )
+        with self.write_lock():
+            Base.metadata.create_all(self.engine, checkfirst=True)  
+
+    # -------------------------------------------------------------------------
+    def configure_connection(self, dbapi_connection: Any, _: Any) -> None:
+        # WAL journaling lets readers keep working on the last committed snapshot
+        # while a writer holds the lock, instead of failing with "database is locked".
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        finally:
+            cursor.close()
+
+    # -------------------------------------------------------------------------
+    def write_lock(self) -> AbstractContextManager[None]:
+        return self.writer_lock.hold()
 
     # -------------------------------------------------------------------------
     def get_table_class(self, table_name: str) -> Any:
@@ -78,7 +111,7 @@ class SQLiteRepository:
 
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None:
-        with self.engine.begin() as conn:
+        with self.write_lock(), self.engine.begin() as conn:
             inspector = inspect(conn)
             table_cls = None
             try:
@@ -102,7 +135,8 @@ class SQLiteRepository:
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         table_cls = self.get_table_class(table_name)
-        self.upsert_dataframe(df, table_cls)
+        with self.write_lock():
+            self.upsert_dataframe(df, table_cls)
 
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
 from ADSORFIT.server.schemas.datasets import DatasetLoadResponse
@@ -11,7 +13,12 @@ from ADSORFIT.server.utils.logger import logger
 from ADSORFIT.server.utils.services.datasets import DatasetService
 
 router = APIRouter(prefix=DATASETS_ROUTER_PREFIX, tags=["load"])
-dataset_service = DatasetService()
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_dataset_service() -> DatasetService:
+    return DatasetService()
 
 
 ###############################################################################
@@ -32,7 +39,7 @@ async def load_dataset(file: UploadFile = File(...)) -> DatasetLoadResponse:
         ) from exc
 
     try:
-        dataset_payload, summary = dataset_service.load_from_bytes(
+        dataset_payload, summary = get_dataset_service().load_from_bytes(
             payload, file.filename
         )
     except ValueError as exc:
@@ -1,20 +1,278 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
-from ADSORFIT.server.schemas.fitting import FittingRequest, FittingResponse
+from ADSORFIT.server.schemas.fitting import (
+    CurvePredictionRequest,
+    CurvePredictionResponse,
+    FittingCancelResponse,
+    FittingRequest,
+    FittingResponse,
+    IASTRequest,
+    IASTResponse,
+    IsostericHeatRequest,
+    IsostericHeatResponse,
+)
 from ADSORFIT.server.utils.constants import (
+    FITTING_CANCEL_ENDPOINT,
+    FITTING_IAST_ENDPOINT,
+    FITTING_ISOSTERIC_ENDPOINT,
+    FITTING_PREDICT_ENDPOINT,
     FITTING_ROUTER_PREFIX,
     FITTING_RUN_ENDPOINT,
+    FITTING_STREAM_ENDPOINT,
+)
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.deduplication import (
+    RESULT_SOURCE_COMPUTED,
+    FittingDeduplicator,
+)
+from ADSORFIT.server.utils.jobs import (
+    STOP_REASON_CANCELLED,
+    CancellationToken,
+    FittingInterrupted,
+    JobRegistry,
+    resolve_time_budget,
 )
 from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.repository.checkpoints import FitCheckpoint
+from ADSORFIT.server.utils.scheduler import (
+    FittingScheduler,
+    JobTicket,
+    SchedulerSaturated,
+    estimate_job_cost,
+)
 from ADSORFIT.server.utils.services.fitting import FittingPipeline
+from ADSORFIT.server.utils.services.iast import IASTService
+from ADSORFIT.server.utils.services.isosteric import IsostericHeatService
+from ADSORFIT.server.utils.services.predictions import CurvePredictionService
+from ADSORFIT.server.utils.streaming import SSE_HEADERS, EventChannel, format_event
 
 router = APIRouter(prefix=FITTING_ROUTER_PREFIX, tags=["fitting"])
-pipeline = FittingPipeline()
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_pipeline() -> FittingPipeline:
+    return FittingPipeline()
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_prediction_service() -> CurvePredictionService:
+    return CurvePredictionService()
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_iast_service() -> IASTService:
+    return IASTService(get_prediction_service())
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_isosteric_service() -> IsostericHeatService:
+    return IsostericHeatService(get_prediction_service())
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_job_registry() -> JobRegistry:
+    return JobRegistry()
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_scheduler() -> FittingScheduler:
+    return FittingScheduler(server_settings.scheduling)
+
+
+# -------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_deduplicator() -> FittingDeduplicator:
+    return FittingDeduplicator(
+        server_settings.fitting.dedup_cache_size,
+        server_settings.fitting.dedup_cache_ttl,
+    )
+
+
+# -------------------------------------------------------------------------
+def resolve_client_key(request: Request) -> str:
+    # Clients behind a shared proxy can identify themselves for fair queueing.
+    client_id = request.headers.get("X-Client-ID")
+    if client_id:
+        return client_id
+    return request.client.host if request.client is not None else "anonymous"
+
+
+# -------------------------------------------------------------------------
+def admit_job(
+    payload: FittingRequest, request: Request
+) -> tuple[CancellationToken, JobTicket]:
+    fitting_settings = server_settings.fitting
+    try:
+        token = get_job_registry().register(
+            payload.job_id,
+            resolve_time_budget(payload.time_budget, fitting_settings.job_time_budget),
+            resolve_time_budget(
+                payload.fit_time_budget, fitting_settings.fit_time_budget
+            ),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+
+    cost = estimate_job_cost(
+        len(payload.dataset.records),
+        len(payload.parameter_bounds),
+        payload.max_iterations,
+    )
+    try:
+        ticket = get_scheduler().submit(resolve_client_key(request), cost)
+    except SchedulerSaturated as exc:
+        get_job_registry().release(token.job_id)
+        logger.warning("Rejected fitting job %s: %s", token.job_id, exc)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+
+    logger.info(
+        "Fitting job %s queued in %s lane (estimated cost %.3g)",
+        token.job_id,
+        ticket.lane,
+        cost,
+    )
+    return token, ticket
+
+
+# -------------------------------------------------------------------------
+def release_job(token: CancellationToken, ticket: JobTicket) -> None:
+    get_scheduler().release(ticket)
+    get_job_registry().release(token.job_id)
+
+
+# -------------------------------------------------------------------------
+def dump_configuration(payload: FittingRequest) -> dict[str, dict[str, Any]]:
+    return {
+        name: config.model_dump() for name, config in payload.parameter_bounds.items()
+    }
+
+
+# -------------------------------------------------------------------------
+def dump_global_fit(payload: FittingRequest) -> dict[str, Any] | None:
+    if payload.global_fit is None:
+        return None
+    return payload.global_fit.model_dump()
+
+
+# -------------------------------------------------------------------------
+async def fingerprint_request(payload: FittingRequest) -> str:
+    # Hashing a large upload is CPU work, so it stays off the event loop.
+    return await asyncio.to_thread(
+        get_pipeline().fingerprint,
+        payload.dataset.model_dump(),
+        dump_configuration(payload),
+        payload.max_iterations,
+        payload.optimization_method,
+        payload.two_tier,
+        dump_global_fit(payload),
+        payload.bootstrap,
+    )
+
+
+# -------------------------------------------------------------------------
+def open_checkpoint(fingerprint: str, resume: bool) -> FitCheckpoint | None:
+    settings = server_settings.fitting
+    if not settings.checkpoint_enabled:
+        return None
+    FitCheckpoint.prune(max_age_hours=settings.checkpoint_retention_hours)
+    checkpoint = FitCheckpoint(
+        fingerprint, sync_interval=settings.checkpoint_sync_interval
+    )
+    if not resume:
+        checkpoint.discard()
+    return checkpoint
+
+
+# -------------------------------------------------------------------------
+def run_pipeline(
+    payload: FittingRequest,
+    token: CancellationToken,
+    fingerprint: str,
+    **callbacks: Any,
+) -> dict[str, Any]:
+    # Jobs cancelled while waiting for admission never touch the database.
+    if token.cancelled:
+        raise FittingInterrupted(STOP_REASON_CANCELLED)
+    return get_pipeline().run(
+        payload.dataset.model_dump(),
+        dump_configuration(payload),
+        payload.max_iterations,
+        payload.optimization_method,
+        token=token,
+        checkpoint=open_checkpoint(fingerprint, payload.resume),
+        two_tier=payload.two_tier,
+        global_fit=dump_global_fit(payload),
+        bootstrap=payload.bootstrap,
+        **callbacks,
+    )
+
+
+# -------------------------------------------------------------------------
+def to_http_error(exc: Exception) -> HTTPException:
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, FittingInterrupted):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Fitting job was cancelled before it started.",
+        )
+    if isinstance(exc, ValueError):
+        logger.warning("Invalid fitting request: %s", exc)
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    logger.exception("ADSORFIT fitting job failed")
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="Failed to complete the fitting job.",
+    )
+
+
+# -------------------------------------------------------------------------
+async def execute_fitting_job(
+    payload: FittingRequest, request: Request, fingerprint: str
+) -> dict[str, Any]:
+    token, ticket = admit_job(payload, request)
+    try:
+        await ticket.wait()
+        # Time spent waiting in the queue does not count against the job budget.
+        token.start()
+        response = await asyncio.to_thread(
+            run_pipeline, payload, token, fingerprint
+        )
+    except Exception as exc:  # noqa: BLE001
+        raise to_http_error(exc) from exc
+    finally:
+        release_job(token, ticket)
+
+    # Stored fits were replaced, so cached curves of this worker are stale.
+    get_prediction_service().invalidate()
+    logger.info(
+        "Fitting job %s completed with %s of %s experiments",
+        token.job_id,
+        response.get("processed_rows"),
+        response.get("total_experiments"),
+    )
+    return response
 
 
 ###############################################################################
@@ -24,38 +282,288 @@ pipeline = FittingPipeline()
     response_model=FittingResponse,
     status_code=status.HTTP_200_OK,
 )
-async def run_fitting_job(payload: FittingRequest) -> Any:
+async def run_fitting_job(payload: FittingRequest, request: Request) -> Any:
     logger.info(
         "Received fitting request: iterations=%s, method=%s",
         payload.max_iterations,
         payload.optimization_method,
     )
+    fingerprint = await fingerprint_request(payload)
+    response = await get_deduplicator().run(
+        fingerprint, lambda: execute_fitting_job(payload, request, fingerprint)
+    )
+    if response["result_source"] != RESULT_SOURCE_COMPUTED:
+        logger.info(
+            "Fitting request answered with a %s result", response["result_source"]
+        )
+    return response
+
+
+###############################################################################
+# -------------------------------------------------------------------------
+@router.post(
+    FITTING_CANCEL_ENDPOINT,
+    response_model=FittingCancelResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def cancel_fitting_job(job_id: str) -> Any:
+    # Jobs are tracked per worker process; with several workers the request must
+    # reach the worker running the job, otherwise the job is reported as unknown.
+    if not get_job_registry().cancel(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No running fitting job with id {job_id}.",
+        )
+    logger.info("Cancellation requested for fitting job %s", job_id)
+    return {"status": "cancelling", "job_id": job_id}
+
+
+###############################################################################
+# -------------------------------------------------------------------------
+@router.post(
+    FITTING_STREAM_ENDPOINT,
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def stream_fitting_job(
+    payload: FittingRequest, request: Request
+) -> StreamingResponse:
+    """Run a fitting job and stream its results as Server-Sent Events.
+
+    Events: ``started`` with the job id accepted by the cancel endpoint,
+    ``queued`` when the job has to wait for a free slot, ``experiment`` once per
+    fitted experiment with per-model metrics and parameters, ``progress`` at most
+    every ``stream_progress_interval`` seconds, then a final ``complete`` (same
+    content as ``/run``) or ``error`` event. Closing the connection cancels the
+    job. A request identical to a running or recently completed job receives only
+    the final event of that job (preceded by ``attached`` while it is running).
+    A job that cannot be admitted (duplicate job id, full queue) streams a single
+    ``error`` event with the ``status_code`` and ``retry_after`` of ``/run``.
+    """
+    logger.info(
+        "Received streaming fitting request: iterations=%s, method=%s",
+        payload.max_iterations,
+        payload.optimization_method,
+    )
+    fingerprint = await fingerprint_request(payload)
+    return StreamingResponse(
+        stream_fitting_events(payload, request, fingerprint),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+# -------------------------------------------------------------------------
+async def stream_fitting_events(
+    payload: FittingRequest, request: Request, fingerprint: str
+) -> AsyncIterator[str]:
+    # The job is admitted once the body is iterated, so a client that disconnects
+    # before the stream starts never holds a scheduler slot, a job id or an
+    # in-flight entry that only this generator would release.
+    deduplicator = get_deduplicator()
+    cached = deduplicator.lookup(fingerprint)
+    pending = deduplicator.attach(fingerprint)
+    if cached is not None or pending is not None:
+        async for message in stream_reused_result(cached, pending):
+            yield message
+        return
 
     try:
-        response = await asyncio.to_thread(
-            pipeline.run,
-            payload.dataset.model_dump(),
+        token, ticket = admit_job(payload, request)
+    except HTTPException as exc:
+        retry_after = (exc.headers or {}).get("Retry-After")
+        yield format_event(
+            "error",
+            {
+                "detail": exc.detail,
+                "status_code": exc.status_code,
+                "retry_after": int(retry_after) if retry_after else None,
+            },
+        )
+        return
+    deduplicator.begin(fingerprint)
+    channel = EventChannel(asyncio.get_running_loop())
+    progress_interval = server_settings.fitting.stream_progress_interval
+    last_progress = 0.0
+    outcome: dict[str, Any] = {}
+
+    def publish_progress(completed: int, total: int) -> None:
+        nonlocal last_progress
+        now = time.monotonic()
+        if completed < total and now - last_progress < progress_interval:
+            return
+        last_progress = now
+        channel.publish("progress", {"completed": completed, "total": total})
+
+    def publish_result(
+        index: int, experiment: str, results: dict[str, dict[str, Any]]
+    ) -> None:
+        channel.publish(
+            "experiment",
             {
-                name: config.model_dump()
-                for name, config in payload.parameter_bounds.items()
+                "index": index,
+                "experiment": experiment,
+                "models": FittingPipeline.summarize_experiment_results(results),
             },
-            payload.max_iterations,
-            payload.optimization_method,
+        )
+
+    def run_job() -> None:
+        try:
+            response = run_pipeline(
+                payload,
+                token,
+                fingerprint,
+                progress_callback=publish_progress,
+                result_callback=publish_result,
+            )
+            outcome["response"] = response
+            get_prediction_service().invalidate()
+            channel.publish(
+                "complete", {**response, "result_source": RESULT_SOURCE_COMPUTED}
+            )
+        except Exception as exc:  # noqa: BLE001
+            error = to_http_error(exc)
+            outcome["error"] = error
+            channel.publish("error", {"detail": error.detail})
+        finally:
+            channel.close()
+
+    def settle(_: Any = None) -> None:
+        release_job(token, ticket)
+        if "response" in outcome:
+            deduplicator.complete(fingerprint, outcome["response"])
+        else:
+            deduplicator.fail(
+                fingerprint,
+                outcome.get("error")
+                or to_http_error(FittingInterrupted(STOP_REASON_CANCELLED)),
+            )
+
+    job: asyncio.Task[None] | None = None
+    try:
+        yield format_event("started", {"job_id": token.job_id})
+        if not ticket.admitted.done():
+            yield format_event("queued", {"waiting_jobs": get_scheduler().queued})
+        await ticket.wait()
+        token.start()
+        job = asyncio.create_task(asyncio.to_thread(run_job))
+        async for message in channel.stream():
+            yield message
+        await job
+    finally:
+        if job is None or job.done():
+            settle()
+        else:
+            # A client that disconnects no longer wants the results; the slot is
+            # freed once the worker thread has actually stopped.
+            token.cancel()
+            job.add_done_callback(settle)
+
+
+# -------------------------------------------------------------------------
+async def stream_reused_result(
+    cached: dict[str, Any] | None,
+    pending: asyncio.Future[dict[str, Any]] | None,
+) -> AsyncIterator[str]:
+    response = cached
+    if pending is not None:
+        # Per-experiment events belong to the client that started the job; an
+        # attached client only receives the final outcome.
+        yield format_event("attached", {})
+        try:
+            response = await get_deduplicator().follow(pending)
+        except Exception as exc:  # noqa: BLE001
+            yield format_event("error", {"detail": to_http_error(exc).detail})
+            return
+    yield format_event("complete", response)
+
+
+###############################################################################
+# -------------------------------------------------------------------------
+@router.post(
+    FITTING_PREDICT_ENDPOINT,
+    response_model=CurvePredictionResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def predict_curves(payload: CurvePredictionRequest) -> Any:
+    try:
+        experiments = await asyncio.to_thread(
+            get_prediction_service().predict,
+            payload.experiment_ids,
+            payload.models,
+            payload.pressure,
+            payload.points,
+            payload.max_points,
+            payload.include_measured,
         )
     except ValueError as exc:
-        logger.warning("Invalid fitting request: %s", exc)
+        logger.warning("Invalid curve prediction request: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
     except Exception as exc:  # noqa: BLE001
-        logger.exception("ADSORFIT fitting job failed")
+        logger.exception("Curve prediction failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to complete the fitting job.",
+            detail="Failed to predict fitted curves.",
         ) from exc
 
-    logger.info(
-        "Fitting job completed successfully with %s experiments",
-        response.get("processed_rows"),
-    )
-    return response
+    return {"status": "success", "experiments": experiments}
+
+
+# -------------------------------------------------------------------------
+@router.post(
+    FITTING_IAST_ENDPOINT,
+    response_model=IASTResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def predict_mixture(payload: IASTRequest) -> Any:
+    try:
+        prediction = await asyncio.to_thread(
+            get_iast_service().predict,
+            [component.model_dump() for component in payload.components],
+            payload.compositions,
+            payload.pressure,
+        )
+    except ValueError as exc:
+        logger.warning("Invalid IAST request: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("IAST prediction failed")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to predict mixture adsorption.",
+        ) from exc
+
+    return {"status": "success", **prediction}
+
+
+# -------------------------------------------------------------------------
+@router.post(
+    FITTING_ISOSTERIC_ENDPOINT,
+    response_model=IsostericHeatResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def compute_isosteric_heat(payload: IsostericHeatRequest) -> Any:
+    try:
+        materials = await asyncio.to_thread(
+            get_isosteric_service().compute,
+            [material.model_dump() for material in payload.materials],
+            payload.loadings,
+            payload.points,
+        )
+    except ValueError as exc:
+        logger.warning("Invalid isosteric heat request: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Isosteric heat computation failed")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compute isosteric heats.",
+        ) from exc
+
+    return {"status": "success", "materials": materials}
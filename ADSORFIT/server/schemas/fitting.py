@@ -16,6 +16,15 @@ class ModelParameterConfig(BaseModel):
     min: dict[str, float] = Field(default_factory=dict)
     max: dict[str, float] = Field(default_factory=dict)
     initial: dict[str, float] = Field(default_factory=dict)
+    starts: int | None = Field(default=None, ge=0)
+
+
+###############################################################################
+class GlobalFitOptions(BaseModel):
+    group_by: str | None = None
+    models: list[str] | None = None
+    shared_parameters: dict[str, list[str]] | None = None
+    temperature_dependent: dict[str, list[str]] | None = None
 
 
 ###############################################################################
@@ -27,9 +36,19 @@ class FittingRequest(BaseModel):
         "L-BFGS-B",
         "Nelder-Mead",
         "Powell",
+        "AUTO",
     ] = Field(default="LSS")
     parameter_bounds: dict[str, ModelParameterConfig]
     dataset: DatasetPayload
+    job_id: str | None = Field(
+        default=None, min_length=1, max_length=64, pattern=r"^[A-Za-z0-9_-]+$"
+    )
+    time_budget: float | None = Field(default=None, gt=0)
+    fit_time_budget: float | None = Field(default=None, gt=0)
+    resume: bool = Field(default=True)
+    two_tier: bool | None = Field(default=None)
+    global_fit: GlobalFitOptions | None = Field(default=None)
+    bootstrap: bool | None = Field(default=None)
 
 
 ###############################################################################
@@ -40,3 +59,129 @@ class FittingResponse(BaseModel):
     models: list[str]
     best_model_saved: bool
     best_model_preview: list[dict[str, Any]] | None = None
+    job_id: str | None = None
+    total_experiments: int | None = None
+    partial: bool = False
+    stop_reason: str | None = None
+    result_source: str = Field(default="computed")
+    peak_memory_mb: float | None = None
+    skipped_fits: dict[str, int] = Field(default_factory=dict)
+    refinement: dict[str, Any] | None = None
+    methods_used: dict[str, dict[str, int]] | None = None
+    global_fits: list[dict[str, Any]] | None = None
+
+
+###############################################################################
+class FittingCancelResponse(BaseModel):
+    status: str = Field(default="cancelling")
+    job_id: str
+
+
+###############################################################################
+class CurvePredictionRequest(BaseModel):
+    experiment_ids: list[int] = Field(..., min_length=1)
+    models: list[str] | None = None
+    pressure: list[float] | None = None
+    points: int | None = Field(default=None, ge=2)
+    max_points: int | None = Field(default=None, ge=2)
+    include_measured: bool = False
+
+
+###############################################################################
+class PredictedCurve(BaseModel):
+    model: str
+    uptake: list[float | None]
+
+
+class MeasuredIsotherm(BaseModel):
+    pressure: list[float | None]
+    uptake: list[float | None]
+
+
+class ExperimentCurves(BaseModel):
+    experiment_id: int
+    experiment: str
+    pressure: list[float]
+    curves: list[PredictedCurve]
+    measured: MeasuredIsotherm | None = None
+
+
+class CurvePredictionResponse(BaseModel):
+    status: str = Field(default="success")
+    experiments: list[ExperimentCurves]
+
+
+###############################################################################
+class IASTComponent(BaseModel):
+    experiment_id: int
+    model: str | None = None
+
+
+class IASTRequest(BaseModel):
+    components: list[IASTComponent] = Field(..., min_length=2)
+    compositions: list[list[float]] = Field(..., min_length=1)
+    pressure: list[float] = Field(..., min_length=1)
+
+
+###############################################################################
+class IASTComponentResult(BaseModel):
+    experiment_id: int
+    experiment: str
+    model: str
+    temperature: float
+    extrapolated_points: int
+
+
+class IASTMixture(BaseModel):
+    gas_fractions: list[float]
+    adsorbed_fractions: list[list[float | None]]
+    loadings: list[list[float | None]]
+    total_loading: list[float | None]
+    spreading_pressure: list[float | None]
+
+
+class IASTResponse(BaseModel):
+    status: str = Field(default="success")
+    components: list[IASTComponentResult]
+    pressure: list[float]
+    mixtures: list[IASTMixture]
+    points: int
+    converged_points: int
+    max_iterations_used: int
+
+
+###############################################################################
+class IsostericMaterial(BaseModel):
+    name: str
+    experiment_ids: list[int] = Field(..., min_length=2)
+    model: str | None = None
+
+
+class IsostericHeatRequest(BaseModel):
+    materials: list[IsostericMaterial] = Field(..., min_length=1)
+    loadings: list[float] | None = None
+    points: int | None = Field(default=None, ge=2)
+
+
+###############################################################################
+class IsostericExperiment(BaseModel):
+    experiment_id: int
+    experiment: str
+    model: str
+    temperature: float
+
+
+class IsostericHeatCurve(BaseModel):
+    name: str
+    experiments: list[IsostericExperiment]
+    loading: list[float]
+    isosteric_heat: list[float | None]
+    isosteric_heat_error: list[float | None]
+    r_squared: list[float | None]
+    temperatures_used: list[int]
+    extrapolated_points: int
+
+
+class IsostericHeatResponse(BaseModel):
+    status: str = Field(default="success")
+    materials: list[IsostericHeatCurve]
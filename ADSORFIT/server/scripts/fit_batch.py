@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from ADSORFIT.server.utils.constants import BATCH_PATH
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.services.batch import (
+    BATCH_OUTPUT_FORMATS,
+    BatchFittingRunner,
+    load_batch_configuration,
+    resolve_input_files,
+)
+
+
+# -------------------------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fit adsorption isotherm datasets (CSV/XLS/XLSX) without the web server. "
+            "Interrupted batches resume where they stopped."
+        )
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Dataset files, directories or glob patterns (quote patterns).",
+    )
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="JSON file with max_iterations, optimization_method and models.",
+    )
+    parser.add_argument(
+        "--output",
+        default=BATCH_PATH,
+        help="Directory receiving per-file results and the batch manifest.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=BATCH_OUTPUT_FORMATS,
+        default="csv",
+        help="Format of the per-file result files.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help="Number of worker processes fitting files in parallel.",
+    )
+    parser.add_argument(
+        "--database",
+        action="store_true",
+        help="Also store the results of all input files in the configured database.",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the manifest and refit every file.",
+    )
+    return parser
+
+
+# -------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    files = resolve_input_files(arguments.inputs)
+    if not files:
+        logger.error("No supported dataset files matched %s", arguments.inputs)
+        return 2
+
+    start = time.perf_counter()
+    try:
+        configuration = load_batch_configuration(arguments.config)
+        runner = BatchFittingRunner(arguments.output, arguments.format, arguments.workers)
+    except (OSError, ValueError) as exc:
+        logger.error("Invalid batch setup: %s", exc)
+        return 2
+
+    logger.info(
+        "Fitting %s files with %s worker(s): method=%s, iterations=%s",
+        len(files),
+        runner.workers,
+        configuration.optimization_method,
+        configuration.max_iterations,
+    )
+    summary = runner.run(files, configuration, resume=not arguments.restart)
+    if arguments.database:
+        stored = runner.save_to_database(files)
+        logger.info("Stored %s experiments in the database", stored)
+
+    logger.info(
+        "Batch completed in %.2f seconds: %s fitted, %s skipped, %s failed (manifest: %s)",
+        time.perf_counter() - start,
+        summary["fitted"],
+        summary["skipped"],
+        len(summary["failed"]),
+        summary["manifest"],
+    )
+    return 1 if summary["failed"] else 0
+
+
+###############################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import uvicorn
+
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.logger import logger
+
+UVICORN_MODULE = "ADSORFIT.server.app:app"
+
+
+###############################################################################
+if __name__ == "__main__":
+    serving = server_settings.serving
+    logger.info(
+        "Starting ADSORFIT backend on %s:%s with %s worker(s)",
+        serving.host,
+        serving.port,
+        serving.workers,
+    )
+    # Every worker builds its own database engine and services during the
+    # application lifespan; database writes are coordinated across workers by
+    # the backend write lock.
+    uvicorn.run(
+        UVICORN_MODULE,
+        host=serving.host,
+        port=serving.port,
+        workers=serving.workers,
+        log_level="info",
+    )
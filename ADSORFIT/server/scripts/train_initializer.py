@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.constants import INITIALIZER_FILE, MODELS_LIST
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.repository.serializer import DataSerializer
+from ADSORFIT.server.utils.services.batch import BatchFittingRunner
+from ADSORFIT.server.utils.services.fitting import ModelSolver
+from ADSORFIT.server.utils.services.initializers import InitialParameterPredictor
+
+
+# -------------------------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Train the predictor of initial model parameters on stored fitting "
+            "results. Samples from earlier trainings are kept and extended."
+        )
+    )
+    parser.add_argument(
+        "--batch-output",
+        nargs="*",
+        default=[],
+        help="Output directories of fit_batch runs to learn from as well.",
+    )
+    parser.add_argument(
+        "--no-database",
+        action="store_true",
+        help="Do not read the fitting results stored in the database.",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Discard the samples of the previously trained predictor.",
+    )
+    parser.add_argument(
+        "--neighbors",
+        type=int,
+        default=server_settings.fitting.initializer_neighbors,
+        help="Number of past fits averaged for each prediction.",
+    )
+    parser.add_argument(
+        "--output",
+        default=INITIALIZER_FILE,
+        help="File receiving the trained predictor.",
+    )
+    return parser
+
+
+# -------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    frames = [
+        frame
+        for directory in arguments.batch_output
+        for frame in BatchFittingRunner(directory).load_completed_results()
+    ]
+    if not arguments.no_database:
+        stored = DataSerializer().load_fitting_results()
+        if not stored.empty:
+            frames.append(stored)
+    if not frames:
+        logger.error("No fitting results available for training")
+        return 2
+
+    predictor = None if arguments.reset else InitialParameterPredictor.load(
+        arguments.output
+    )
+    predictor = predictor or InitialParameterPredictor()
+    solver = ModelSolver()
+    fitting_settings = server_settings.fitting
+    trained = predictor.train(
+        frames,
+        {model: solver.model_parameters(model) for model in MODELS_LIST},
+        neighbors=max(1, arguments.neighbors),
+        min_samples=fitting_settings.initializer_min_samples,
+        max_samples=fitting_settings.initializer_max_samples,
+    )
+    if not trained:
+        logger.error("No model had enough successful fits to train a predictor")
+        return 1
+
+    predictor.save(arguments.output)
+    for model_name, samples in trained.items():
+        logger.info("Trained %s initializer on %s fits", model_name, samples)
+    logger.info("Saved initial parameter predictor to %s", arguments.output)
+    return 0
+
+
+###############################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+import pandas as pd
+
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.constants import MODELS_LIST, SCREENER_FILE
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.repository.serializer import DataSerializer
+from ADSORFIT.server.utils.services.batch import BatchFittingRunner
+from ADSORFIT.server.utils.services.fitting import ModelSolver
+from ADSORFIT.server.utils.services.processing import DatasetAdapter
+from ADSORFIT.server.utils.services.screening import ModelScreener
+
+
+# -------------------------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Train the model pre-screening classifier on stored best model "
+            "selections. Samples from earlier trainings are kept and extended."
+        )
+    )
+    parser.add_argument(
+        "--batch-output",
+        nargs="*",
+        default=[],
+        help="Output directories of fit_batch runs to learn from as well.",
+    )
+    parser.add_argument(
+        "--no-database",
+        action="store_true",
+        help="Do not read the best model selections stored in the database.",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Discard the samples of the previously trained classifier.",
+    )
+    parser.add_argument(
+        "--neighbors",
+        type=int,
+        default=server_settings.fitting.screening.neighbors,
+        help="Number of past experiments voting for each prediction.",
+    )
+    parser.add_argument(
+        "--output",
+        default=SCREENER_FILE,
+        help="File receiving the trained classifier.",
+    )
+    return parser
+
+
+# -------------------------------------------------------------------------
+def load_database_selections() -> pd.DataFrame:
+    serializer = DataSerializer()
+    results = serializer.load_fitting_results()
+    best_fit = serializer.load_best_fit_table()
+    if results.empty or best_fit.empty:
+        return pd.DataFrame()
+    return results.merge(
+        best_fit[["experiment_id", "best model"]], how="inner", on="experiment_id"
+    )
+
+
+# -------------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    frames = [
+        frame
+        for directory in arguments.batch_output
+        for frame in BatchFittingRunner(directory).load_completed_results()
+    ]
+    if not arguments.no_database:
+        stored = load_database_selections()
+        if not stored.empty:
+            frames.append(stored)
+    if not frames:
+        logger.error("No best model selections available for training")
+        return 2
+
+    screener = None if arguments.reset else ModelScreener.load(arguments.output)
+    screener = screener or ModelScreener()
+    solver = ModelSolver()
+    screening_settings = server_settings.fitting.screening
+    samples = screener.train(
+        frames,
+        {model: solver.model_parameters(model) for model in MODELS_LIST},
+        DatasetAdapter.normalize_metric(server_settings.fitting.best_model_metric),
+        neighbors=max(1, arguments.neighbors),
+        min_samples=screening_settings.min_samples,
+        max_samples=screening_settings.max_samples,
+    )
+    if not samples:
+        return 1
+
+    screener.save(arguments.output)
+    logger.info(
+        "Trained model screener on %s experiments for %s",
+        samples,
+        ", ".join(screener.models),
+    )
+    logger.info("Saved model screener to %s", arguments.output)
+    return 0
+
+
+###############################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+###############################################################################
+class LRUCache:
+    """Thread-safe least-recently-used cache with optional entry expiry.
+
+    Entries older than ``ttl_seconds`` are treated as missing, which bounds how
+    long a worker can serve data that another worker has since replaced.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    def get(self, key: Hashable) -> Any | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and (
+                time.monotonic() - stored_at > self.ttl_seconds
+            ):
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    # -------------------------------------------------------------------------
+    def put(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.entries)
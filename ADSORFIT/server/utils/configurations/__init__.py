@@ -5,17 +5,35 @@ from ADSORFIT.server.utils.configurations.base import (
     load_configurations,
 )
 from ADSORFIT.server.utils.configurations.server import (
+    AutoMethodSettings,
+    BootstrapSettings,
     DatabaseSettings,
     FastAPISettings,
+    GlobalFitSettings,
+    IASTSettings,
+    IsostericHeatSettings,
+    SchedulingSettings,
+    ScreeningSettings,
     ServerSettings,
+    ServingSettings,
+    TwoTierSettings,
     server_settings,
     get_server_settings,
 )
 
 __all__ = [    
+    "AutoMethodSettings",
+    "BootstrapSettings",
     "DatabaseSettings",
     "FastAPISettings",
+    "GlobalFitSettings",
+    "IASTSettings",
+    "IsostericHeatSettings",
+    "SchedulingSettings",
+    "ScreeningSettings",
     "ServerSettings",
+    "ServingSettings",
+    "TwoTierSettings",
     "server_settings",
     "get_server_settings",   
     "ensure_mapping",
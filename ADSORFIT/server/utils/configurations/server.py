@@ -9,7 +9,11 @@ from ADSORFIT.server.utils.configurations import (
     ensure_mapping,
     load_configurations,
 )
-from ADSORFIT.server.utils.constants import SERVER_CONFIGURATION_FILE
+from ADSORFIT.server.utils.constants import (
+    GLOBAL_FIT_SHARED_DEFAULTS,
+    GLOBAL_FIT_VANT_HOFF_DEFAULTS,
+    SERVER_CONFIGURATION_FILE,
+)
 from ADSORFIT.server.utils.types import (
     coerce_bool,
     coerce_float,
@@ -41,6 +45,26 @@ class DatabaseSettings:
     ssl_ca: str | None
     connect_timeout: int
     insert_batch_size: int
+    pool_size: int
+    max_overflow: int
+    write_lock_timeout: int
+
+###############################################################################
+@dataclass(frozen=True)
+class ServingSettings:
+    host: str
+    port: int
+    workers: int
+
+###############################################################################
+@dataclass(frozen=True)
+class SchedulingSettings:
+    max_concurrent_jobs: int
+    max_queued_jobs: int
+    max_queued_per_client: int
+    low_priority_cost: float
+    max_low_priority_jobs: int
+    retry_after: int
 
 ###############################################################################
 @dataclass(frozen=True)
@@ -48,6 +72,84 @@ class DatasetSettings:
     allowed_extensions: tuple[str, ...]
     column_detection_cutoff: float
 
+###############################################################################
+@dataclass(frozen=True)
+class MultiStartSettings:
+    sampler: str
+    top_k: int
+    default_starts: int
+    model_starts: dict[str, int]
+    seed: int
+
+###############################################################################
+@dataclass(frozen=True)
+class ScreeningSettings:
+    enabled: bool
+    skip_infeasible: bool
+    classifier_enabled: bool
+    min_probability: float
+    keep_top: int
+    neighbors: int
+    min_samples: int
+    max_samples: int
+
+###############################################################################
+@dataclass(frozen=True)
+class TwoTierSettings:
+    enabled: bool
+    screen_iterations: int
+    screen_tolerance: float
+    screen_top_k: int
+    refine_top: int
+
+###############################################################################
+@dataclass(frozen=True)
+class BootstrapSettings:
+    enabled: bool
+    replicates: int
+    resampling: str
+    confidence: float
+    max_iterations: int
+    tolerance: float
+    min_success_fraction: float
+    seed: int
+
+###############################################################################
+@dataclass(frozen=True)
+class AutoMethodSettings:
+    ladder: tuple[str, ...]
+    use_history: bool
+    min_attempts: int
+
+###############################################################################
+@dataclass(frozen=True)
+class GlobalFitSettings:
+    shared_parameters: dict[str, tuple[str, ...]]
+    temperature_dependent: dict[str, tuple[str, ...]]
+    enthalpy_min: float
+    enthalpy_max: float
+    min_experiments: int
+
+###############################################################################
+@dataclass(frozen=True)
+class IASTSettings:
+    max_grid_points: int
+    max_iterations: int
+    tolerance: float
+    quadrature_nodes: int
+    quadrature_lower_ratio: float
+    temperature_tolerance: float
+
+###############################################################################
+@dataclass(frozen=True)
+class IsostericHeatSettings:
+    default_points: int
+    max_points: int
+    loading_lower_fraction: float
+    bracket_decades: float
+    bisection_iterations: int
+    min_temperatures: int
+
 ###############################################################################
 @dataclass(frozen=True)
 class FittingSettings:
@@ -58,11 +160,40 @@ class FittingSettings:
     parameter_max_default: float
     preview_row_limit: int
     best_model_metric: str
+    multistart: MultiStartSettings
+    screening: ScreeningSettings
+    two_tier: TwoTierSettings
+    bootstrap: BootstrapSettings
+    auto_method: AutoMethodSettings
+    global_fit: GlobalFitSettings
+    iast: IASTSettings
+    isosteric_heat: IsostericHeatSettings
+    prediction_default_points: int
+    prediction_max_points: int
+    prediction_cache_size: int
+    prediction_cache_ttl: int
+    stream_progress_interval: float
+    job_time_budget: float
+    fit_time_budget: float
+    dedup_cache_size: int
+    dedup_cache_ttl: float
+    checkpoint_enabled: bool
+    checkpoint_sync_interval: int
+    checkpoint_retention_hours: float
+    memory_sample_interval: float
+    isotherm_store_enabled: bool
+    learned_initialization: bool
+    initializer_neighbors: int
+    initializer_min_samples: int
+    initializer_max_samples: int
+    solver_scaling: bool
 
 ###############################################################################
 @dataclass(frozen=True)
 class ServerSettings:
     fastapi: FastAPISettings
+    serving: ServingSettings
+    scheduling: SchedulingSettings
     database: DatabaseSettings
     datasets: DatasetSettings
     fitting: FittingSettings
@@ -82,12 +213,49 @@ def build_fastapi_settings(payload: dict[str, Any] | Any) -> FastAPISettings:
         version=coerce_str(version_value, "0.1.0"),
     )
 
+# -------------------------------------------------------------------------
+def build_serving_settings(payload: dict[str, Any] | Any) -> ServingSettings:
+    host_value = env_variables.get("FASTAPI_HOST") or payload.get("host")
+    port_value = env_variables.get("FASTAPI_PORT") or payload.get("port")
+    workers_value = env_variables.get("FASTAPI_WORKERS") or payload.get("workers")
+
+    return ServingSettings(
+        host=coerce_str(host_value, "127.0.0.1"),
+        port=coerce_int(port_value, 8000, minimum=1, maximum=65535),
+        workers=coerce_int(workers_value, 1, minimum=1),
+    )
+
+# -------------------------------------------------------------------------
+def build_scheduling_settings(payload: dict[str, Any] | Any) -> SchedulingSettings:
+    max_concurrent = coerce_int(payload.get("max_concurrent_jobs"), 2, minimum=1)
+    return SchedulingSettings(
+        max_concurrent_jobs=max_concurrent,
+        max_queued_jobs=coerce_int(payload.get("max_queued_jobs"), 32, minimum=0),
+        max_queued_per_client=coerce_int(
+            payload.get("max_queued_per_client"), 4, minimum=0
+        ),
+        low_priority_cost=coerce_float(
+            payload.get("low_priority_cost"), 1e9, minimum=0.0
+        ),
+        max_low_priority_jobs=coerce_int(
+            payload.get("max_low_priority_jobs"), 1, minimum=1, maximum=max_concurrent
+        ),
+        retry_after=coerce_int(payload.get("retry_after"), 15, minimum=1),
+    )
+
 # -------------------------------------------------------------------------
 def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
     embedded_value = payload.get("embedded_database")
     embedded = coerce_bool(embedded_value, True)
 
     insert_batch_value = env_variables.get("DB_INSERT_BATCH_SIZE") or payload.get("insert_batch_size")
+    pool_size = coerce_int(
+        env_variables.get("DB_POOL_SIZE") or payload.get("pool_size"), 5, minimum=1
+    )
+    max_overflow = coerce_int(
+        env_variables.get("DB_MAX_OVERFLOW") or payload.get("max_overflow"), 10, minimum=0
+    )
+    write_lock_timeout = coerce_int(payload.get("write_lock_timeout"), 120, minimum=1)
 
     if embedded:
         return DatabaseSettings(
@@ -106,6 +274,9 @@ def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
                 minimum=1,
             ),
             insert_batch_size=coerce_int(insert_batch_value, 1000, minimum=1),
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            write_lock_timeout=write_lock_timeout,
         )
 
     engine_value = (
@@ -136,6 +307,9 @@ def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
         ssl_ca=coerce_str_or_none(ssl_ca_value),
         connect_timeout=coerce_int(timeout_value, 10, minimum=1),
         insert_batch_size=coerce_int(insert_batch_value, 1000, minimum=1),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        write_lock_timeout=write_lock_timeout,
     )
 
 # -------------------------------------------------------------------------
@@ -149,6 +323,150 @@ def build_dataset_settings(payload: dict[str, Any] | Any) -> DatasetSettings:
         ),
     )
 
+# -------------------------------------------------------------------------
+def build_multistart_settings(payload: dict[str, Any] | Any) -> MultiStartSettings:
+    sampler = coerce_str(payload.get("sampler"), "sobol").lower()
+    if sampler not in {"sobol", "lhs"}:
+        sampler = "sobol"
+    model_starts = {
+        str(model_name): coerce_int(starts, 0, minimum=0)
+        for model_name, starts in ensure_mapping(payload.get("model_starts")).items()
+    }
+    return MultiStartSettings(
+        sampler=sampler,
+        top_k=coerce_int(payload.get("top_k"), 3, minimum=1),
+        default_starts=coerce_int(payload.get("default_starts"), 0, minimum=0),
+        model_starts=model_starts,
+        seed=coerce_int(payload.get("seed"), 0, minimum=0),
+    )
+
+# -------------------------------------------------------------------------
+def build_screening_settings(payload: dict[str, Any] | Any) -> ScreeningSettings:
+    return ScreeningSettings(
+        enabled=coerce_bool(payload.get("enabled"), False),
+        skip_infeasible=coerce_bool(payload.get("skip_infeasible"), True),
+        classifier_enabled=coerce_bool(payload.get("classifier_enabled"), True),
+        min_probability=coerce_float(
+            payload.get("min_probability"), 0.02, minimum=0.0, maximum=1.0
+        ),
+        keep_top=coerce_int(payload.get("keep_top"), 2, minimum=1),
+        neighbors=coerce_int(payload.get("neighbors"), 25, minimum=1),
+        min_samples=coerce_int(payload.get("min_samples"), 50, minimum=1),
+        max_samples=coerce_int(payload.get("max_samples"), 20000, minimum=1),
+    )
+
+# -------------------------------------------------------------------------
+def build_two_tier_settings(payload: dict[str, Any] | Any) -> TwoTierSettings:
+    return TwoTierSettings(
+        enabled=coerce_bool(payload.get("enabled"), False),
+        screen_iterations=coerce_int(payload.get("screen_iterations"), 200, minimum=1),
+        screen_tolerance=coerce_float(
+            payload.get("screen_tolerance"), 1e-6, minimum=1e-15, maximum=1.0
+        ),
+        screen_top_k=coerce_int(payload.get("screen_top_k"), 1, minimum=1),
+        refine_top=coerce_int(payload.get("refine_top"), 3, minimum=1),
+    )
+
+# -------------------------------------------------------------------------
+def build_bootstrap_settings(payload: dict[str, Any] | Any) -> BootstrapSettings:
+    resampling = coerce_str(payload.get("resampling"), "residual").lower()
+    return BootstrapSettings(
+        enabled=coerce_bool(payload.get("enabled"), False),
+        replicates=coerce_int(payload.get("replicates"), 200, minimum=10),
+        resampling=resampling if resampling in ("residual", "pairs") else "residual",
+        confidence=coerce_float(
+            payload.get("confidence"), 0.95, minimum=0.5, maximum=0.999
+        ),
+        max_iterations=coerce_int(payload.get("max_iterations"), 100, minimum=1),
+        tolerance=coerce_float(
+            payload.get("tolerance"), 1e-6, minimum=1e-15, maximum=1e-2
+        ),
+        min_success_fraction=coerce_float(
+            payload.get("min_success_fraction"), 0.5, minimum=0.0, maximum=1.0
+        ),
+        seed=coerce_int(payload.get("seed"), 42, minimum=0),
+    )
+
+# -------------------------------------------------------------------------
+def build_auto_method_settings(payload: dict[str, Any] | Any) -> AutoMethodSettings:
+    ladder = tuple(
+        method
+        for method in coerce_str_sequence(
+            payload.get("ladder"), ["LSS", "L-BFGS-B", "Powell"]
+        )
+        if method.upper() != "AUTO"
+    )
+    return AutoMethodSettings(
+        ladder=ladder or ("LSS", "L-BFGS-B", "Powell"),
+        use_history=coerce_bool(payload.get("use_history"), True),
+        min_attempts=coerce_int(payload.get("min_attempts"), 20, minimum=1),
+    )
+
+# -------------------------------------------------------------------------
+def build_parameter_mapping(
+    payload: Any, default: dict[str, tuple[str, ...]]
+) -> dict[str, tuple[str, ...]]:
+    if not isinstance(payload, dict):
+        return dict(default)
+    return {
+        str(model_name): coerce_str_sequence(parameters, [])
+        for model_name, parameters in payload.items()
+    }
+
+# -------------------------------------------------------------------------
+def build_global_fit_settings(payload: dict[str, Any] | Any) -> GlobalFitSettings:
+    enthalpy_min = coerce_float(payload.get("enthalpy_min"), -200.0)
+    return GlobalFitSettings(
+        shared_parameters=build_parameter_mapping(
+            payload.get("shared_parameters"), GLOBAL_FIT_SHARED_DEFAULTS
+        ),
+        temperature_dependent=build_parameter_mapping(
+            payload.get("temperature_dependent"), GLOBAL_FIT_VANT_HOFF_DEFAULTS
+        ),
+        enthalpy_min=enthalpy_min,
+        enthalpy_max=coerce_float(
+            payload.get("enthalpy_max"), 50.0, minimum=enthalpy_min + 1.0
+        ),
+        min_experiments=coerce_int(payload.get("min_experiments"), 2, minimum=2),
+    )
+
+# -------------------------------------------------------------------------
+def build_iast_settings(payload: dict[str, Any] | Any) -> IASTSettings:
+    return IASTSettings(
+        max_grid_points=coerce_int(payload.get("max_grid_points"), 200000, minimum=1),
+        max_iterations=coerce_int(payload.get("max_iterations"), 100, minimum=1),
+        tolerance=coerce_float(
+            payload.get("tolerance"), 1e-10, minimum=1e-15, maximum=1e-2
+        ),
+        quadrature_nodes=coerce_int(payload.get("quadrature_nodes"), 64, minimum=8),
+        quadrature_lower_ratio=coerce_float(
+            payload.get("quadrature_lower_ratio"), 1e-9, minimum=1e-15, maximum=1e-3
+        ),
+        temperature_tolerance=coerce_float(
+            payload.get("temperature_tolerance"), 1.0, minimum=0.0
+        ),
+    )
+
+# -------------------------------------------------------------------------
+def build_isosteric_heat_settings(
+    payload: dict[str, Any] | Any,
+) -> IsostericHeatSettings:
+    default_points = coerce_int(payload.get("default_points"), 50, minimum=2)
+    return IsostericHeatSettings(
+        default_points=default_points,
+        max_points=coerce_int(payload.get("max_points"), 500, minimum=default_points),
+        loading_lower_fraction=coerce_float(
+            payload.get("loading_lower_fraction"), 0.05, minimum=1e-6, maximum=1.0
+        ),
+        bracket_decades=coerce_float(
+            payload.get("bracket_decades"), 12.0, minimum=1.0, maximum=100.0
+        ),
+        bisection_iterations=coerce_int(
+            payload.get("bisection_iterations"), 64, minimum=1
+        ),
+        min_temperatures=coerce_int(payload.get("min_temperatures"), 2, minimum=2),
+    )
+
 # -------------------------------------------------------------------------
 def build_fitting_settings(payload: dict[str, Any] | Any) -> FittingSettings:
     default_iterations = coerce_int(
@@ -175,17 +493,84 @@ def build_fitting_settings(payload: dict[str, Any] | Any) -> FittingSettings:
         parameter_max_default=parameter_max_default,
         preview_row_limit=coerce_int(payload.get("preview_row_limit"), 5, minimum=1),
         best_model_metric=best_model_metric,
+        multistart=build_multistart_settings(ensure_mapping(payload.get("multistart"))),
+        screening=build_screening_settings(ensure_mapping(payload.get("screening"))),
+        two_tier=build_two_tier_settings(ensure_mapping(payload.get("two_tier"))),
+        bootstrap=build_bootstrap_settings(ensure_mapping(payload.get("bootstrap"))),
+        auto_method=build_auto_method_settings(
+            ensure_mapping(payload.get("auto_method"))
+        ),
+        global_fit=build_global_fit_settings(ensure_mapping(payload.get("global_fit"))),
+        iast=build_iast_settings(ensure_mapping(payload.get("iast"))),
+        isosteric_heat=build_isosteric_heat_settings(
+            ensure_mapping(payload.get("isosteric_heat"))
+        ),
+        prediction_default_points=coerce_int(
+            payload.get("prediction_default_points"), 100, minimum=2
+        ),
+        prediction_max_points=coerce_int(
+            payload.get("prediction_max_points"), 500, minimum=2
+        ),
+        prediction_cache_size=coerce_int(
+            payload.get("prediction_cache_size"), 128, minimum=1
+        ),
+        prediction_cache_ttl=coerce_int(
+            payload.get("prediction_cache_ttl"), 300, minimum=1
+        ),
+        stream_progress_interval=coerce_float(
+            payload.get("stream_progress_interval"), 0.5, minimum=0.0
+        ),
+        job_time_budget=coerce_float(
+            payload.get("job_time_budget"), 1800.0, minimum=0.0
+        ),
+        fit_time_budget=coerce_float(
+            payload.get("fit_time_budget"), 120.0, minimum=0.0
+        ),
+        dedup_cache_size=coerce_int(payload.get("dedup_cache_size"), 16, minimum=1),
+        dedup_cache_ttl=coerce_float(
+            payload.get("dedup_cache_ttl"), 60.0, minimum=0.0
+        ),
+        checkpoint_enabled=coerce_bool(payload.get("checkpoint_enabled"), True),
+        checkpoint_sync_interval=coerce_int(
+            payload.get("checkpoint_sync_interval"), 10, minimum=1
+        ),
+        checkpoint_retention_hours=coerce_float(
+            payload.get("checkpoint_retention_hours"), 168.0, minimum=0.0
+        ),
+        memory_sample_interval=coerce_float(
+            payload.get("memory_sample_interval"), 0.1, minimum=0.0
+        ),
+        isotherm_store_enabled=coerce_bool(
+            payload.get("isotherm_store_enabled"), True
+        ),
+        learned_initialization=coerce_bool(
+            payload.get("learned_initialization"), False
+        ),
+        initializer_neighbors=coerce_int(
+            payload.get("initializer_neighbors"), 5, minimum=1
+        ),
+        initializer_min_samples=coerce_int(
+            payload.get("initializer_min_samples"), 10, minimum=1
+        ),
+        initializer_max_samples=coerce_int(
+            payload.get("initializer_max_samples"), 20000, minimum=1
+        ),
+        solver_scaling=coerce_bool(payload.get("solver_scaling"), True),
     )
 
 # -------------------------------------------------------------------------
 def build_server_settings(payload: dict[str, Any] | Any) -> ServerSettings:
     fastapi_payload = ensure_mapping(payload.get("fastapi"))
+    serving_payload = ensure_mapping(payload.get("serving"))
+    scheduling_payload = ensure_mapping(payload.get("scheduling"))
     database_payload = ensure_mapping(payload.get("database"))
     dataset_payload = ensure_mapping(payload.get("datasets"))
     fitting_payload = ensure_mapping(payload.get("fitting"))
 
     return ServerSettings(
         fastapi=build_fastapi_settings(fastapi_payload),
+        serving=build_serving_settings(serving_payload),
+        scheduling=build_scheduling_settings(scheduling_payload),
         database=build_database_settings(database_payload),
         datasets=build_dataset_settings(dataset_payload),
         fitting=build_fitting_settings(fitting_payload),
@@ -11,6 +11,13 @@ RESOURCES_PATH = join(PROJECT_DIR, "resources")
 DATA_PATH = join(RESOURCES_PATH, "database")
 LOGS_PATH = join(RESOURCES_PATH, "logs")
 TEMPLATES_PATH = join(RESOURCES_PATH, "templates")
+BATCH_PATH = join(RESOURCES_PATH, "batch")
+CHECKPOINT_PATH = join(RESOURCES_PATH, "checkpoints")
+ISOTHERM_STORE_PATH = join(RESOURCES_PATH, "isotherms")
+PREDICTORS_PATH = join(RESOURCES_PATH, "predictors")
+INITIALIZER_FILE = join(PREDICTORS_PATH, "initial_parameters.joblib")
+SCREENER_FILE = join(PREDICTORS_PATH, "model_screener.joblib")
+METHOD_STATISTICS_FILE = join(PREDICTORS_PATH, "method_statistics.json")
 ENV_FILE_PATH = join(SETTING_PATH, ".env")
 DATABASE_FILENAME = "sqlite.db"
 
@@ -76,6 +83,27 @@ MODEL_PARAMETER_DEFAULTS: dict[str, dict[str, tuple[float, float]]] = {
     },
 }
 
+# Parameters shared by all temperatures of a group in global fits, and parameters
+# following a van't Hoff temperature dependence; the others stay per experiment.
+GLOBAL_FIT_SHARED_DEFAULTS: dict[str, tuple[str, ...]] = {
+    "Langmuir": ("qsat",),
+    "Sips": ("qsat",),
+    "Toth": ("qsat",),
+    "Dubinin-Radushkevich": ("qsat",),
+    "Dual-Site Langmuir": ("qsat1", "qsat2"),
+    "Jovanovic": ("qsat",),
+}
+GLOBAL_FIT_VANT_HOFF_DEFAULTS: dict[str, tuple[str, ...]] = {
+    "Langmuir": ("k",),
+    "Sips": ("k",),
+    "Freundlich": ("k",),
+    "Temkin": ("k",),
+    "Toth": ("k",),
+    "Dual-Site Langmuir": ("k1", "k2"),
+    "Redlich-Peterson": ("k", "a"),
+    "Jovanovic": ("k",),
+}
+
 DEFAULT_DATASET_COLUMN_MAPPING = {
     "experiment": "experiment",
     "temperature": "temperature [K]",
@@ -97,12 +125,25 @@ FITTING_MODEL_NAMES = (
     "JOVANOVIC",
 )
 
+# Modules imported by each worker during application startup, so the first fitting
+# request does not pay for loading the numerical stack.
+WORKER_WARMUP_MODULES = (
+    "scipy.optimize",
+    "scipy.stats.qmc",
+    "sqlalchemy",
+)
+
 
 ###############################################################################
 DATASETS_ROUTER_PREFIX = "/datasets"
 DATASETS_LOAD_ENDPOINT = "/load"
 FITTING_ROUTER_PREFIX = "/fitting"
 FITTING_RUN_ENDPOINT = "/run"
+FITTING_PREDICT_ENDPOINT = "/predict"
+FITTING_IAST_ENDPOINT = "/iast"
+FITTING_ISOSTERIC_ENDPOINT = "/isosteric-heat"
+FITTING_STREAM_ENDPOINT = "/stream"
+FITTING_CANCEL_ENDPOINT = "/jobs/{job_id}/cancel"
 BROWSER_ROUTER_PREFIX = "/browser"
 BROWSER_TABLES_ENDPOINT = "/tables"
 BROWSER_DATA_ENDPOINT = "/data"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ADSORFIT.server.utils.cache import LRUCache
+
+RESULT_SOURCE_COMPUTED = "computed"
+RESULT_SOURCE_SHARED = "shared"
+RESULT_SOURCE_CACHED = "cached"
+
+
+###############################################################################
+class FittingDeduplicator:
+    """Share one computation among identical fitting requests of a worker.
+
+    Requests are keyed by a fingerprint of their dataset and normalized fitting
+    configuration. While a job runs, identical requests attach to it instead of
+    starting their own; once it completes, its response is served from a
+    short-lived cache. A cached response is only valid while the database still
+    holds the results of that job, i.e. until another job of this worker writes
+    different results.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.results = LRUCache(max_entries, ttl_seconds) if ttl_seconds > 0 else None
+        self.inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self.last_written: str | None = None
+
+    # -------------------------------------------------------------------------
+    def lookup(self, fingerprint: str) -> dict[str, Any] | None:
+        if self.results is None or fingerprint != self.last_written:
+            return None
+        response = self.results.get(fingerprint)
+        if response is None:
+            return None
+        return {**response, "result_source": RESULT_SOURCE_CACHED}
+
+    # -------------------------------------------------------------------------
+    def attach(self, fingerprint: str) -> asyncio.Future[dict[str, Any]] | None:
+        return self.inflight.get(fingerprint)
+
+    # -------------------------------------------------------------------------
+    def begin(self, fingerprint: str) -> None:
+        self.inflight[fingerprint] = asyncio.get_running_loop().create_future()
+
+    # -------------------------------------------------------------------------
+    def complete(self, fingerprint: str, response: dict[str, Any]) -> None:
+        # Every finished job rewrote the result tables, partial or not.
+        self.last_written = fingerprint
+        if self.results is not None and not response.get("partial"):
+            self.results.put(fingerprint, response)
+        future = self.inflight.pop(fingerprint, None)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    # -------------------------------------------------------------------------
+    def fail(self, fingerprint: str, error: Exception) -> None:
+        future = self.inflight.pop(fingerprint, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+            # Mark the exception as retrieved when no request attached to the job.
+            future.exception()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def follow(future: asyncio.Future[dict[str, Any]]) -> dict[str, Any]:
+        response = await asyncio.shield(future)
+        return {**response, "result_source": RESULT_SOURCE_SHARED}
+
+    # -------------------------------------------------------------------------
+    async def run(
+        self,
+        fingerprint: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Answer a request from cache, from an identical running job, or by computing.
+
+        Keyword arguments:
+        fingerprint -- Request fingerprint, see ``FittingPipeline.fingerprint``.
+        compute -- Coroutine factory running the job when nothing can be reused.
+
+        Return value:
+        Fitting response, with ``result_source`` telling how it was obtained.
+        """
+        cached = self.lookup(fingerprint)
+        if cached is not None:
+            return cached
+        pending = self.attach(fingerprint)
+        if pending is not None:
+            return await self.follow(pending)
+
+        self.begin(fingerprint)
+        try:
+            response = await compute()
+        except Exception as exc:
+            self.fail(fingerprint, exc)
+            raise
+        except BaseException:
+            self.fail(
+                fingerprint, RuntimeError("The shared fitting job was interrupted.")
+            )
+            raise
+        self.complete(fingerprint, response)
+        return {**response, "result_source": RESULT_SOURCE_COMPUTED}
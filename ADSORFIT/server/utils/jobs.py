@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+STOP_REASON_CANCELLED = "cancelled"
+STOP_REASON_TIME_BUDGET = "time_budget"
+
+
+###############################################################################
+class FittingInterrupted(Exception):
+    """Raised inside a fitting job once it was cancelled or ran out of time."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Fitting job interrupted ({reason})")
+        self.reason = reason
+
+
+###############################################################################
+class FitTimeBudgetExceeded(Exception):
+    """Raised when a single model fit exceeds its wall-clock budget."""
+
+
+###############################################################################
+class CancellationToken:
+    """Cooperative stop signal shared between a fitting job and its controllers.
+
+    The job polls the token between experiments, between models and from within
+    the objective function, so a cancel request or an exhausted time budget takes
+    effect after at most one model evaluation.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        job_time_budget: float | None = None,
+        fit_time_budget: float | None = None,
+    ) -> None:
+        self.job_id = job_id
+        self.job_time_budget = job_time_budget or None
+        self.fit_time_budget = fit_time_budget or None
+        self.event = threading.Event()
+        self.start()
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """(Re)start the job clock, e.g. once the job leaves the admission queue."""
+        self.started_at = time.monotonic()
+        self.deadline = (
+            self.started_at + self.job_time_budget
+            if self.job_time_budget is not None
+            else None
+        )
+
+    # -------------------------------------------------------------------------
+    def cancel(self) -> None:
+        self.event.set()
+
+    # -------------------------------------------------------------------------
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+    # -------------------------------------------------------------------------
+    @property
+    def stop_reason(self) -> str | None:
+        if self.cancelled:
+            return STOP_REASON_CANCELLED
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return STOP_REASON_TIME_BUDGET
+        return None
+
+    # -------------------------------------------------------------------------
+    def check(self) -> None:
+        reason = self.stop_reason
+        if reason is not None:
+            raise FittingInterrupted(reason)
+
+    # -------------------------------------------------------------------------
+    def fit_deadline(self) -> float | None:
+        """Return the monotonic time at which the next model fit must stop.
+
+        Return value:
+        Earliest of the per-fit budget (counted from now) and the job deadline, or
+        None when neither limit is configured.
+        """
+        limits = [] if self.deadline is None else [self.deadline]
+        if self.fit_time_budget is not None:
+            limits.append(time.monotonic() + self.fit_time_budget)
+        return min(limits) if limits else None
+
+    # -------------------------------------------------------------------------
+    def guard(
+        self, function: Callable[..., Any], deadline: float | None
+    ) -> Callable[..., Any]:
+        """Wrap a model callable so every evaluation honours cancellation.
+
+        Keyword arguments:
+        function -- Model callable evaluated by the optimizer.
+        deadline -- Monotonic time after which the current fit is abandoned.
+
+        Return value:
+        Callable with the same signature that raises :class:`FittingInterrupted`
+        or :class:`FitTimeBudgetExceeded` instead of evaluating the model.
+        """
+
+        def guarded(*args: Any, **kwargs: Any) -> Any:
+            self.check()
+            if deadline is not None and time.monotonic() >= deadline:
+                raise FitTimeBudgetExceeded("Model fit exceeded its time budget.")
+            return function(*args, **kwargs)
+
+        return guarded
+
+
+###############################################################################
+class JobRegistry:
+    """Process-local index of running fitting jobs, used by the cancel endpoint."""
+
+    def __init__(self) -> None:
+        self.tokens: dict[str, CancellationToken] = {}
+        self.lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    def register(
+        self,
+        job_id: str | None = None,
+        job_time_budget: float | None = None,
+        fit_time_budget: float | None = None,
+    ) -> CancellationToken:
+        with self.lock:
+            resolved_id = job_id or uuid.uuid4().hex
+            if resolved_id in self.tokens:
+                raise ValueError(f"Fitting job {resolved_id} is already running.")
+            token = CancellationToken(resolved_id, job_time_budget, fit_time_budget)
+            self.tokens[resolved_id] = token
+            return token
+
+    # -------------------------------------------------------------------------
+    def cancel(self, job_id: str) -> bool:
+        with self.lock:
+            token = self.tokens.get(job_id)
+        if token is None:
+            return False
+        token.cancel()
+        return True
+
+    # -------------------------------------------------------------------------
+    def release(self, job_id: str) -> None:
+        with self.lock:
+            self.tokens.pop(job_id, None)
+
+
+# -------------------------------------------------------------------------
+def resolve_time_budget(requested: float | None, configured: float) -> float | None:
+    """Clamp a requested budget to the configured ceiling; 0 disables the limit."""
+    if configured <= 0:
+        return requested or None
+    if requested is None:
+        return configured
+    return min(requested, configured)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import IO
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+# -------------------------------------------------------------------------
+def wait_for_lock(try_acquire: Callable[[], bool], timeout: float, name: str) -> None:
+    deadline = time.monotonic() + timeout
+    while not try_acquire():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Timed out after {timeout:.0f}s waiting for write lock {name}"
+            )
+        time.sleep(LOCK_POLL_INTERVAL)
+
+
+###############################################################################
+class ReentrantWriteLock:
+    """Serialize writes to a shared resource between threads of a worker and,
+    through the process-level hooks implemented by subclasses, between worker
+    processes. Nested acquisitions from the same thread only take the process lock
+    once, so a multi-table save can hold the lock while each table write re-enters
+    it.
+    """
+
+    def __init__(self, name: str, timeout: float) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        if not self.thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(
+                f"Timed out after {self.timeout:.0f}s waiting for write lock {self.name}"
+            )
+        try:
+            if self.depth == 0:
+                self.acquire_process_lock()
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.release_process_lock()
+        finally:
+            self.thread_lock.release()
+
+    # -------------------------------------------------------------------------
+    def acquire_process_lock(self) -> None:
+        return None
+
+    # -------------------------------------------------------------------------
+    def release_process_lock(self) -> None:
+        return None
+
+
+###############################################################################
+class FileWriteLock(ReentrantWriteLock):
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__(path, timeout)
+        self.path = path
+        self.handle: IO[bytes] | None = None
+
+    # -------------------------------------------------------------------------
+    def try_lock_handle(self) -> bool:
+        if self.handle is None:
+            return False
+        try:
+            if os.name == "nt":
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    def acquire_process_lock(self) -> None:
+        self.handle = open(self.path, "a+b")
+        try:
+            wait_for_lock(self.try_lock_handle, self.timeout, self.name)
+        except TimeoutError:
+            self.handle.close()
+            self.handle = None
+            raise
+
+    # -------------------------------------------------------------------------
+    def release_process_lock(self) -> None:
+        if self.handle is None:
+            return
+        try:
+            if os.name == "nt":
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.handle.close()
+            self.handle = None
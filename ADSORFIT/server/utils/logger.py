@@ -39,6 +39,7 @@ LOG_CONFIG = {
             "filename": log_filename,
             "mode": "a",
             "encoding": "utf-8",
+            "delay": True,
         },
     },
     "root": {
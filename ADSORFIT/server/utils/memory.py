@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from types import TracebackType
+
+BYTES_PER_MB = 1024.0 * 1024.0
+
+
+# -------------------------------------------------------------------------
+def current_rss() -> int | None:
+    """Return the resident set size of this process in bytes.
+
+    Return value:
+    Current RSS, or None when the platform offers no cheap way to read it.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "rb") as file:
+                resident_pages = int(file.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        return windows_working_set()
+    return None
+
+
+# -------------------------------------------------------------------------
+def windows_working_set() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    if not kernel32.K32GetProcessMemoryInfo(
+        kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return int(counters.WorkingSetSize)
+
+
+###############################################################################
+class PeakMemoryMonitor:
+    """Track the peak resident memory of the process while a block runs.
+
+    A daemon thread samples the RSS every ``interval`` seconds, so short spikes
+    between two samples can be missed. The figures cover the whole process: jobs
+    running concurrently in the same worker add to each other's peak.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = float(interval)
+        self.baseline: int | None = None
+        self.peak: int | None = None
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    # -------------------------------------------------------------------------
+    def __enter__(self) -> PeakMemoryMonitor:
+        if self.interval <= 0:
+            return self
+        self.baseline = current_rss()
+        self.peak = self.baseline
+        if self.baseline is not None:
+            self.thread = threading.Thread(
+                target=self.sample_until_stopped,
+                name="adsorfit-memory-monitor",
+                daemon=True,
+            )
+            self.thread.start()
+        return self
+
+    # -------------------------------------------------------------------------
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.sample()
+
+    # -------------------------------------------------------------------------
+    def sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    # -------------------------------------------------------------------------
+    def sample_until_stopped(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    # -------------------------------------------------------------------------
+    @property
+    def peak_mb(self) -> float | None:
+        return None if self.peak is None else round(self.peak / BYTES_PER_MB, 1)
+
+    # -------------------------------------------------------------------------
+    @property
+    def growth_mb(self) -> float | None:
+        """Peak RSS above the RSS measured when the block started, in MB."""
+        if self.peak is None or self.baseline is None:
+            return None
+        return round((self.peak - self.baseline) / BYTES_PER_MB, 1)
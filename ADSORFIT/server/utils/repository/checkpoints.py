@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, TextIO
+
+import numpy as np
+
+from ADSORFIT.server.utils.constants import CHECKPOINT_PATH
+from ADSORFIT.server.utils.logger import logger
+
+CHECKPOINT_EXTENSION = ".jsonl"
+
+
+# -------------------------------------------------------------------------
+def compact_model_result(entry: dict[str, Any]) -> dict[str, Any]:
+    """Keep the fields of a model result that are needed once the fit is done.
+
+    Covariance matrices and exception objects are dropped (the exception message is
+    kept as ``error``), so finished experiments hold only a few numbers each.
+    """
+    compact = {
+        key: value
+        for key, value in entry.items()
+        if key not in {"covariance", "exception"}
+    }
+    if "exception" in entry:
+        compact["error"] = str(entry["exception"])
+    for key, value in compact.items():
+        if isinstance(value, np.generic):
+            compact[key] = value.item()
+    return compact
+
+
+###############################################################################
+class FitCheckpoint:
+    """Append-only record of the experiments completed by one fitting run.
+
+    Each line holds the compact results of one experiment. Lines are flushed as
+    they are written and synced to disk every ``sync_interval`` experiments, so a
+    crashed run loses at most the experiment in progress (or the last few on power
+    loss). The file is named after the run fingerprint: a rerun of the same dataset
+    and configuration picks up where the previous attempt stopped.
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        directory: str = CHECKPOINT_PATH,
+        sync_interval: int = 10,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.path = os.path.join(directory, f"{fingerprint}{CHECKPOINT_EXTENSION}")
+        self.sync_interval = max(1, int(sync_interval))
+        self.pending_sync = 0
+        self.handle: TextIO | None = None
+        os.makedirs(directory, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    def load(self) -> dict[int, dict[str, dict[str, Any]]]:
+        """Return the checkpointed results keyed by experiment position."""
+        completed: dict[int, dict[str, dict[str, Any]]] = {}
+        if not os.path.isfile(self.path):
+            return completed
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    completed[int(record["index"])] = record["results"]
+                except (ValueError, KeyError, TypeError):
+                    # A run killed mid-write leaves a truncated last line.
+                    continue
+        return completed
+
+    # -------------------------------------------------------------------------
+    def append(
+        self, index: int, experiment: str, results: dict[str, dict[str, Any]]
+    ) -> None:
+        if self.handle is None:
+            self.handle = open(self.path, "a", encoding="utf-8")
+        record = {"index": int(index), "experiment": experiment, "results": results}
+        self.handle.write(json.dumps(record) + "\n")
+        self.handle.flush()
+        self.pending_sync += 1
+        if self.pending_sync >= self.sync_interval:
+            os.fsync(self.handle.fileno())
+            self.pending_sync = 0
+
+    # -------------------------------------------------------------------------
+    def close(self) -> None:
+        if self.handle is None:
+            return
+        if self.pending_sync:
+            os.fsync(self.handle.fileno())
+            self.pending_sync = 0
+        self.handle.close()
+        self.handle = None
+
+    # -------------------------------------------------------------------------
+    def discard(self) -> None:
+        """Delete the checkpoint once its results have been stored for good."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def prune(directory: str = CHECKPOINT_PATH, max_age_hours: float = 168.0) -> int:
+        """Remove checkpoints of runs that were never resumed.
+
+        Return value:
+        Number of deleted checkpoint files.
+        """
+        if not os.path.isdir(directory):
+            return 0
+        cutoff = time.time() - max_age_hours * 3600.0
+        removed = 0
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if not name.endswith(CHECKPOINT_EXTENSION):
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError as exc:
+                logger.warning("Unable to prune checkpoint %s: %s", path, exc)
+        return removed
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.server.utils.constants import ISOTHERM_STORE_PATH
+from ADSORFIT.server.utils.logger import logger
+
+ISOTHERM_POINTER_FILENAME = "current.json"
+ISOTHERM_INDEX_FILENAME = "experiments.json"
+# Generations kept on disk besides the current one, for readers that still map them.
+ISOTHERM_RETAINED_GENERATIONS = 1
+
+
+###############################################################################
+class IsothermSnapshot:
+    """Read-only view of one stored generation of processed isotherms.
+
+    Pressure and uptake values of all experiments are concatenated in two
+    memory-mapped float64 arrays; ``offsets[i]:offsets[i + 1]`` delimits the
+    points of experiment ``i``. Slices are views on the mapped pages, so opening
+    an isotherm copies nothing and processes reading the same generation share
+    the operating system page cache.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        with open(
+            os.path.join(directory, ISOTHERM_INDEX_FILENAME), "r", encoding="utf-8"
+        ) as file:
+            index = json.load(file)
+        self.experiments: list[str] = [str(name) for name in index["experiments"]]
+        self.positions = {
+            name: position for position, name in enumerate(self.experiments)
+        }
+        self.temperature = np.asarray(index["temperature"], dtype=np.float64)
+        self.pressure = np.load(os.path.join(directory, "pressure.npy"), mmap_mode="r")
+        self.uptake = np.load(os.path.join(directory, "uptake.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(directory, "offsets.npy"))
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.experiments)
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, experiment: object) -> bool:
+        return experiment in self.positions
+
+    # -------------------------------------------------------------------------
+    def isotherm(self, experiment: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the measured pressure and uptake of an experiment.
+
+        Keyword arguments:
+        experiment -- Experiment name as stored in the experiment table.
+
+        Return value:
+        Tuple of read-only pressure and uptake views.
+        """
+        position = self.positions[experiment]
+        start, stop = int(self.offsets[position]), int(self.offsets[position + 1])
+        return self.pressure[start:stop], self.uptake[start:stop]
+
+
+###############################################################################
+class IsothermStore:
+    """On-disk store of processed isotherms, readable without the database.
+
+    Every write creates a new generation directory and then atomically replaces a
+    small pointer file, so readers never see a half-written generation and arrays
+    that are still mapped (which Windows refuses to overwrite) are left alone.
+    Older generations are removed on later writes.
+    """
+
+    def __init__(self, directory: str = ISOTHERM_STORE_PATH) -> None:
+        self.directory = directory
+        self.pointer_path = os.path.join(directory, ISOTHERM_POINTER_FILENAME)
+        self.snapshot: IsothermSnapshot | None = None
+        self.generation: str | None = None
+        self.lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    def write(
+        self,
+        experiments: Sequence[Any],
+        pressure: Sequence[np.ndarray],
+        uptake: Sequence[np.ndarray],
+        temperature: Sequence[float],
+    ) -> str:
+        """Persist the processed isotherms of a dataset as a new generation.
+
+        Keyword arguments:
+        experiments -- Experiment names, in dataset order.
+        pressure -- Pressure vector of every experiment.
+        uptake -- Uptake vector of every experiment, aligned with ``pressure``.
+        temperature -- Temperature of every experiment.
+
+        Return value:
+        Name of the written generation.
+        """
+        lengths = np.fromiter((len(values) for values in pressure), dtype=np.int64)
+        offsets = np.zeros(lengths.shape[0] + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        arrays = {
+            "pressure": self.concatenate(pressure),
+            "uptake": self.concatenate(uptake),
+            "offsets": offsets,
+        }
+        if arrays["uptake"].shape != arrays["pressure"].shape:
+            raise ValueError("Pressure and uptake vectors have different lengths.")
+
+        generation = f"{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        target = os.path.join(self.directory, generation)
+        os.makedirs(target, exist_ok=True)
+        for name, values in arrays.items():
+            np.save(os.path.join(target, f"{name}.npy"), values)
+        index = {
+            "experiments": [str(name) for name in experiments],
+            "temperature": [float(value) for value in temperature],
+        }
+        with open(
+            os.path.join(target, ISOTHERM_INDEX_FILENAME), "w", encoding="utf-8"
+        ) as file:
+            json.dump(index, file)
+
+        temporary_path = f"{self.pointer_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"generation": generation, "experiments": len(index["experiments"])},
+                file,
+            )
+        os.replace(temporary_path, self.pointer_path)
+        self.prune(keep=generation)
+        return generation
+
+    # -------------------------------------------------------------------------
+    def load(self) -> IsothermSnapshot | None:
+        """Open the current generation, or return None when nothing is stored."""
+        generation = self.current_generation()
+        if generation is None:
+            return None
+        with self.lock:
+            if self.snapshot is not None and self.generation == generation:
+                return self.snapshot
+            try:
+                snapshot = IsothermSnapshot(os.path.join(self.directory, generation))
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning(
+                    "Unable to open isotherm store generation %s: %s", generation, exc
+                )
+                return None
+            self.snapshot, self.generation = snapshot, generation
+            return snapshot
+
+    # -------------------------------------------------------------------------
+    def current_generation(self) -> str | None:
+        try:
+            with open(self.pointer_path, "r", encoding="utf-8") as file:
+                return str(json.load(file)["generation"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    # -------------------------------------------------------------------------
+    def prune(self, keep: str) -> None:
+        generations = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name != keep and os.path.isdir(os.path.join(self.directory, name))
+        )
+        expired = max(0, len(generations) - ISOTHERM_RETAINED_GENERATIONS)
+        for name in generations[:expired]:
+            # A generation still mapped by another process cannot be removed on
+            # Windows; it is retried on the next write.
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def concatenate(vectors: Sequence[np.ndarray]) -> np.ndarray:
+        if len(vectors) == 0:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate(
+            [np.asarray(values, dtype=np.float64) for values in vectors]
+        )
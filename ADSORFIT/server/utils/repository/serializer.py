@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 from ADSORFIT.server.database.database import database
 
@@ -28,11 +31,16 @@ class DataSerializer:
             "table": "ADSORPTION_LANGMUIR",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "qsat": "qsat",
                 "qsat_error": "qsat error",
+                "qsat_ci_lower": "qsat ci lower",
+                "qsat_ci_upper": "qsat ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -42,13 +50,20 @@ class DataSerializer:
             "table": "ADSORPTION_SIPS",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "qsat": "qsat",
                 "qsat_error": "qsat error",
+                "qsat_ci_lower": "qsat ci lower",
+                "qsat_ci_upper": "qsat ci upper",
                 "exponent": "exponent",
                 "exponent_error": "exponent error",
+                "exponent_ci_lower": "exponent ci lower",
+                "exponent_ci_upper": "exponent ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -58,11 +73,16 @@ class DataSerializer:
             "table": "ADSORPTION_FREUNDLICH",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "exponent": "exponent",
                 "exponent_error": "exponent error",
+                "exponent_ci_lower": "exponent ci lower",
+                "exponent_ci_upper": "exponent ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -72,11 +92,16 @@ class DataSerializer:
             "table": "ADSORPTION_TEMKIN",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "beta": "beta",
                 "beta_error": "beta error",
+                "beta_ci_lower": "beta ci lower",
+                "beta_ci_upper": "beta ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -86,13 +111,20 @@ class DataSerializer:
             "table": "ADSORPTION_TOTH",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "qsat": "qsat",
                 "qsat_error": "qsat error",
+                "qsat_ci_lower": "qsat ci lower",
+                "qsat_ci_upper": "qsat ci upper",
                 "exponent": "exponent",
                 "exponent_error": "exponent error",
+                "exponent_ci_lower": "exponent ci lower",
+                "exponent_ci_upper": "exponent ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -102,11 +134,16 @@ class DataSerializer:
             "table": "ADSORPTION_DUBININ_RADUSHKEVICH",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "qsat": "qsat",
                 "qsat_error": "qsat error",
+                "qsat_ci_lower": "qsat ci lower",
+                "qsat_ci_upper": "qsat ci upper",
                 "beta": "beta",
                 "beta_error": "beta error",
+                "beta_ci_lower": "beta ci lower",
+                "beta_ci_upper": "beta ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -116,15 +153,24 @@ class DataSerializer:
             "table": "ADSORPTION_DUAL_SITE_LANGMUIR",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k1": "k1",
                 "k1_error": "k1 error",
+                "k1_ci_lower": "k1 ci lower",
+                "k1_ci_upper": "k1 ci upper",
                 "qsat1": "qsat1",
                 "qsat1_error": "qsat1 error",
+                "qsat1_ci_lower": "qsat1 ci lower",
+                "qsat1_ci_upper": "qsat1 ci upper",
                 "k2": "k2",
                 "k2_error": "k2 error",
+                "k2_ci_lower": "k2 ci lower",
+                "k2_ci_upper": "k2 ci upper",
                 "qsat2": "qsat2",
                 "qsat2_error": "qsat2 error",
+                "qsat2_ci_lower": "qsat2 ci lower",
+                "qsat2_ci_upper": "qsat2 ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -134,13 +180,20 @@ class DataSerializer:
             "table": "ADSORPTION_REDLICH_PETERSON",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "a": "a",
                 "a_error": "a error",
+                "a_ci_lower": "a ci lower",
+                "a_ci_upper": "a ci upper",
                 "beta": "beta",
                 "beta_error": "beta error",
+                "beta_ci_lower": "beta ci lower",
+                "beta_ci_upper": "beta ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
@@ -150,17 +203,26 @@ class DataSerializer:
             "table": "ADSORPTION_JOVANOVIC",
             "fields": {
                 "optimization_method": "optimization method",
+                "status": "status",
                 "score": "score",
                 "k": "k",
                 "k_error": "k error",
+                "k_ci_lower": "k ci lower",
+                "k_ci_upper": "k ci upper",
                 "qsat": "qsat",
                 "qsat_error": "qsat error",
+                "qsat_ci_lower": "qsat ci lower",
+                "qsat_ci_upper": "qsat ci upper",
                 "aic": "AIC",
                 "aicc": "AICc",
             },
         },
     }
     
+    # -------------------------------------------------------------------------
+    def write_lock(self) -> AbstractContextManager[None]:
+        return database.write_lock()
+
     # -------------------------------------------------------------------------
     def save_raw_dataset(self, dataset: pd.DataFrame) -> None:
         database.save_into_database(dataset, "ADSORPTION_DATA")
@@ -208,7 +270,7 @@ class DataSerializer:
             return experiments
         experiments = experiments.rename(columns={"id": "experiment_id"})
         experiments = self.convert_strings_to_lists(experiments)
-        combined = experiments.copy()
+        combined = experiments
         for schema in self.model_schemas.values():
             model_frame = database.load_from_database(schema["table"])
             if model_frame.empty:
@@ -253,12 +315,25 @@ class DataSerializer:
         )
         return merged
 
+    # -------------------------------------------------------------------------
+    def load_experiments(self) -> pd.DataFrame:
+        return database.load_from_database(self.experiment_table)
+
+    # -------------------------------------------------------------------------
+    def load_model_results(self, model_key: str) -> pd.DataFrame:
+        return database.load_from_database(self.model_schemas[model_key]["table"])
+
+    # -------------------------------------------------------------------------
+    def load_best_fit_table(self) -> pd.DataFrame:
+        return database.load_from_database(self.best_fit_table)
+
     # -------------------------------------------------------------------------
     def build_experiment_frame(self, dataset: pd.DataFrame) -> pd.DataFrame:
         missing = [column for column in self.experiment_columns if column not in dataset]
         if missing:
             raise ValueError(f"Missing experiment columns: {missing}")
-        experiments = dataset.loc[:, self.experiment_columns].copy()
+        # Column selection already returns a new frame, so no further copy is made.
+        experiments = dataset.loc[:, self.experiment_columns]
         experiments.insert(0, "id", range(1, len(experiments) + 1))
         return experiments
 
@@ -320,6 +395,8 @@ class DataSerializer:
 
     # -------------------------------------------------------------------------
     def convert_list_to_string(self, value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
         if isinstance(value, (list, tuple)):
             parts: list[str] = []
             for element in value:
@@ -351,15 +428,19 @@ class DataSerializer:
 
     # -------------------------------------------------------------------------
     def convert_lists_to_strings(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
+        # Numeric columns cannot hold lists; the shallow copy shares them as they are.
+        converted = dataset.copy(deep=False)
         for column in converted.columns:
+            if is_numeric_dtype(converted[column]):
+                continue
             converted[column] = converted[column].apply(self.convert_list_to_string)
         return converted
 
     # -------------------------------------------------------------------------
     def convert_strings_to_lists(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
+        converted = dataset.copy(deep=False)
         for column in converted.columns:
-            if converted[column].dtype == object:
-                converted[column] = converted[column].apply(self.convert_string_to_list)
+            if is_numeric_dtype(converted[column]):
+                continue
+            converted[column] = converted[column].apply(self.convert_string_to_list)
         return converted
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+
+from ADSORFIT.server.utils.configurations import SchedulingSettings
+
+LANE_NORMAL = "normal"
+LANE_LOW_PRIORITY = "low"
+
+
+# -------------------------------------------------------------------------
+def estimate_job_cost(point_count: int, model_count: int, max_iterations: int) -> float:
+    """Estimate the work of a fitting job in model-point evaluations.
+
+    Experiments x points per experiment is the number of uploaded measurements, so
+    the estimate is measurements x models x max_iterations: an upper bound on the
+    residual evaluations the solvers may perform.
+    """
+    return float(max(point_count, 1)) * max(model_count, 1) * max(max_iterations, 1)
+
+
+###############################################################################
+class SchedulerSaturated(Exception):
+    """Raised when a job cannot be queued; ``retry_after`` is in seconds."""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+###############################################################################
+class JobTicket:
+    def __init__(self, client: str, cost: float, lane: str) -> None:
+        self.client = client
+        self.cost = cost
+        self.lane = lane
+        self.admitted: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.released = False
+
+    # -------------------------------------------------------------------------
+    async def wait(self) -> None:
+        await asyncio.shield(self.admitted)
+
+
+###############################################################################
+class FittingScheduler:
+    """Admission control for fitting jobs of a single worker process.
+
+    At most ``max_concurrent_jobs`` jobs run at once. Waiting jobs are served
+    round-robin across clients, so one client submitting many jobs cannot starve
+    the others. Jobs whose estimated cost reaches ``low_priority_cost`` wait in a
+    separate lane that only runs when no regular job is waiting, and never
+    occupies more than ``max_low_priority_jobs`` slots. When the queue is full,
+    submissions fail fast with :class:`SchedulerSaturated`.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, settings: SchedulingSettings) -> None:
+        self.settings = settings
+        self.running: dict[str, int] = {LANE_NORMAL: 0, LANE_LOW_PRIORITY: 0}
+        self.lanes: dict[str, OrderedDict[str, deque[JobTicket]]] = {
+            LANE_NORMAL: OrderedDict(),
+            LANE_LOW_PRIORITY: OrderedDict(),
+        }
+        self.queued = 0
+
+    # -------------------------------------------------------------------------
+    def submit(self, client: str, cost: float) -> JobTicket:
+        """Queue a job, admitting it immediately when a slot is free.
+
+        Keyword arguments:
+        client -- Key identifying the caller, used for fair ordering and quotas.
+        cost -- Estimated job cost, see :func:`estimate_job_cost`.
+
+        Return value:
+        Ticket to await with :meth:`JobTicket.wait` and to pass to :meth:`release`.
+        """
+        lane = (
+            LANE_LOW_PRIORITY
+            if cost >= self.settings.low_priority_cost
+            else LANE_NORMAL
+        )
+        client_waiting = sum(
+            len(self.lanes[name].get(client, ())) for name in self.lanes
+        )
+        if not self.can_start(lane) and (
+            self.queued >= self.settings.max_queued_jobs
+            or client_waiting >= self.settings.max_queued_per_client
+        ):
+            raise SchedulerSaturated(
+                "Too many fitting jobs are waiting; retry later.",
+                self.settings.retry_after,
+            )
+
+        ticket = JobTicket(client, cost, lane)
+        self.lanes[lane].setdefault(client, deque()).append(ticket)
+        self.queued += 1
+        self.dispatch()
+        return ticket
+
+    # -------------------------------------------------------------------------
+    def release(self, ticket: JobTicket) -> None:
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.admitted.done():
+            self.running[ticket.lane] -= 1
+        else:
+            # The caller gave up while waiting (e.g. the client disconnected).
+            client_queue = self.lanes[ticket.lane].get(ticket.client)
+            if client_queue is not None and ticket in client_queue:
+                client_queue.remove(ticket)
+                self.queued -= 1
+                if not client_queue:
+                    del self.lanes[ticket.lane][ticket.client]
+            ticket.admitted.cancel()
+        self.dispatch()
+
+    # -------------------------------------------------------------------------
+    @property
+    def total_running(self) -> int:
+        return sum(self.running.values())
+
+    # -------------------------------------------------------------------------
+    def dispatch(self) -> None:
+        while self.total_running < self.settings.max_concurrent_jobs:
+            lane = self.next_lane()
+            if lane is None:
+                return
+            ticket = self.pop_next(lane)
+            self.running[lane] += 1
+            ticket.admitted.set_result(None)
+
+    # -------------------------------------------------------------------------
+    def can_start(self, lane: str) -> bool:
+        """Tell whether a job submitted to ``lane`` would be admitted right away."""
+        if self.total_running >= self.settings.max_concurrent_jobs:
+            return False
+        if lane == LANE_NORMAL:
+            return not self.lanes[LANE_NORMAL]
+        return (
+            not self.lanes[LANE_NORMAL]
+            and not self.lanes[LANE_LOW_PRIORITY]
+            and self.running[LANE_LOW_PRIORITY] < self.settings.max_low_priority_jobs
+        )
+
+    # -------------------------------------------------------------------------
+    def next_lane(self) -> str | None:
+        if self.lanes[LANE_NORMAL]:
+            return LANE_NORMAL
+        if (
+            self.lanes[LANE_LOW_PRIORITY]
+            and self.running[LANE_LOW_PRIORITY] < self.settings.max_low_priority_jobs
+        ):
+            return LANE_LOW_PRIORITY
+        return None
+
+    # -------------------------------------------------------------------------
+    def pop_next(self, lane: str) -> JobTicket:
+        # Round-robin: take the head job of the first client, then move that client
+        # behind the others.
+        clients = self.lanes[lane]
+        client, client_queue = next(iter(clients.items()))
+        ticket = client_queue.popleft()
+        self.queued -= 1
+        if client_queue:
+            clients.move_to_end(client)
+        else:
+            del clients[client]
+        return ticket
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.constants import MODELS_LIST
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.repository.checkpoints import FitCheckpoint
+from ADSORFIT.server.utils.services.datasets import DatasetService
+from ADSORFIT.server.utils.services.fitting import FittingPipeline, ModelSolver
+from ADSORFIT.server.utils.services.processing import (
+    AdsorptionDataProcessor,
+    DatasetAdapter,
+)
+
+BATCH_OUTPUT_FORMATS = ("csv", "parquet")
+BATCH_MANIFEST_FILENAME = "batch_manifest.json"
+BATCH_CHECKPOINT_DIRNAME = "checkpoints"
+
+
+###############################################################################
+@dataclass(frozen=True)
+class BatchConfiguration:
+    max_iterations: int
+    optimization_method: str
+    models: dict[str, dict[str, Any]]
+
+
+# -------------------------------------------------------------------------
+def load_batch_configuration(path: str | None) -> BatchConfiguration:
+    """Read a batch fitting configuration file.
+
+    Keyword arguments:
+    path -- JSON file with ``max_iterations``, ``optimization_method`` and a
+    ``models`` mapping shaped like the ``parameter_bounds`` of the fitting API.
+    When omitted, every model is fitted with its default bounds.
+
+    Return value:
+    Parsed configuration with server defaults filled in.
+    """
+    payload: dict[str, Any] = {}
+    if path is not None:
+        with open(path, "r", encoding="utf-8") as file:
+            payload = json.load(file)
+        if not isinstance(payload, dict):
+            raise ValueError(f"Batch configuration {path} must be a JSON object.")
+
+    fitting_settings = server_settings.fitting
+    max_iterations = int(
+        payload.get("max_iterations", fitting_settings.default_max_iterations)
+    )
+    max_iterations = min(
+        max(1, max_iterations), fitting_settings.max_iterations_upper_bound
+    )
+    models = payload.get("models") or {name: {} for name in MODELS_LIST}
+    if not isinstance(models, dict):
+        raise ValueError("The 'models' entry must map model names to settings.")
+    return BatchConfiguration(
+        max_iterations=max_iterations,
+        optimization_method=str(payload.get("optimization_method", "LSS")),
+        models=models,
+    )
+
+
+# -------------------------------------------------------------------------
+def resolve_input_files(patterns: list[str]) -> list[str]:
+    """Expand directories and glob patterns into the supported dataset files."""
+    allowed = set(server_settings.datasets.allowed_extensions)
+    files: list[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = [
+                os.path.join(pattern, name) for name in sorted(os.listdir(pattern))
+            ]
+        else:
+            candidates = sorted(glob.glob(pattern, recursive=True))
+        for candidate in candidates:
+            extension = os.path.splitext(candidate)[1].lower()
+            if os.path.isfile(candidate) and extension in allowed:
+                files.append(os.path.abspath(candidate))
+    return list(dict.fromkeys(files))
+
+
+# -------------------------------------------------------------------------
+def fit_dataset_file(
+    path: str,
+    configuration: dict[str, dict[str, Any]],
+    max_iterations: int,
+    optimization_method: str,
+    checkpoint_dir: str | None = None,
+    fingerprint: str | None = None,
+) -> pd.DataFrame:
+    """Fit every experiment of one dataset file; runs inside a worker process.
+
+    Keyword arguments:
+    path -- CSV or Excel dataset file.
+    configuration -- Normalized model configuration.
+    max_iterations -- Maximum number of solver evaluations.
+    optimization_method -- Optimization method name.
+    checkpoint_dir -- Directory of per-experiment checkpoints, None to disable.
+    fingerprint -- Fingerprint of the file, naming its checkpoint.
+
+    Return value:
+    Processed experiments with per-model results and the best/worst model columns.
+    """
+    with open(path, "rb") as file:
+        payload = file.read()
+    dataframe = DatasetService().read_dataframe(payload, os.path.basename(path))
+    processor = AdsorptionDataProcessor(dataframe)
+    processed, detected_columns, _ = processor.preprocess(detect_columns=True)
+    if processed.empty:
+        raise ValueError("No valid experiments found after preprocessing the dataset.")
+
+    checkpoint = (
+        FitCheckpoint(fingerprint, checkpoint_dir)
+        if checkpoint_dir is not None and fingerprint is not None
+        else None
+    )
+    try:
+        results = ModelSolver().bulk_data_fitting(
+            processed,
+            configuration,
+            detected_columns.pressure,
+            detected_columns.uptake,
+            max_iterations,
+            optimization_method,
+            checkpoint=checkpoint,
+        )
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+    adapter = DatasetAdapter()
+    combined = adapter.combine_results(results, processed)
+    metric = adapter.normalize_metric(server_settings.fitting.best_model_metric)
+    return adapter.compute_best_models(combined, metric)
+
+
+###############################################################################
+class BatchFittingRunner:
+    """Fit many dataset files without the web server, resuming interrupted runs.
+
+    Each file is fitted in a worker process and its results are written to
+    ``output_dir`` as soon as it completes. A manifest records the fingerprint of
+    every finished file (file content plus fitting configuration), so a rerun
+    skips files whose results are already on disk.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        output_format: str = "csv",
+        workers: int = 1,
+    ) -> None:
+        if output_format not in BATCH_OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported batch output format: {output_format}")
+        if output_format == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as exc:
+                raise ValueError(
+                    "Parquet output requires pyarrow (pip install ADSORFIT[parquet])."
+                ) from exc
+        self.output_dir = os.path.abspath(output_dir)
+        self.output_format = output_format
+        self.workers = max(1, int(workers))
+        self.manifest_path = os.path.join(self.output_dir, BATCH_MANIFEST_FILENAME)
+        self.checkpoint_dir = os.path.join(self.output_dir, BATCH_CHECKPOINT_DIRNAME)
+        self.pipeline = FittingPipeline()
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    def run(
+        self,
+        files: list[str],
+        batch_configuration: BatchConfiguration,
+        resume: bool = True,
+    ) -> dict[str, Any]:
+        """Fit the given files and record their results.
+
+        Keyword arguments:
+        files -- Absolute paths of the dataset files.
+        batch_configuration -- Fitting settings shared by every file.
+        resume -- Skip files already completed with the same fingerprint and
+        continue partially fitted files from their checkpoints.
+
+        Return value:
+        Summary with the number of fitted, skipped and failed files.
+        """
+        configuration = self.pipeline.normalize_configuration(
+            batch_configuration.models
+        )
+        if not configuration:
+            raise ValueError("The batch configuration contains no supported model.")
+        manifest = self.load_manifest() if resume else {}
+        fingerprints = {
+            path: self.fingerprint(path, configuration, batch_configuration)
+            for path in files
+        }
+        pending = [
+            path
+            for path in files
+            if not self.is_completed(manifest, path, fingerprints[path])
+        ]
+        skipped = len(files) - len(pending)
+        if not resume:
+            for path in pending:
+                FitCheckpoint(fingerprints[path], self.checkpoint_dir).discard()
+        if skipped:
+            logger.info(
+                "Resuming batch: %s of %s files already fitted", skipped, len(files)
+            )
+
+        failed: dict[str, str] = {}
+        started = time.perf_counter()
+        for index, (path, outcome) in enumerate(
+            self.fit_files(pending, fingerprints, configuration, batch_configuration),
+            start=1,
+        ):
+            if isinstance(outcome, Exception):
+                failed[path] = str(outcome)
+                logger.error("Failed to fit %s: %s", path, outcome)
+            else:
+                output_path = self.write_results(path, fingerprints[path], outcome)
+                FitCheckpoint(fingerprints[path], self.checkpoint_dir).discard()
+                manifest[path] = {
+                    "fingerprint": fingerprints[path],
+                    "output": output_path,
+                    "experiments": int(outcome.shape[0]),
+                    "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                }
+                # The manifest is rewritten after every file so that an interrupted
+                # batch loses at most the files that were still being fitted.
+                self.save_manifest(manifest)
+            logger.info(
+                "Batch progress: %s/%s files (%.1f s elapsed)",
+                index,
+                len(pending),
+                time.perf_counter() - started,
+            )
+
+        return {
+            "files": len(files),
+            "fitted": len(pending) - len(failed),
+            "skipped": skipped,
+            "failed": failed,
+            "manifest": self.manifest_path,
+        }
+
+    # -------------------------------------------------------------------------
+    def fit_files(
+        self,
+        files: list[str],
+        fingerprints: dict[str, str],
+        configuration: dict[str, dict[str, Any]],
+        batch_configuration: BatchConfiguration,
+    ) -> Iterator[tuple[str, pd.DataFrame | Exception]]:
+        arguments = (
+            configuration,
+            batch_configuration.max_iterations,
+            batch_configuration.optimization_method,
+            self.checkpoint_dir,
+        )
+        if self.workers == 1 or len(files) <= 1:
+            for path in files:
+                try:
+                    yield path, fit_dataset_file(path, *arguments, fingerprints[path])
+                except Exception as exc:  # noqa: BLE001
+                    yield path, exc
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    fit_dataset_file, path, *arguments, fingerprints[path]
+                ): path
+                for path in files
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield path, future.result()
+                except Exception as exc:  # noqa: BLE001
+                    yield path, exc
+
+    # -------------------------------------------------------------------------
+    def write_results(self, path: str, fingerprint: str, results: pd.DataFrame) -> str:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        output_path = os.path.join(
+            self.output_dir, f"{stem}-{fingerprint[:8]}.{self.output_format}"
+        )
+        serializable = self.pipeline.stringify_sequences(results)
+        temporary_path = f"{output_path}.tmp"
+        if self.output_format == "parquet":
+            serializable.to_parquet(temporary_path, index=False)
+        else:
+            serializable.to_csv(temporary_path, index=False)
+        os.replace(temporary_path, output_path)
+        return output_path
+
+    # -------------------------------------------------------------------------
+    def save_to_database(self, files: list[str]) -> int:
+        """Store the results of the completed files in the configured database.
+
+        The result tables are replaced, as after a fitting job of the web server.
+        Experiment names are prefixed with their file name, since different
+        instrument exports commonly reuse the same experiment labels.
+
+        Keyword arguments:
+        files -- Dataset files whose recorded results should be stored.
+
+        Return value:
+        Number of experiments written.
+        """
+        manifest = self.load_manifest()
+        frames: list[pd.DataFrame] = []
+        for path in files:
+            output_path = manifest.get(path, {}).get("output")
+            if not output_path or not os.path.isfile(output_path):
+                continue
+            frame = self.read_results(output_path)
+            stem = os.path.splitext(os.path.basename(path))[0]
+            frame["experiment"] = stem + "/" + frame["experiment"].astype(str)
+            frames.append(frame)
+        if not frames:
+            return 0
+
+        combined = pd.concat(frames, ignore_index=True)
+        serializer = self.pipeline.serializer
+        with serializer.write_lock():
+            serializer.save_fitting_results(combined)
+            serializer.save_best_fit(combined)
+        return int(combined.shape[0])
+
+    # -------------------------------------------------------------------------
+    def load_completed_results(self) -> list[pd.DataFrame]:
+        """Read the results of every file recorded in the manifest."""
+        frames: list[pd.DataFrame] = []
+        for path, entry in self.load_manifest().items():
+            output_path = entry.get("output", "")
+            if not os.path.isfile(output_path):
+                logger.warning("Missing batch results for %s", path)
+                continue
+            frames.append(self.read_results(output_path))
+        return frames
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def read_results(output_path: str) -> pd.DataFrame:
+        frame = (
+            pd.read_parquet(output_path)
+            if output_path.endswith(".parquet")
+            else pd.read_csv(output_path)
+        )
+        # Measurement sequences were stored as JSON arrays by stringify_sequences.
+        for column in frame.columns:
+            if pd.api.types.is_numeric_dtype(frame[column]):
+                continue
+            frame[column] = frame[column].apply(
+                lambda value: json.loads(value)
+                if isinstance(value, str) and value.startswith("[")
+                else value
+            )
+        return frame
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def fingerprint(
+        path: str,
+        configuration: dict[str, dict[str, Any]],
+        batch_configuration: BatchConfiguration,
+    ) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        settings = {
+            "configuration": configuration,
+            "max_iterations": batch_configuration.max_iterations,
+            "optimization_method": ModelSolver.normalize_method(
+                batch_configuration.optimization_method
+            ),
+        }
+        digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_completed(manifest: dict[str, Any], path: str, fingerprint: str) -> bool:
+        entry = manifest.get(path)
+        return (
+            entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and os.path.isfile(entry.get("output", ""))
+        )
+
+    # -------------------------------------------------------------------------
+    def load_manifest(self) -> dict[str, Any]:
+        if not os.path.isfile(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable batch manifest: %s", exc)
+            return {}
+        files = data.get("files", {}) if isinstance(data, dict) else {}
+        return files if isinstance(files, dict) else {}
+
+    # -------------------------------------------------------------------------
+    def save_manifest(self, manifest: dict[str, Any]) -> None:
+        temporary_path = f"{self.manifest_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"files": manifest}, file, indent=2)
+        os.replace(temporary_path, self.manifest_path)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from ADSORFIT.server.utils.configurations import BootstrapSettings, server_settings
+from ADSORFIT.server.utils.jobs import CancellationToken
+from ADSORFIT.server.utils.services.models import AdsorptionModels
+
+# Levenberg-Marquardt damping of the first step and its admissible range; a
+# replicate whose damping exceeds the maximum cannot improve any further.
+BOOTSTRAP_INITIAL_DAMPING = 1e-3
+BOOTSTRAP_MIN_DAMPING = 1e-12
+BOOTSTRAP_MAX_DAMPING = 1e10
+
+
+###############################################################################
+class BootstrapEstimator:
+    """Percentile bootstrap confidence intervals of fitted model parameters.
+
+    All B resampled datasets are built at once as (B, N) matrices. Residual
+    resampling adds the centered, degrees-of-freedom corrected residuals of the
+    base fit, drawn with replacement, to its predicted curve on the measured
+    pressures; pairs resampling draws whole (pressure, uptake) points with
+    replacement, so every replicate has its own pressure grid.
+
+    Every replicate starts from the base optimum and is refitted by a batched
+    Levenberg-Marquardt solver: each iteration evaluates the model and its
+    analytic Jacobian for all unconverged replicates in vectorized passes and
+    solves the stacked K x K normal equations in one call. Steps are
+    projected onto the parameter bounds.
+    """
+
+    def __init__(
+        self,
+        collection: AdsorptionModels | None = None,
+        settings: BootstrapSettings | None = None,
+    ) -> None:
+        self.collection = collection or AdsorptionModels()
+        self.settings = settings or server_settings.fitting.bootstrap
+
+    # -------------------------------------------------------------------------
+    def resample(
+        self,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        predicted: np.ndarray,
+        parameter_count: int,
+        replicates: int,
+        generator: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Build the pressure grids and uptake targets of every replicate.
+
+        Return value:
+        Tuple of the pressure grid, (N,) for residual resampling or (B, N) for
+        pairs resampling, and the (B, N) resampled uptakes.
+        """
+        size = uptake.shape[0]
+        indices = generator.integers(0, size, size=(replicates, size))
+        if self.settings.resampling == "pairs":
+            return pressure[indices], uptake[indices]
+        residuals = uptake - predicted
+        residuals = (residuals - residuals.mean()) * np.sqrt(
+            size / (size - parameter_count)
+        )
+        return pressure, predicted[np.newaxis, :] + residuals[indices]
+
+    # -------------------------------------------------------------------------
+    def solve(
+        self,
+        model_name: str,
+        start: np.ndarray,
+        grid: np.ndarray,
+        targets: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        token: CancellationToken | None = None,
+        deadline: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Refit every replicate from ``start`` with a batched Levenberg-Marquardt.
+
+        Keyword arguments:
+        model_name -- Name of the adsorption model.
+        start -- Base optimum of shape (K,), the starting point of every replicate.
+        grid -- Pressure grid of shape (N,) or (B, N).
+        targets -- Resampled uptakes of shape (B, N).
+        lower -- Lower parameter bounds of shape (K,).
+        upper -- Upper parameter bounds of shape (K,).
+        token -- Optional cancellation token polled every iteration.
+        deadline -- Monotonic time after which the unconverged replicates are
+        abandoned.
+
+        Return value:
+        Tuple of the (B, K) fitted parameters and the (B,) boolean mask of the
+        converged replicates.
+        """
+        replicates = targets.shape[0]
+        width = start.shape[0]
+        params = np.repeat(start[np.newaxis, :], replicates, axis=0)
+        predicted = self.collection.evaluate(model_name, params, grid)
+        sse = np.sum((targets - predicted) ** 2, axis=1)
+        damping = np.full(replicates, BOOTSTRAP_INITIAL_DAMPING)
+        converged = np.zeros(replicates, dtype=bool)
+        active = np.isfinite(sse)
+        identity = np.eye(width)
+        for _ in range(self.settings.max_iterations):
+            if token is not None:
+                token.check()
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            rows = np.flatnonzero(active)
+            if rows.size == 0:
+                break
+            row_grid = grid[rows] if grid.ndim == 2 else grid
+            current = params[rows]
+            fitted = predicted[rows]
+            with np.errstate(all="ignore"):
+                jacobian = self.collection.jacobian(model_name, current, row_grid)
+                residuals = targets[rows] - fitted
+                normal = np.einsum("rnk,rnl->rkl", jacobian, jacobian)
+                gradient = np.einsum("rnk,rn->rk", jacobian, residuals)
+                diagonal = np.diagonal(normal, axis1=1, axis2=2)
+                # Marquardt scaling, with a floor keeping flat directions solvable.
+                floor = 1e-12 * np.max(diagonal, axis=1, keepdims=True) + 1e-300
+                system = normal + (
+                    (damping[rows, np.newaxis] * diagonal + floor)[:, :, np.newaxis]
+                    * identity
+                )
+            solvable = np.all(np.isfinite(system), axis=(1, 2)) & np.all(
+                np.isfinite(gradient), axis=1
+            )
+            step = np.zeros_like(current)
+            if np.any(solvable):
+                try:
+                    step[solvable] = np.linalg.solve(
+                        system[solvable], gradient[solvable][:, :, np.newaxis]
+                    )[:, :, 0]
+                except np.linalg.LinAlgError:
+                    step[solvable] = (
+                        np.linalg.pinv(system[solvable])
+                        @ gradient[solvable][:, :, np.newaxis]
+                    )[:, :, 0]
+            trial = np.clip(current + step, lower, upper)
+            trial_predicted = self.collection.evaluate(model_name, trial, row_grid)
+            trial_sse = np.sum((targets[rows] - trial_predicted) ** 2, axis=1)
+            accepted = solvable & np.isfinite(trial_sse) & (trial_sse <= sse[rows])
+
+            improvement = (sse[rows] - trial_sse) / np.maximum(sse[rows], 1e-300)
+            moved = np.abs(trial - current) > self.settings.tolerance * (
+                np.abs(current) + self.settings.tolerance
+            )
+            done = accepted & (
+                (improvement <= self.settings.tolerance) | ~np.any(moved, axis=1)
+            )
+            accepted_rows = rows[accepted]
+            params[accepted_rows] = trial[accepted]
+            predicted[accepted_rows] = trial_predicted[accepted]
+            sse[accepted_rows] = trial_sse[accepted]
+            damping[accepted_rows] = np.maximum(
+                damping[accepted_rows] / 3.0, BOOTSTRAP_MIN_DAMPING
+            )
+            rejected_rows = rows[~accepted]
+            damping[rejected_rows] *= 4.0
+            # No step improves a replicate sitting at its minimum, so the damping
+            # growing past its limit is a convergence test as well.
+            stalled = ~accepted & (damping[rows] > BOOTSTRAP_MAX_DAMPING)
+            converged[rows[done | stalled]] = True
+            active[rows[done | stalled | ~solvable]] = False
+        return params, converged
+
+    # -------------------------------------------------------------------------
+    def intervals(
+        self,
+        model_name: str,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        optimal: np.ndarray,
+        lower: list[float],
+        upper: list[float],
+        replicates: int,
+        token: CancellationToken | None = None,
+        deadline: float | None = None,
+    ) -> tuple[list[float], list[float]]:
+        """Compute percentile confidence intervals around a fitted optimum.
+
+        Keyword arguments:
+        model_name -- Name of the fitted adsorption model.
+        pressure -- Measured pressures of the experiment.
+        uptake -- Measured uptakes of the experiment.
+        optimal -- Fitted parameters, in model signature order.
+        lower -- Lower parameter bounds used by the fit.
+        upper -- Upper parameter bounds used by the fit.
+        replicates -- Number of bootstrap replicates.
+        token -- Optional cancellation token polled every solver iteration.
+        deadline -- Monotonic time after which the replicates are abandoned.
+
+        Return value:
+        Lower and upper interval bounds per parameter, NaN when too few replicates
+        converged or the experiment has no residual degrees of freedom.
+        """
+        width = optimal.shape[0]
+        missing = [np.nan] * width
+        size = uptake.shape[0]
+        if replicates <= 0 or size <= width or not np.all(np.isfinite(optimal)):
+            return missing, missing
+        lower_bounds = np.asarray(lower, dtype=np.float64)
+        upper_bounds = np.asarray(upper, dtype=np.float64)
+        predicted = self.collection.evaluate(model_name, optimal, pressure)[0]
+        if not np.all(np.isfinite(predicted)):
+            return missing, missing
+        generator = np.random.default_rng(self.settings.seed)
+        grid, targets = self.resample(
+            pressure, uptake, predicted, width, replicates, generator
+        )
+        params, converged = self.solve(
+            model_name,
+            optimal,
+            grid,
+            targets,
+            lower_bounds,
+            upper_bounds,
+            token,
+            deadline,
+        )
+        required = max(2, int(np.ceil(self.settings.min_success_fraction * replicates)))
+        if int(np.count_nonzero(converged)) < required:
+            return missing, missing
+        alpha = (1.0 - self.settings.confidence) / 2.0
+        bounds = np.quantile(params[converged], [alpha, 1.0 - alpha], axis=0)
+        return bounds[0].tolist(), bounds[1].tolist()
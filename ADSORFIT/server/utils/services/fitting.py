@@ -1,23 +1,60 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
 import json
+import os
+import time
 from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit, minimize
 
 from ADSORFIT.server.utils.configurations import server_settings
-from ADSORFIT.server.utils.constants import MODEL_PARAMETER_DEFAULTS
+from ADSORFIT.server.utils.constants import (
+    INITIALIZER_FILE,
+    METHOD_STATISTICS_FILE,
+    MODEL_PARAMETER_DEFAULTS,
+    SCREENER_FILE,
+)
+from ADSORFIT.server.utils.jobs import (
+    CancellationToken,
+    FitTimeBudgetExceeded,
+    FittingInterrupted,
+)
 from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.memory import PeakMemoryMonitor
+from ADSORFIT.server.utils.repository.checkpoints import (
+    FitCheckpoint,
+    compact_model_result,
+)
+from ADSORFIT.server.utils.repository.isotherms import IsothermStore
 from ADSORFIT.server.utils.repository.serializer import DataSerializer
+from ADSORFIT.server.utils.services.bootstrap import BootstrapEstimator
+from ADSORFIT.server.utils.services.globalfit import GlobalFitter
+from ADSORFIT.server.utils.services.initializers import (
+    InitialParameterPredictor,
+    isotherm_features,
+)
+from ADSORFIT.server.utils.services.methods import MethodStatistics
 from ADSORFIT.server.utils.services.models import AdsorptionModels
 from ADSORFIT.server.utils.services.processing import (
     AdsorptionDataProcessor,
     DatasetAdapter,
+    DatasetColumns,
+)
+from ADSORFIT.server.utils.services.results import (
+    FIT_STATUS_APPROXIMATE,
+    FIT_STATUS_FAILED,
+    FIT_STATUS_OK,
+    FIT_STATUS_SKIPPED,
+    FIT_STATUS_TIME_BUDGET,
+    FitResultSet,
+    RefinementReport,
 )
+from ADSORFIT.server.utils.services.screening import ModelScreener
+from ADSORFIT.server.utils.services.transforms import ParameterTransform
 
 SUPPORTED_OPTIMIZATION_METHODS: tuple[str, ...] = (
     "LSS",
@@ -25,9 +62,22 @@ SUPPORTED_OPTIMIZATION_METHODS: tuple[str, ...] = (
     "L-BFGS-B",
     "Nelder-Mead",
     "Powell",
+    "AUTO",
 )
 BOUNDS_COMPATIBLE_METHODS = {"L-BFGS-B", "Powell"}
+# Methods expected to return a covariance matrix; a non-finite one means the fit
+# is not trustworthy and the automatic method moves down its ladder.
+COVARIANCE_METHODS = {"LSS", "BFGS", "L-BFGS-B"}
 DEFAULT_OPTIMIZATION_METHOD = "LSS"
+AUTO_OPTIMIZATION_METHOD = "AUTO"
+# Share of a rank-deficient Jacobian's null space above which a parameter is
+# reported as not identifiable.
+COVARIANCE_NULL_SPACE_TOLERANCE = 1e-6
+# Optimal parameters, covariance, standard errors and predicted uptakes of a fit,
+# and whether the optimizer reported convergence rather than stopping at a limit.
+FitSolution = tuple[np.ndarray, np.ndarray | None, np.ndarray | None, np.ndarray, bool]
+# Result keys holding each normalized ranking metric.
+METRIC_RESULT_KEYS = {"AICc": "aicc", "AIC": "aic", "score": "score"}
 
 PARAMETER_ALIAS_MAP: dict[str, dict[str, str]] = {
     model_name: {} for model_name in MODEL_PARAMETER_DEFAULTS
@@ -57,6 +107,9 @@ PARAMETER_ALIAS_MAP["Sips"].update(
 class ModelSolver:
     def __init__(self) -> None:
         self.collection = AdsorptionModels()
+        self.bootstrap = BootstrapEstimator(self.collection)
+        # Trained predictors keyed by file path, with the modification time read.
+        self.predictors: dict[str, tuple[float, Any]] = {}
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -85,6 +138,11 @@ class ModelSolver:
         )
         return (aic, aicc)
 
+    # -------------------------------------------------------------------------
+    def model_parameters(self, model_name: str) -> list[str]:
+        signature = inspect.signature(self.collection.get_model(model_name))
+        return list(signature.parameters.keys())[1:]
+
     # -------------------------------------------------------------------------
     def single_experiment_fit(
         self,
@@ -94,6 +152,13 @@ class ModelSolver:
         configuration: dict[str, Any],
         max_iterations: int,
         optimization_method: str,
+        token: CancellationToken | None = None,
+        initial_guesses: dict[str, np.ndarray] | None = None,
+        skip_reasons: dict[str, str] | None = None,
+        tolerance: float | None = None,
+        multistart_top_k: int | None = None,
+        method_statistics: MethodStatistics | None = None,
+        bootstrap_replicates: int = 0,
     ) -> dict[str, dict[str, Any]]:
         """Fit every configured model against a single experiment dataset.
 
@@ -104,10 +169,25 @@ class ModelSolver:
         configuration -- Per-model fitting configuration, including bounds and initial
         guesses.
         max_iterations -- Maximum number of solver evaluations allowed by the optimizer.
+        token -- Optional cancellation token; raises :class:`FittingInterrupted` when
+        the job is stopped and bounds each model fit by its time budget.
+        initial_guesses -- Optional learned starting parameters per model, used in
+        place of the configured initial values when they fit the data better.
+        skip_reasons -- Models excluded by pre-screening, mapped to the reason; they
+        are recorded with the ``skipped`` status instead of being fitted.
+        tolerance -- Optional convergence tolerance replacing the solver defaults.
+        multistart_top_k -- Optional number of multi-start candidates refined,
+        replacing ``fitting.multistart.top_k``.
+        method_statistics -- History ordering the ladder of the ``AUTO`` method and
+        receiving its attempts.
+        bootstrap_replicates -- Number of bootstrap replicates behind the parameter
+        confidence intervals, 0 to skip them.
 
         Return value:
         Dictionary keyed by model names containing optimal parameters, errors, and
-        diagnostics.
+        diagnostics. ``optimization_method`` holds the method that produced the fit;
+        ``ci_lower`` and ``ci_upper`` hold the bootstrap confidence intervals, NaN
+        when they were not computed.
         """
         results: dict[str, dict[str, Any]] = {}
         evaluations = max(1, int(max_iterations))
@@ -116,8 +196,22 @@ class ModelSolver:
         normalized_method = self.normalize_method(optimization_method)
         for model_name, model_config in configuration.items():
             model = self.collection.get_model(model_name)
-            signature = inspect.signature(model)
-            param_names = list(signature.parameters.keys())[1:]
+            param_names = self.model_parameters(model_name)
+            deadline = None
+            skip_reason = (skip_reasons or {}).get(model_name)
+            if skip_reason is not None:
+                results[model_name] = self.empty_result(
+                    param_names, sample_size, normalized_method, FIT_STATUS_SKIPPED
+                )
+                results[model_name]["skip_reason"] = skip_reason
+                continue
+            fit_start = time.perf_counter()
+            if token is not None:
+                token.check()
+                deadline = token.fit_deadline()
+                # Every evaluation polls the token, so a cancel request or an
+                # exhausted budget interrupts the optimizer instead of waiting for it.
+                model = token.guard(model, deadline)
             # ``curve_fit`` expects ordered arrays for initial guess and bounds, so we
             # align configuration dictionaries with the model signature parameters.
             initial = [
@@ -138,29 +232,55 @@ class ModelSolver:
                 )
                 for param in param_names
             ]
+            learned = (initial_guesses or {}).get(model_name)
+            if learned is not None:
+                initial = self.select_initial(
+                    model_name, pressure, uptake, initial, learned, lower, upper
+                )
+
+            starts = int(model_config.get("starts", 0) or 0)
 
             try:
-                optimal_params, covariance, errors, predicted = self.solve_model(
-                    normalized_method,
-                    model,
-                    pressure,
-                    uptake,
-                    initial,
-                    lower,
-                    upper,
-                    evaluations,
+                method_used = normalized_method
+                if normalized_method == AUTO_OPTIMIZATION_METHOD:
+                    solution, method_used = self.solve_with_ladder(
+                        model_name,
+                        model,
+                        pressure,
+                        uptake,
+                        initial,
+                        lower,
+                        upper,
+                        evaluations,
+                        starts,
+                        tolerance,
+                        multistart_top_k,
+                        method_statistics,
+                    )
+                else:
+                    solution = self.solve_configured(
+                        normalized_method,
+                        model_name,
+                        model,
+                        pressure,
+                        uptake,
+                        initial,
+                        lower,
+                        upper,
+                        evaluations,
+                        starts,
+                        tolerance,
+                        multistart_top_k,
+                    )
+                optimal_params, _, _, predicted, _ = solution
+                # Optimizers report covariances of varying quality, or none at all,
+                # so every fit is given the same Jacobian-based estimate.
+                covariance, errors = self.parameter_covariance(
+                    model_name, optimal_params, pressure, uptake, predicted
                 )
                 optimal_list = optimal_params.tolist()
                 covariance_list = covariance.tolist() if covariance is not None else None
-                error_list = (
-                    errors.tolist()
-                    if isinstance(errors, np.ndarray)
-                    else errors
-                )
-                if error_list is None:
-                    error_list = [np.nan] * len(param_names)
-                else:
-                    error_list = list(error_list)
+                error_list = errors.tolist()
                 score = float(np.sum((uptake - predicted) ** 2, dtype=np.float64))
                 parameter_count = len(param_names)
                 aic, aicc = self.compute_information_metrics(
@@ -168,43 +288,274 @@ class ModelSolver:
                     sample_size,
                     parameter_count,
                 )
+                ci_lower, ci_upper = self.bootstrap.intervals(
+                    model_name,
+                    pressure,
+                    uptake,
+                    optimal_params,
+                    lower,
+                    upper,
+                    bootstrap_replicates,
+                    token,
+                    deadline,
+                )
                 results[model_name] = {
                     "optimal_params": optimal_list,
                     "covariance": covariance_list,
                     "errors": error_list,
+                    "ci_lower": ci_lower,
+                    "ci_upper": ci_upper,
                     "score": score,
                     "aic": aic,
                     "aicc": aicc,
-                    "optimization_method": normalized_method,
+                    "optimization_method": method_used,
                     "arguments": param_names,
                     "measurement_count": sample_size,
                     "parameter_count": parameter_count,
+                    "status": FIT_STATUS_OK,
                 }
+            except FittingInterrupted:
+                raise
             except Exception as exc:  # noqa: BLE001
-                logger.exception(
-                    "Failed to fit experiment %s with model %s",
-                    experiment_name,
-                    model_name,
+                if isinstance(exc, FitTimeBudgetExceeded):
+                    logger.warning(
+                        "Fit of experiment %s with model %s exceeded its time budget",
+                        experiment_name,
+                        model_name,
+                    )
+                else:
+                    logger.exception(
+                        "Failed to fit experiment %s with model %s",
+                        experiment_name,
+                        model_name,
+                    )
+                results[model_name] = self.empty_result(
+                    param_names,
+                    sample_size,
+                    normalized_method,
+                    FIT_STATUS_TIME_BUDGET
+                    if isinstance(exc, FitTimeBudgetExceeded)
+                    else FIT_STATUS_FAILED,
                 )
-                results[model_name] = {
-                    "optimal_params": [np.nan] * len(param_names),
-                    "covariance": None,
-                    "errors": [np.nan] * len(param_names),
-                    "score": np.nan,
-                    "aic": np.nan,
-                    "aicc": np.nan,
-                    "optimization_method": normalized_method,
-                    "arguments": param_names,
-                    "measurement_count": sample_size,
-                    "parameter_count": len(param_names),
-                    "exception": exc,
+                results[model_name]["exception"] = exc
+            results[model_name]["elapsed"] = time.perf_counter() - fit_start
+        return results
+
+    # -------------------------------------------------------------------------
+    def two_tier_experiment_fit(
+        self,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        experiment_name: str,
+        configuration: dict[str, Any],
+        max_iterations: int,
+        optimization_method: str,
+        report: RefinementReport,
+        token: CancellationToken | None = None,
+        initial_guesses: dict[str, np.ndarray] | None = None,
+        skip_reasons: dict[str, str] | None = None,
+        method_statistics: MethodStatistics | None = None,
+        bootstrap_replicates: int = 0,
+    ) -> dict[str, dict[str, Any]]:
+        """Screen every model cheaply, then refit the most promising ones.
+
+        All models are first fitted with the loose tolerance, small evaluation
+        budget and reduced multi-start refinements of ``fitting.two_tier``. The
+        ``refine_top`` models ranked best by the approximate metric, plus models
+        whose screening fit failed, are then
+        refitted at full precision from the screening solution. The other models
+        keep their screening results with the ``approximate`` status. Bootstrap
+        confidence intervals are only computed for the refined fits.
+
+        Keyword arguments:
+        report -- Report receiving the timings and ranking changes.
+        Other arguments as in :meth:`single_experiment_fit`.
+
+        Return value:
+        Dictionary keyed by model names, as returned by
+        :meth:`single_experiment_fit`.
+        """
+        settings = server_settings.fitting.two_tier
+        metric = DatasetAdapter.normalize_metric(
+            server_settings.fitting.best_model_metric
+        )
+        screened = self.single_experiment_fit(
+            pressure,
+            uptake,
+            experiment_name,
+            configuration,
+            min(settings.screen_iterations, max_iterations),
+            optimization_method,
+            token=token,
+            initial_guesses=initial_guesses,
+            skip_reasons=skip_reasons,
+            tolerance=settings.screen_tolerance,
+            multistart_top_k=settings.screen_top_k,
+            method_statistics=method_statistics,
+        )
+        screened_ranking = self.rank_results(screened, metric, settings.refine_top)
+        refine_configuration: dict[str, Any] = {}
+        for model_name, data in screened.items():
+            if data["status"] == FIT_STATUS_FAILED:
+                # A budget too small to converge must not rule the model out.
+                refine_configuration[model_name] = configuration[model_name]
+            elif model_name in screened_ranking:
+                refine_configuration[model_name] = {
+                    **configuration[model_name],
+                    "initial": dict(zip(data["arguments"], data["optimal_params"])),
+                    # The screening tier already explored the starting points.
+                    "starts": 0,
                 }
+        refined = self.single_experiment_fit(
+            pressure,
+            uptake,
+            experiment_name,
+            refine_configuration,
+            max_iterations,
+            optimization_method,
+            token=token,
+            initial_guesses=initial_guesses,
+            method_statistics=method_statistics,
+            bootstrap_replicates=bootstrap_replicates,
+        )
+
+        results: dict[str, dict[str, Any]] = {}
+        for model_name, data in screened.items():
+            refined_data = refined.get(model_name)
+            if refined_data is not None and (
+                refined_data["status"] == FIT_STATUS_OK
+                or data["status"] != FIT_STATUS_OK
+            ):
+                results[model_name] = refined_data
+            elif data["status"] == FIT_STATUS_OK:
+                results[model_name] = {**data, "status": FIT_STATUS_APPROXIMATE}
+            else:
+                results[model_name] = data
+        report.record(
+            str(experiment_name),
+            screened,
+            refined,
+            screened_ranking,
+            self.rank_results(results, metric, settings.refine_top),
+        )
         return results
 
     # -------------------------------------------------------------------------
-    def solve_model(
+    @staticmethod
+    def rank_results(
+        results: dict[str, dict[str, Any]], metric: str, count: int
+    ) -> list[str | None]:
+        key = METRIC_RESULT_KEYS[metric]
+        values = np.asarray(
+            [[FitResultSet.as_float(data.get(key)) for data in results.values()]],
+            dtype=np.float64,
+        )
+        names = np.asarray(list(results), dtype=object)
+        return DatasetAdapter.rank_models(values, names, count)[0].tolist()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def empty_result(
+        param_names: list[str], sample_size: int, method: str, status: str
+    ) -> dict[str, Any]:
+        """Build the result of a model that produced no parameters."""
+        return {
+            "optimal_params": [np.nan] * len(param_names),
+            "covariance": None,
+            "errors": [np.nan] * len(param_names),
+            "ci_lower": [np.nan] * len(param_names),
+            "ci_upper": [np.nan] * len(param_names),
+            "score": np.nan,
+            "aic": np.nan,
+            "aicc": np.nan,
+            "optimization_method": method,
+            "arguments": param_names,
+            "measurement_count": sample_size,
+            "parameter_count": len(param_names),
+            "status": status,
+        }
+
+    # -------------------------------------------------------------------------
+    def select_initial(
+        self,
+        model_name: str,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        initial: list[float],
+        learned: np.ndarray,
+        lower: list[float],
+        upper: list[float],
+    ) -> list[float]:
+        """Return the learned starting point when it beats the configured one.
+
+        Both candidates are scored by their sum of squared residuals before any
+        solver iteration, so a poor prediction costs two model evaluations and
+        leaves the fit exactly as it would have been without it.
+        """
+        learned = np.clip(np.asarray(learned, dtype=np.float64), lower, upper)
+        if not np.all(np.isfinite(learned)):
+            return initial
+        candidates = np.vstack(
+            [np.clip(np.asarray(initial, dtype=np.float64), lower, upper), learned]
+        )
+        scores = self.score_candidates(model_name, pressure, uptake, candidates)
+        if scores[1] < scores[0]:
+            return learned.tolist()
+        return initial
+
+    # -------------------------------------------------------------------------
+    def load_predictor(self, path: str, loader: Callable[[str], Any]) -> Any:
+        # Reloaded whenever a training script replaced the file since last use.
+        try:
+            modified = os.path.getmtime(path)
+        except OSError:
+            self.predictors.pop(path, None)
+            return None
+        cached = self.predictors.get(path)
+        if cached is None or cached[0] != modified:
+            cached = (modified, loader(path))
+            self.predictors[path] = cached
+        return cached[1]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def experiment_features(
+        dataset: pd.DataFrame, pressure_col: str, uptake_col: str
+    ) -> np.ndarray:
+        return np.vstack(
+            [
+                isotherm_features(pressure, uptake)
+                for pressure, uptake in zip(dataset[pressure_col], dataset[uptake_col])
+            ]
+        )
+
+    # -------------------------------------------------------------------------
+    def predict_initial_guesses(
+        self,
+        initializer: InitialParameterPredictor,
+        features: np.ndarray,
+        configuration: dict[str, Any],
+    ) -> dict[str, np.ndarray]:
+        """Predict learned starting parameters for every experiment and model.
+
+        Return value:
+        Dictionary mapping each model with a trained predictor to an array of shape
+        (experiments, parameters), in dataset order.
+        """
+        guesses: dict[str, np.ndarray] = {}
+        for model_name in configuration:
+            predicted = initializer.predict(
+                model_name, self.model_parameters(model_name), features
+            )
+            if predicted is not None:
+                guesses[model_name] = predicted
+        return guesses
+
+    # -------------------------------------------------------------------------
+    def solve_configured(
         self,
         method: str,
+        model_name: str,
         model: Callable[..., np.ndarray],
         pressure: np.ndarray,
         uptake: np.ndarray,
@@ -212,10 +563,14 @@ class ModelSolver:
         lower: list[float],
         upper: list[float],
         evaluations: int,
-    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None, np.ndarray]:
-        normalized_method = self.normalize_method(method)
-        if normalized_method == "LSS":
-            return self.solve_with_curve_fit(
+        starts: int,
+        tolerance: float | None = None,
+        top_k: int | None = None,
+    ) -> FitSolution:
+        if starts > 0:
+            return self.solve_multistart(
+                method,
+                model_name,
                 model,
                 pressure,
                 uptake,
@@ -223,9 +578,12 @@ class ModelSolver:
                 lower,
                 upper,
                 evaluations,
+                starts,
+                tolerance,
+                top_k,
             )
-        return self.solve_with_minimize(
-            normalized_method,
+        return self.solve_model(
+            method,
             model,
             pressure,
             uptake,
@@ -233,8 +591,348 @@ class ModelSolver:
             lower,
             upper,
             evaluations,
+            tolerance,
         )
 
+    # -------------------------------------------------------------------------
+    def solve_with_ladder(
+        self,
+        model_name: str,
+        model: Callable[..., np.ndarray],
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        initial: list[float],
+        lower: list[float],
+        upper: list[float],
+        evaluations: int,
+        starts: int,
+        tolerance: float | None = None,
+        top_k: int | None = None,
+        statistics: MethodStatistics | None = None,
+    ) -> tuple[FitSolution, str]:
+        """Fit a model with the ``AUTO`` method, moving down a ladder of methods.
+
+        The methods of ``fitting.auto_method.ladder`` are tried in turn, the one
+        with the best history first, until one reports convergence with finite
+        predictions and a finite covariance (for methods that estimate one). A run
+        stopped by its iteration or evaluation limit counts as a failed attempt
+        and is only kept as a fallback. All attempts share one budget of model
+        evaluations, so a fallback gets what the failed attempts left rather than
+        a fresh budget.
+
+        Keyword arguments:
+        statistics -- Method history, updated with every attempt.
+        Other arguments as in :meth:`solve_configured`.
+
+        Return value:
+        Tuple of the solution and the name of the method that produced it. When no
+        method converges, the usable solution with the lowest residual sum of
+        squares is returned, and the last error is raised if there is none.
+        """
+        settings = server_settings.fitting.auto_method
+        ladder = [
+            method
+            for method in dict.fromkeys(
+                self.normalize_method(method) for method in settings.ladder
+            )
+            if method != AUTO_OPTIMIZATION_METHOD
+        ] or [DEFAULT_OPTIMIZATION_METHOD]
+        if statistics is not None and settings.use_history:
+            ladder = statistics.order(model_name, ladder, settings.min_attempts)
+
+        # A finite-difference step costs one evaluation per parameter, plus one.
+        step_cost = len(initial) + 1
+        refinements = 1
+        if starts > 0:
+            multistart_top_k = server_settings.fitting.multistart.top_k
+            refinements = multistart_top_k if top_k is None else max(1, top_k)
+        budget = evaluations * step_cost * refinements
+        calls = 0
+
+        def counted(*args: Any) -> np.ndarray:
+            nonlocal calls
+            calls += 1
+            return model(*args)
+
+        best: tuple[Any, str, float] | None = None
+        last_error: Exception | None = None
+        for method in ladder:
+            remaining = budget - calls
+            if remaining < step_cost:
+                break
+            attempt_start = time.perf_counter()
+            try:
+                solution = self.solve_configured(
+                    method,
+                    model_name,
+                    counted,
+                    pressure,
+                    uptake,
+                    initial,
+                    lower,
+                    upper,
+                    max(1, evaluations * remaining // budget),
+                    starts,
+                    tolerance,
+                    top_k,
+                )
+            except FittingInterrupted:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                if statistics is not None:
+                    statistics.record(
+                        model_name, method, False, time.perf_counter() - attempt_start
+                    )
+                if isinstance(exc, FitTimeBudgetExceeded):
+                    raise
+                logger.debug("%s fit with %s failed: %s", model_name, method, exc)
+                last_error = exc
+                continue
+
+            converged = self.is_converged(method, solution)
+            if statistics is not None:
+                statistics.record(
+                    model_name, method, converged, time.perf_counter() - attempt_start
+                )
+            if converged:
+                return solution, method
+            score = float(np.sum((uptake - solution[3]) ** 2, dtype=np.float64))
+            if np.isfinite(score) and (best is None or score < best[2]):
+                best = (solution, method, score)
+
+        if best is not None:
+            return best[0], best[1]
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("The evaluation budget does not allow any fit attempt.")
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_converged(
+        method: str,
+        solution: FitSolution,
+    ) -> bool:
+        optimal_params, covariance, _, predicted, converged = solution
+        # Runs stopped by an iteration or evaluation limit are failed attempts,
+        # whatever the quality of their predictions or covariance.
+        if not converged:
+            return False
+        if not (np.all(np.isfinite(optimal_params)) and np.all(np.isfinite(predicted))):
+            return False
+        if method not in COVARIANCE_METHODS:
+            return True
+        return covariance is not None and bool(np.all(np.isfinite(covariance)))
+
+    # -------------------------------------------------------------------------
+    def solve_model(
+        self,
+        method: str,
+        model: Callable[..., np.ndarray],
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        initial: list[float],
+        lower: list[float],
+        upper: list[float],
+        evaluations: int,
+        tolerance: float | None = None,
+    ) -> FitSolution:
+        """Fit one model with one optimization method.
+
+        With ``fitting.solver_scaling``, the optimizers work on uptakes divided by
+        the largest measured uptake, so residuals and their sum of squares are of
+        order one whatever the units of the dataset, and the fixed tolerances of
+        the optimizers mean the same thing for every experiment. Least squares
+        also scales every parameter by its Jacobian column (``x_scale="jac"``),
+        which evens out rate constants and capacities spanning many decades.
+        Predictions and covariances are mapped back to the measured units.
+        """
+        normalized_method = self.normalize_method(method)
+        scale = (
+            self.uptake_scale(uptake)
+            if server_settings.fitting.solver_scaling
+            else 1.0
+        )
+
+        def scaled_model(pressure: np.ndarray, *params: Any) -> np.ndarray:
+            return model(pressure, *params) / scale
+
+        solved_model = model if scale == 1.0 else scaled_model
+        if normalized_method == "LSS":
+            solution = self.solve_with_curve_fit(
+                solved_model,
+                pressure,
+                uptake / scale,
+                initial,
+                lower,
+                upper,
+                evaluations,
+                tolerance,
+                x_scale="jac" if server_settings.fitting.solver_scaling else None,
+            )
+        else:
+            solution = self.solve_with_minimize(
+                normalized_method,
+                solved_model,
+                pressure,
+                uptake / scale,
+                initial,
+                lower,
+                upper,
+                evaluations,
+                tolerance,
+            )
+        if scale == 1.0:
+            return solution
+        optimal, covariance, errors, predicted, converged = solution
+        if covariance is not None and normalized_method != "LSS":
+            # The inverse Hessian of the scaled sum of squares is scale^2 larger,
+            # while the least-squares covariance, estimated from the residual
+            # variance, does not depend on the uptake units.
+            covariance = covariance / (scale * scale)
+            errors = np.sqrt(np.diag(covariance)).astype(float)
+        return optimal, covariance, errors, predicted * scale, converged
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def uptake_scale(uptake: np.ndarray) -> float:
+        scale = float(np.max(np.abs(uptake))) if uptake.size else 0.0
+        return scale if np.isfinite(scale) and scale > 0.0 else 1.0
+
+    # -------------------------------------------------------------------------
+    def solve_multistart(
+        self,
+        method: str,
+        model_name: str,
+        model: Callable[..., np.ndarray],
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        initial: list[float],
+        lower: list[float],
+        upper: list[float],
+        evaluations: int,
+        starts: int,
+        tolerance: float | None = None,
+        top_k: int | None = None,
+    ) -> FitSolution:
+        """Fit a model from the most promising of many quasi-random starting points.
+
+        Keyword arguments:
+        method -- Local optimization method used to refine the selected starts.
+        model_name -- Name of the adsorption model, used for batch evaluation.
+        model -- Adsorption model callable.
+        pressure -- Pressure observations expressed as a NumPy array.
+        uptake -- Measured uptakes corresponding to the pressure values.
+        initial -- Configured initial guess, always kept among the candidates.
+        lower -- Lower parameter bounds.
+        upper -- Upper parameter bounds.
+        evaluations -- Evaluation budget granted to each local refinement.
+        starts -- Number of candidate starting points drawn within the bounds.
+        tolerance -- Optional convergence tolerance of the local refinements.
+        top_k -- Number of candidates refined, ``fitting.multistart.top_k`` if None.
+
+        Return value:
+        Solution tuple of the refinement reaching the lowest residual sum of squares.
+        """
+        multistart_settings = server_settings.fitting.multistart
+        lower_bounds = np.asarray(lower, dtype=np.float64)
+        upper_bounds = np.asarray(upper, dtype=np.float64)
+        initial_guess = np.clip(
+            np.asarray(initial, dtype=np.float64), lower_bounds, upper_bounds
+        )
+        candidates = np.vstack(
+            [
+                initial_guess,
+                self.sample_candidates(
+                    lower_bounds,
+                    upper_bounds,
+                    initial_guess,
+                    starts,
+                    multistart_settings.sampler,
+                    multistart_settings.seed,
+                ),
+            ]
+        )
+        # Candidates are scored in one broadcast evaluation; only the best few are
+        # handed to the (much more expensive) local optimizer.
+        scores = self.score_candidates(model_name, pressure, uptake, candidates)
+        refinements = multistart_settings.top_k if top_k is None else max(1, top_k)
+        selected = np.argsort(scores, kind="stable")[:refinements]
+
+        best_solution = None
+        best_score = np.inf
+        last_error: Exception | None = None
+        for index in selected:
+            try:
+                solution = self.solve_model(
+                    method,
+                    model,
+                    pressure,
+                    uptake,
+                    candidates[index].tolist(),
+                    lower,
+                    upper,
+                    evaluations,
+                    tolerance,
+                )
+            except FittingInterrupted:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                # A refinement that ran out of time still leaves earlier, completed
+                # refinements as valid answers.
+                last_error = exc
+                continue
+            score = float(np.sum((uptake - solution[3]) ** 2, dtype=np.float64))
+            if best_solution is None or score < best_score:
+                best_solution, best_score = solution, score
+
+        if best_solution is None:
+            if last_error is not None:
+                raise last_error
+            raise RuntimeError("No multi-start candidate could be refined.")
+        return best_solution
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sample_candidates(
+        lower: np.ndarray,
+        upper: np.ndarray,
+        fallback: np.ndarray,
+        count: int,
+        sampler: str,
+        seed: int,
+    ) -> np.ndarray:
+        from scipy.stats import qmc
+
+        dimensions = int(lower.shape[0])
+        if sampler == "lhs":
+            unit = qmc.LatinHypercube(d=dimensions, seed=seed).random(count)
+        else:
+            # Sobol sequences are balanced for powers of two, so the draw is
+            # rounded up and then cut to the requested number of starts, which
+            # keeps the cost of scoring and refinement tied to ``starts``.
+            exponent = int(np.ceil(np.log2(max(count, 1))))
+            unit = qmc.Sobol(d=dimensions, scramble=True, seed=seed).random_base2(
+                exponent
+            )[:count]
+        transform = ParameterTransform(lower, upper)
+        return transform.from_unit(unit, fallback)
+
+    # -------------------------------------------------------------------------
+    def score_candidates(
+        self,
+        model_name: str,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        candidates: np.ndarray,
+    ) -> np.ndarray:
+        predicted = self.collection.evaluate(model_name, candidates, pressure)
+        # The prediction buffer is reused in place to hold the squared residuals.
+        with np.errstate(all="ignore"):
+            np.subtract(uptake, predicted, out=predicted)
+            np.square(predicted, out=predicted)
+            scores = np.sum(predicted, axis=1, dtype=np.float64)
+        return np.where(np.isfinite(scores), scores, np.inf)
+
     # -------------------------------------------------------------------------
     def solve_with_curve_fit(
         self,
@@ -245,7 +943,21 @@ class ModelSolver:
         lower: list[float],
         upper: list[float],
         evaluations: int,
-    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None, np.ndarray]:
+        tolerance: float | None = None,
+        x_scale: str | np.ndarray | None = None,
+    ) -> FitSolution:
+        # SciPy is imported on first use (or by the startup warm-up) to keep module
+        # import cheap for workers, tests and command line tools.
+        from scipy.optimize import curve_fit
+
+        # ``None`` would disable a stopping criterion, so defaults are left alone.
+        options: dict[str, Any] = (
+            {}
+            if tolerance is None
+            else {"ftol": tolerance, "xtol": tolerance, "gtol": tolerance}
+        )
+        if x_scale is not None:
+            options["x_scale"] = x_scale
         optimal_params, covariance = curve_fit(
             model,
             pressure,
@@ -255,6 +967,7 @@ class ModelSolver:
             maxfev=evaluations,
             check_finite=True,
             absolute_sigma=False,
+            **options,
         )
         optimal_array = np.asarray(optimal_params, dtype=np.float64)
         covariance_array = (
@@ -266,7 +979,8 @@ class ModelSolver:
             if covariance_array is not None
             else None
         )
-        return optimal_array, covariance_array, errors, predicted
+        # ``curve_fit`` raises instead of returning when the solver does not converge.
+        return optimal_array, covariance_array, errors, predicted, True
 
     # -------------------------------------------------------------------------
     def solve_with_minimize(
@@ -279,15 +993,35 @@ class ModelSolver:
         lower: list[float],
         upper: list[float],
         evaluations: int,
-    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None, np.ndarray]:
+        tolerance: float | None = None,
+    ) -> FitSolution:
+        from scipy.optimize import minimize
+
         lower_bounds = np.asarray(lower, dtype=np.float64)
         upper_bounds = np.asarray(upper, dtype=np.float64)
         initial_guess = np.asarray(initial, dtype=np.float64)
         clipped_initial = np.clip(initial_guess, lower_bounds, upper_bounds)
 
+        # Methods without native bound support search over a smooth
+        # reparameterization of the box, which (unlike clipping) keeps gradients
+        # informative near the bounds.
+        transform = (
+            None
+            if method in BOUNDS_COMPATIBLE_METHODS
+            else ParameterTransform(lower_bounds, upper_bounds)
+        )
+
         def project(params: np.ndarray) -> np.ndarray:
+            if transform is not None:
+                return transform.to_external(params)
             return np.clip(params, lower_bounds, upper_bounds)
 
+        start = (
+            clipped_initial
+            if transform is None
+            else transform.to_internal(clipped_initial)
+        )
+
         residual_scale = float(np.sum(uptake * uptake, dtype=np.float64))
         penalty = max(1.0, residual_scale) * 1e6
 
@@ -306,38 +1040,60 @@ class ModelSolver:
         if method in BOUNDS_COMPATIBLE_METHODS:
             bounds = list(zip(lower_bounds, upper_bounds))
 
-        options = {"maxiter": evaluations}
+        options: dict[str, Any] = {"maxiter": evaluations}
         evaluations_per_param = evaluations * max(1, len(initial_guess))
         if method == "L-BFGS-B":
             options["maxfun"] = evaluations_per_param
         if method in {"Powell", "Nelder-Mead"}:
             options["maxfev"] = evaluations_per_param
+        if method == "Nelder-Mead" and transform is not None:
+            options["initial_simplex"] = transform.initial_simplex(start)
 
         result = minimize(
             objective,
-            clipped_initial,
+            start,
             method=method,
             bounds=bounds,
             options=options,
+            tol=tolerance,
         )
+        if method == "Nelder-Mead" and transform is not None:
+            # A simplex that collapsed along a flat direction stops early, so the
+            # search restarts once from its optimum with a fresh simplex, within
+            # the evaluations left by the first run.
+            remaining = evaluations_per_param - int(getattr(result, "nfev", 0))
+            if remaining > 0 and np.all(np.isfinite(result.x)):
+                options["maxfev"] = remaining
+                options["initial_simplex"] = transform.initial_simplex(result.x)
+                restarted = minimize(
+                    objective,
+                    result.x,
+                    method=method,
+                    options=options,
+                    tol=tolerance,
+                )
+                if restarted.fun <= result.fun:
+                    result = restarted
         if not result.success:
             logger.warning(
                 "%s optimization did not converge: %s", method, result.message
             )
 
-        optimal = np.asarray(result.x, dtype=np.float64)
-        optimal = project(optimal)
+        solution = np.asarray(result.x, dtype=np.float64)
+        optimal = project(solution)
         with np.errstate(all="ignore"):
             predicted = model(pressure, *optimal)
         if not np.all(np.isfinite(predicted)):
             predicted = np.full_like(pressure, np.nan, dtype=np.float64)
         covariance = self.extract_covariance_matrix(result)
+        if transform is not None:
+            covariance = transform.covariance_to_external(solution, covariance)
         errors = (
             np.sqrt(np.diag(covariance)).astype(float)
             if covariance is not None
             else None
         )
-        return optimal, covariance, errors, predicted
+        return optimal, covariance, errors, predicted, bool(result.success)
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -365,6 +1121,58 @@ class ModelSolver:
             return None
         return covariance
 
+    # -------------------------------------------------------------------------
+    def parameter_covariance(
+        self,
+        model_name: str,
+        optimal: np.ndarray,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        predicted: np.ndarray,
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Estimate the parameter covariance of a fit from its Jacobian.
+
+        The covariance s^2 (J^T J)^-1 uses the analytic Jacobian J at the optimum
+        and the residual variance s^2 = SSE / (N - K), so every optimization method
+        gets the same estimate as a least-squares fit. (J^T J)^-1 is built from the
+        singular value decomposition of J. Singular values below the numerical
+        rank threshold are dropped; parameters with a share of the dropped
+        directions are not identifiable and get NaN variances.
+
+        Keyword arguments:
+        model_name -- Name of the fitted adsorption model.
+        optimal -- Fitted parameters, in model signature order.
+        pressure -- Measured pressures of the experiment.
+        uptake -- Measured uptakes of the experiment.
+        predicted -- Model uptakes at the optimum.
+
+        Return value:
+        Tuple of the (K, K) covariance matrix, None when it cannot be estimated,
+        and the (K,) standard errors, NaN where unavailable.
+        """
+        width = optimal.shape[0]
+        missing = np.full(width, np.nan)
+        dof = uptake.shape[0] - width
+        if dof <= 0:
+            return None, missing
+        jacobian = self.collection.jacobian(model_name, optimal, pressure)[0]
+        residuals = uptake - predicted
+        if not (np.all(np.isfinite(jacobian)) and np.all(np.isfinite(residuals))):
+            return None, missing
+        _, singular, vectors = np.linalg.svd(jacobian, full_matrices=False)
+        threshold = np.finfo(np.float64).eps * max(jacobian.shape) * singular[0]
+        kept = singular > threshold
+        if not np.any(kept):
+            return None, missing
+        variance = float(np.dot(residuals, residuals)) / dof
+        basis = vectors[kept]
+        covariance = variance * (basis.T / singular[kept] ** 2) @ basis
+        dropped = np.sum(vectors[~kept] ** 2, axis=0)
+        unidentified = dropped > COVARIANCE_NULL_SPACE_TOLERANCE
+        covariance[unidentified, :] = np.nan
+        covariance[:, unidentified] = np.nan
+        return covariance, np.sqrt(np.diag(covariance))
+
     # -------------------------------------------------------------------------
     def bulk_data_fitting(
         self,
@@ -375,31 +1183,140 @@ class ModelSolver:
         max_iterations: int,
         optimization_method: str,
         progress_callback: Callable[[int, int], None] | None = None,
-    ) -> dict[str, list[dict[str, Any]]]:
-        """Iterate over the dataset and fit every experiment with the configured models."""
-        results: dict[str, list[dict[str, Any]]] = {
-            model: [] for model in configuration.keys()
-        }
+        result_callback: Callable[[int, str, dict[str, dict[str, Any]]], None]
+        | None = None,
+        token: CancellationToken | None = None,
+        checkpoint: FitCheckpoint | None = None,
+        refinement: RefinementReport | None = None,
+        bootstrap_replicates: int = 0,
+    ) -> FitResultSet:
+        """Iterate over the dataset and fit every experiment with the configured models.
+
+        Results are written row by row into a :class:`FitResultSet`. When ``token``
+        stops the job, fitting ends early and only the experiments completed so far
+        are filled in, in dataset order. With a ``checkpoint``, every finished
+        experiment is appended to it and experiments already recorded by an earlier
+        attempt of the same run are not fitted again. With a ``refinement`` report,
+        experiments are fitted with :meth:`two_tier_experiment_fit`. Runs with the
+        ``AUTO`` method add their attempts to the stored method statistics. A
+        positive ``bootstrap_replicates`` adds bootstrap confidence intervals to
+        every successful fit.
+        """
         total_experiments = dataset.shape[0]
+        results = FitResultSet(
+            {model: self.model_parameters(model) for model in configuration},
+            total_experiments,
+        )
         normalized_method = self.normalize_method(optimization_method)
-        for index, row in dataset.iterrows():
-            pressure = np.asarray(row[pressure_col], dtype=np.float64)
-            uptake = np.asarray(row[uptake_col], dtype=np.float64)
-            experiment_name = row.get("experiment", f"experiment_{index}")
-            experiment_results = self.single_experiment_fit(
-                pressure,
-                uptake,
-                experiment_name,
-                configuration,
-                max_iterations,
-                normalized_method,
+        checkpointed = checkpoint.load() if checkpoint is not None else {}
+        if checkpointed:
+            logger.info(
+                "Resuming from checkpoint: %s of %s experiments already fitted",
+                len(checkpointed),
+                total_experiments,
             )
-            for model_name, data in experiment_results.items():
-                results[model_name].append(data)
+        fitting_settings = server_settings.fitting
+        screening_settings = fitting_settings.screening
+        initializer = (
+            self.load_predictor(INITIALIZER_FILE, InitialParameterPredictor.load)
+            if fitting_settings.learned_initialization
+            else None
+        )
+        screener = (
+            self.load_predictor(SCREENER_FILE, ModelScreener.load)
+            if screening_settings.enabled and screening_settings.classifier_enabled
+            else None
+        )
+        features = (
+            self.experiment_features(dataset, pressure_col, uptake_col)
+            if total_experiments and (initializer or screener)
+            else None
+        )
+        guesses = (
+            self.predict_initial_guesses(initializer, features, configuration)
+            if initializer is not None and features is not None
+            else {}
+        )
+        method_statistics = (
+            MethodStatistics.load(METHOD_STATISTICS_FILE)
+            if normalized_method == AUTO_OPTIMIZATION_METHOD
+            else None
+        )
+        skips = (screener or ModelScreener()).screen(
+            dataset[pressure_col].tolist(),
+            dataset[uptake_col].tolist(),
+            {model: len(self.model_parameters(model)) for model in configuration},
+            DatasetAdapter.normalize_metric(fitting_settings.best_model_metric),
+            screening_settings,
+            features=features,
+        )
+        for position, (index, row) in enumerate(dataset.iterrows()):
+            experiment_name = row.get("experiment", f"experiment_{index}")
+            experiment_results = checkpointed.pop(int(index), None)
+            if experiment_results is None:
+                pressure = np.asarray(row[pressure_col], dtype=np.float64)
+                uptake = np.asarray(row[uptake_col], dtype=np.float64)
+                options: dict[str, Any] = {
+                    "token": token,
+                    "initial_guesses": {
+                        model_name: values[position]
+                        for model_name, values in guesses.items()
+                    },
+                    "skip_reasons": {
+                        model_name: reasons[position]
+                        for model_name, reasons in skips.items()
+                        if reasons[position] is not None
+                    },
+                    "method_statistics": method_statistics,
+                    "bootstrap_replicates": bootstrap_replicates,
+                }
+                if refinement is not None:
+                    options["report"] = refinement
+                fit = (
+                    self.single_experiment_fit
+                    if refinement is None
+                    else self.two_tier_experiment_fit
+                )
+                try:
+                    fitted = fit(
+                        pressure,
+                        uptake,
+                        experiment_name,
+                        configuration,
+                        max_iterations,
+                        normalized_method,
+                        **options,
+                    )
+                except FittingInterrupted as exc:
+                    # The interrupted experiment is dropped so every model keeps one
+                    # entry per completed experiment.
+                    logger.warning(
+                        "Fitting stopped (%s) after %s of %s experiments",
+                        exc.reason,
+                        position,
+                        total_experiments,
+                    )
+                    break
+                # Callbacks and checkpoints receive the JSON-friendly compact form,
+                # without covariance matrices and exception objects.
+                experiment_results = {
+                    model_name: compact_model_result(data)
+                    for model_name, data in fitted.items()
+                }
+                if checkpoint is not None:
+                    checkpoint.append(
+                        int(index), str(experiment_name), experiment_results
+                    )
+            results.store(position, experiment_results)
+
+            if result_callback is not None:
+                result_callback(position, str(experiment_name), experiment_results)
 
             if progress_callback is not None:
-                progress_callback(index + 1, total_experiments)
+                progress_callback(position + 1, total_experiments)
 
+        if method_statistics is not None:
+            method_statistics.save()
         return results
 
 
@@ -409,80 +1326,388 @@ class FittingPipeline:
         self.serializer = DataSerializer()
         self.solver = ModelSolver()
         self.adapter = DatasetAdapter()
+        self.isotherms = IsothermStore()
+        self.global_fitter = GlobalFitter(self.solver)
 
     # -------------------------------------------------------------------------
     def run(
         self,
         dataset_payload: dict[str, Any],
-        configuration: dict[str, dict[str, dict[str, float]]],
+        configuration: dict[str, dict[str, Any]],
         max_iterations: int,
         optimization_method: str,
         progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: Callable[[int, str, dict[str, dict[str, Any]]], None]
+        | None = None,
+        token: CancellationToken | None = None,
+        checkpoint: FitCheckpoint | None = None,
+        two_tier: bool | None = None,
+        global_fit: dict[str, Any] | None = None,
+        bootstrap: bool | None = None,
     ) -> dict[str, Any]:
-        dataframe = self.build_dataframe(dataset_payload)
-        if dataframe.empty:
-            raise ValueError("Uploaded dataset is empty.")
+        refinement = RefinementReport() if self.resolve_two_tier(two_tier) else None
+        bootstrap_replicates = self.resolve_bootstrap(bootstrap)
+        memory = PeakMemoryMonitor(server_settings.fitting.memory_sample_interval)
+        with memory:
+            dataframe = self.build_dataframe(dataset_payload)
+            if dataframe.empty:
+                raise ValueError("Uploaded dataset is empty.")
 
-        logger.info("Saving raw dataset with %s rows", dataframe.shape[0])
-        self.serializer.save_raw_dataset(dataframe)
+            processor = AdsorptionDataProcessor(dataframe)
+            processed, detected_columns, stats = processor.preprocess(
+                detect_columns=True
+            )
+            groups = (
+                self.experiment_groups(
+                    dataframe, detected_columns, global_fit.get("group_by")
+                )
+                if global_fit is not None
+                else None
+            )
+            if groups is not None:
+                # The uploaded data table only holds the measurement columns.
+                dataframe = dataframe.drop(columns=global_fit["group_by"])
 
-        processor = AdsorptionDataProcessor(dataframe)
-        processed, detected_columns, stats = processor.preprocess(detect_columns=True)
+            logger.info(
+                "Processed dataset contains %s experiments", processed.shape[0]
+            )
+            serializable_processed = self.stringify_sequences(processed)
+            # Related tables are written under a single write lock so that
+            # concurrent jobs from other workers cannot interleave their rows.
+            with self.serializer.write_lock():
+                logger.info("Saving raw dataset with %s rows", dataframe.shape[0])
+                self.serializer.save_raw_dataset(dataframe)
+                self.serializer.save_processed_dataset(serializable_processed)
+                if server_settings.fitting.isotherm_store_enabled:
+                    self.store_isotherms(processed, detected_columns)
+            # The raw upload and its text encoding are not needed while fitting.
+            del dataframe, processor, serializable_processed
 
-        logger.info("Processed dataset contains %s experiments", processed.shape[0])
-        serializable_processed = self.stringify_sequences(processed)
-        self.serializer.save_processed_dataset(serializable_processed)
+            logger.debug("Detected dataset statistics:\n%s", stats)
 
-        logger.debug("Detected dataset statistics:\n%s", stats)
+            if processed.empty:
+                raise ValueError(
+                    "No valid experiments found after preprocessing the dataset."
+                )
 
-        if processed.empty:
-            raise ValueError(
-                "No valid experiments found after preprocessing the dataset."
+            model_configuration = self.normalize_configuration(configuration)
+            logger.debug(
+                "Running solver with configuration: %s", model_configuration
             )
+            if global_fit is not None:
+                self.global_fitter.validate(global_fit, model_configuration)
 
-        model_configuration = self.normalize_configuration(configuration)
-        logger.debug("Running solver with configuration: %s", model_configuration)
+            try:
+                results = self.solver.bulk_data_fitting(
+                    processed,
+                    model_configuration,
+                    detected_columns.pressure,
+                    detected_columns.uptake,
+                    max_iterations,
+                    optimization_method,
+                    progress_callback=progress_callback,
+                    result_callback=result_callback,
+                    token=token,
+                    checkpoint=checkpoint,
+                    refinement=refinement,
+                    bootstrap_replicates=bootstrap_replicates,
+                )
+            finally:
+                if checkpoint is not None:
+                    checkpoint.close()
 
-        results = self.solver.bulk_data_fitting(
-            processed,
-            model_configuration,
-            detected_columns.pressure,
-            detected_columns.uptake,
-            max_iterations,
-            optimization_method,
-            progress_callback=progress_callback,
-        )
+            total_experiments = int(processed.shape[0])
+            experiment_count = results.completed
+            partial = experiment_count < total_experiments
+            stop_reason = (
+                token.stop_reason if partial and token is not None else None
+            )
+            if partial:
+                processed = processed.iloc[:experiment_count]
 
-        combined = self.adapter.combine_results(results, processed)
-        self.serializer.save_fitting_results(combined)
+            combined = self.adapter.combine_results(results, processed)
+            skipped_fits = {
+                model_name: count
+                for model_name, count in results.status_counts(
+                    FIT_STATUS_SKIPPED
+                ).items()
+                if count
+            }
 
-        ranking_metric = server_settings.fitting.best_model_metric
-        normalized_metric = self.adapter.normalize_metric(ranking_metric)
-        best_frame = self.adapter.compute_best_models(combined, normalized_metric)
-        self.serializer.save_best_fit(best_frame)
+            methods_used = (
+                results.method_counts()
+                if self.solver.normalize_method(optimization_method)
+                == AUTO_OPTIMIZATION_METHOD
+                else None
+            )
+
+            # Shared parameters would be estimated from a subset of the
+            # temperatures, so stopped runs are not fitted globally.
+            global_fits = (
+                self.global_fitter.fit_groups(
+                    processed,
+                    groups,
+                    model_configuration,
+                    results,
+                    detected_columns.temperature,
+                    detected_columns.pressure,
+                    detected_columns.uptake,
+                    max_iterations,
+                    global_fit,
+                    token=token,
+                )
+                if global_fit is not None and not partial
+                else None
+            )
+
+            ranking_metric = server_settings.fitting.best_model_metric
+            normalized_metric = self.adapter.normalize_metric(ranking_metric)
+            best_frame = self.adapter.compute_best_models(
+                combined, normalized_metric
+            )
+            with self.serializer.write_lock():
+                self.serializer.save_fitting_results(combined)
+                self.serializer.save_best_fit(best_frame)
+            # A partial run keeps its checkpoint, so resubmitting it continues.
+            if checkpoint is not None and not partial:
+                checkpoint.discard()
 
-        experiment_count = int(processed.shape[0])
         response: dict[str, Any] = {
             "status": "success",
             "processed_rows": experiment_count,
+            "total_experiments": total_experiments,
+            "partial": partial,
+            "stop_reason": stop_reason,
             "models": sorted(model_configuration.keys()),
             "best_model_saved": True,
+            "peak_memory_mb": memory.peak_mb,
+            "skipped_fits": skipped_fits,
+            "refinement": refinement.to_dict() if refinement is not None else None,
+            "methods_used": methods_used,
+            "global_fits": global_fits,
         }
+        if token is not None:
+            response["job_id"] = token.job_id
 
         if best_frame is not None:
             response["best_model_preview"] = self.build_preview(best_frame)
 
         summary_lines = [
-            "[INFO] ADSORFIT fitting completed.",
-            f"Experiments processed: {experiment_count}",
+            "[INFO] ADSORFIT fitting completed."
+            if not partial
+            else f"[WARNING] ADSORFIT fitting stopped early ({stop_reason}); "
+            "results are partial.",
+            f"Experiments processed: {experiment_count} of {total_experiments}",
             f"Optimization method: {self.solver.normalize_method(optimization_method)}",
             f"Ranking metric: {normalized_metric}",
         ]
+        if skipped_fits:
+            summary_lines.append(
+                "Fits skipped by pre-screening: "
+                + ", ".join(
+                    f"{model_name} ({count})"
+                    for model_name, count in sorted(skipped_fits.items())
+                )
+            )
+        if methods_used:
+            totals: dict[str, int] = {}
+            for counts in methods_used.values():
+                for method, count in counts.items():
+                    totals[method] = totals.get(method, 0) + count
+            summary_lines.append(
+                "Methods selected automatically: "
+                + ", ".join(
+                    f"{method} ({totals[method]})"
+                    for method in sorted(totals, key=totals.get, reverse=True)
+                )
+            )
+        if global_fits is not None:
+            fitted = [
+                entry for entry in global_fits if entry["status"] == FIT_STATUS_OK
+            ]
+            group_count = len({entry["group"] for entry in global_fits})
+            summary_lines.append(
+                f"Global multi-temperature fits: {len(fitted)} of {len(global_fits)} "
+                f"succeeded across {group_count} group(s)"
+            )
+        if refinement is not None:
+            report = response["refinement"]
+            summary_lines.append(
+                f"Two-tier fitting: {report['refined_fits']} fits refined, "
+                f"{report['approximate_fits']} kept approximate, estimated "
+                f"{report['estimated_saved_seconds']:.1f} s saved "
+                f"({report['estimated_saved_fraction']:.0%}); best model changed by "
+                f"refinement in {report['winner_changes']} experiments"
+            )
+        if bootstrap_replicates:
+            bootstrap_settings = server_settings.fitting.bootstrap
+            summary_lines.append(
+                f"Bootstrap confidence intervals: {bootstrap_settings.confidence:.0%} "
+                f"percentile intervals from {bootstrap_replicates} "
+                f"{bootstrap_settings.resampling} replicates per fit"
+            )
         summary_lines.append("Best model selection stored in database.")
+        if memory.peak_mb is not None:
+            summary_lines.append(
+                f"Peak memory: {memory.peak_mb:.1f} MB "
+                f"(+{memory.growth_mb:.1f} MB during the run)"
+            )
+            logger.info(
+                "Fitting run peak memory %.1f MB (+%.1f MB) for %s experiments",
+                memory.peak_mb,
+                memory.growth_mb,
+                total_experiments,
+            )
         response["summary"] = "\n".join(summary_lines)
 
         return response
 
+    # -------------------------------------------------------------------------
+    def store_isotherms(
+        self, processed: pd.DataFrame, detected_columns: DatasetColumns
+    ) -> None:
+        # The memory-mapped copy is an accelerator for readers; the database stays
+        # authoritative, so a failed write only costs them the fast path.
+        try:
+            self.isotherms.write(
+                processed["experiment"].tolist(),
+                processed[detected_columns.pressure].tolist(),
+                processed[detected_columns.uptake].tolist(),
+                processed[detected_columns.temperature].tolist(),
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning("Unable to update the isotherm store: %s", exc)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def summarize_experiment_results(
+        experiment_results: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Reduce the solver output of one experiment to a compact per-model summary.
+
+        Keyword arguments:
+        experiment_results -- Dictionary returned by
+        :meth:`ModelSolver.single_experiment_fit`.
+
+        Return value:
+        Dictionary keyed by model name with metrics, named parameters and errors,
+        without covariance matrices or exception objects.
+        """
+        summary: dict[str, dict[str, Any]] = {}
+        for model_name, data in experiment_results.items():
+            arguments = data.get("arguments", [])
+            entry: dict[str, Any] = {
+                "score": data.get("score"),
+                "aic": data.get("aic"),
+                "aicc": data.get("aicc"),
+                "optimization_method": data.get("optimization_method"),
+                "status": data.get("status"),
+                "parameters": dict(zip(arguments, data.get("optimal_params", []))),
+                "errors": dict(zip(arguments, data.get("errors", []))),
+            }
+            if "exception" in data:
+                entry["error"] = str(data["exception"])
+            elif "error" in data:
+                entry["error"] = data["error"]
+            if "skip_reason" in data:
+                entry["skip_reason"] = data["skip_reason"]
+            summary[model_name] = entry
+        return summary
+
+    # -------------------------------------------------------------------------
+    def fingerprint(
+        self,
+        dataset_payload: dict[str, Any],
+        configuration: dict[str, dict[str, Any]],
+        max_iterations: int,
+        optimization_method: str,
+        two_tier: bool | None = None,
+        global_fit: dict[str, Any] | None = None,
+        bootstrap: bool | None = None,
+    ) -> str:
+        """Hash everything that determines the outcome of a fitting job.
+
+        Keyword arguments:
+        dataset_payload -- Uploaded dataset with columns and records.
+        configuration -- Per-model configuration as received from the client.
+        max_iterations -- Maximum number of solver evaluations.
+        optimization_method -- Requested optimization method.
+        two_tier -- Requested screen-then-refine mode, None for the server default.
+        global_fit -- Requested global multi-temperature fit options, if any.
+        bootstrap -- Requested bootstrap confidence intervals, None for the server
+        default.
+
+        Return value:
+        Hex digest that is equal for requests producing the same results, since the
+        configuration and method are normalized before hashing.
+        """
+        canonical = {
+            "dataset": dataset_payload,
+            "configuration": self.normalize_configuration(configuration),
+            "max_iterations": int(max_iterations),
+            "optimization_method": self.solver.normalize_method(optimization_method),
+        }
+        # Added only when enabled, so full-precision jobs keep their fingerprints.
+        if self.resolve_two_tier(two_tier):
+            canonical["two_tier"] = True
+        if global_fit is not None:
+            canonical["global_fit"] = global_fit
+        bootstrap_replicates = self.resolve_bootstrap(bootstrap)
+        if bootstrap_replicates:
+            bootstrap_settings = server_settings.fitting.bootstrap
+            canonical["bootstrap"] = {
+                "replicates": bootstrap_replicates,
+                "resampling": bootstrap_settings.resampling,
+                "confidence": bootstrap_settings.confidence,
+                "seed": bootstrap_settings.seed,
+            }
+        serialized = json.dumps(canonical, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def resolve_two_tier(two_tier: bool | None) -> bool:
+        if two_tier is None:
+            return server_settings.fitting.two_tier.enabled
+        return bool(two_tier)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def resolve_bootstrap(bootstrap: bool | None) -> int:
+        """Return the bootstrap replicates per fit, 0 when the mode is off."""
+        settings = server_settings.fitting.bootstrap
+        enabled = settings.enabled if bootstrap is None else bool(bootstrap)
+        return settings.replicates if enabled else 0
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def experiment_groups(
+        dataframe: pd.DataFrame, columns: DatasetColumns, group_by: str | None
+    ) -> dict[str, str] | None:
+        """Map every experiment name to its global fit group.
+
+        Keyword arguments:
+        dataframe -- Uploaded dataset, before preprocessing.
+        columns -- Detected dataset columns.
+        group_by -- Column holding the group label, None for a single group.
+
+        Return value:
+        Dictionary of group labels keyed by experiment name (the label of the first
+        measurement of each experiment), or None without a grouping column.
+        """
+        if group_by is None:
+            return None
+        if group_by not in dataframe.columns:
+            raise ValueError(f"Grouping column {group_by} not found in the dataset.")
+        labels = dataframe[[columns.experiment, group_by]].dropna()
+        labels = labels.drop_duplicates(subset=columns.experiment)
+        return dict(
+            zip(
+                labels[columns.experiment].astype(str),
+                labels[group_by].astype(str),
+            )
+        )
+
     # -------------------------------------------------------------------------
     def build_dataframe(self, payload: dict[str, Any]) -> pd.DataFrame:
         records = payload.get("records")
@@ -495,9 +1720,9 @@ class FittingPipeline:
 
     # -------------------------------------------------------------------------
     def normalize_configuration(
-        self, configuration: dict[str, dict[str, dict[str, float]]]
-    ) -> dict[str, dict[str, dict[str, float]]]:
-        normalized: dict[str, dict[str, dict[str, float]]] = {}
+        self, configuration: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        normalized: dict[str, dict[str, Any]] = {}
         supported = {
             self.normalize_model_key(name): name for name in self.solver.collection.model_names
         }
@@ -510,7 +1735,7 @@ class FittingPipeline:
 
             defaults = MODEL_PARAMETER_DEFAULTS.get(resolved_name, {})
             alias_map = PARAMETER_ALIAS_MAP.get(resolved_name, {})
-            normalized_entry: dict[str, dict[str, float]] = {
+            normalized_entry: dict[str, Any] = {
                 "min": {},
                 "max": {},
                 "initial": {},
@@ -555,20 +1780,37 @@ class FittingPipeline:
                         lower + (upper - lower) / 2
                     )
 
+            normalized_entry["starts"] = self.resolve_starts(resolved_name, config)
             normalized[resolved_name] = normalized_entry
         return normalized
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def resolve_starts(model_name: str, config: dict[str, Any]) -> int:
+        requested = config.get("starts")
+        if requested is not None:
+            return max(0, int(requested))
+        multistart_settings = server_settings.fitting.multistart
+        return multistart_settings.model_starts.get(
+            model_name, multistart_settings.default_starts
+        )
+
     # -------------------------------------------------------------------------
     def stringify_sequences(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
+        # Only the sequence columns are replaced; the shallow copy shares the rest.
+        converted = dataset.copy(deep=False)
         for column in converted.columns:
+            if pd.api.types.is_numeric_dtype(converted[column]):
+                continue
             if (
                 converted[column]
-                .apply(lambda value: isinstance(value, (list, tuple)))
+                .apply(lambda value: isinstance(value, (list, tuple, np.ndarray)))
                 .any()
             ):
                 converted[column] = converted[column].apply(
-                    lambda value: json.dumps(value)
+                    lambda value: json.dumps(value.tolist())
+                    if isinstance(value, np.ndarray)
+                    else json.dumps(value)
                     if isinstance(value, (list, tuple))
                     else value
                 )
@@ -613,7 +1855,7 @@ class FittingPipeline:
     @staticmethod
     def apply_configuration_overrides(
         target: dict[str, dict[str, float]],
-        source: dict[str, dict[str, float]],
+        source: dict[str, Any],
         alias_map: dict[str, str],
     ) -> None:
         for bound_type in ("min", "max", "initial"):
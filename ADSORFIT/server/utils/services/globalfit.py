@@ -0,0 +1,562 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.jobs import (
+    CancellationToken,
+    FitTimeBudgetExceeded,
+    FittingInterrupted,
+)
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.services.results import (
+    FIT_STATUS_FAILED,
+    FIT_STATUS_OK,
+    FIT_STATUS_TIME_BUDGET,
+    FitResultSet,
+)
+
+if TYPE_CHECKING:
+    from ADSORFIT.server.utils.services.fitting import ModelSolver
+
+# Molar gas constant in J/(mol K).
+GAS_CONSTANT = 8.314462618
+# Label of the single group formed when no grouping column is given.
+DEFAULT_GROUP = "all"
+
+
+###############################################################################
+class GlobalFitProblem:
+    """Least-squares problem fitting one model to several isotherms at once.
+
+    The parameter vector holds, in order, the parameters shared by every
+    experiment, two entries per van't Hoff parameter (the logarithm of its value at
+    the reference temperature and the adsorption enthalpy in kJ/mol) and one block
+    with the remaining parameters of each experiment. Residuals of an experiment
+    depend only on the global entries and on its own block, so the sparsity of the
+    Jacobian is known in advance: finite differences perturb the blocks of all
+    experiments together and the trust-region steps are solved iteratively.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., np.ndarray],
+        parameters: Sequence[str],
+        pressures: Sequence[np.ndarray],
+        uptakes: Sequence[np.ndarray],
+        temperatures: Sequence[float],
+        shared: Sequence[str],
+        temperature_dependent: Sequence[str],
+        lower: Sequence[float],
+        upper: Sequence[float],
+        enthalpy_bounds: tuple[float, float],
+    ) -> None:
+        self.function = function
+        self.parameters = list(parameters)
+        self.temperature = np.asarray(temperatures, dtype=np.float64)
+        # A van't Hoff term cannot be identified from a single temperature.
+        single_temperature = np.unique(self.temperature).size < 2
+        self.shared = [
+            name
+            for name in self.parameters
+            if name in shared or (single_temperature and name in temperature_dependent)
+        ]
+        self.dependent = [
+            name
+            for name in self.parameters
+            if name in temperature_dependent and name not in self.shared
+        ]
+        self.local = [
+            name
+            for name in self.parameters
+            if name not in self.shared and name not in self.dependent
+        ]
+        self.positions = {name: index for index, name in enumerate(self.parameters)}
+
+        self.experiments = len(pressures)
+        lengths = np.fromiter((len(values) for values in pressures), np.int64)
+        self.pressure = np.concatenate(
+            [np.asarray(values, dtype=np.float64) for values in pressures]
+        )
+        self.uptake = np.concatenate(
+            [np.asarray(values, dtype=np.float64) for values in uptakes]
+        )
+        self.point_experiment = np.repeat(np.arange(self.experiments), lengths)
+        # 1 / T_ref is the mean of 1 / T, which decorrelates the reference value
+        # from the enthalpy.
+        inverse = 1.0 / self.temperature
+        self.reference_temperature = float(1.0 / np.mean(inverse))
+        self.inverse_offset = inverse - 1.0 / self.reference_temperature
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+        self.enthalpy_bounds = enthalpy_bounds
+        self.global_size = len(self.shared) + 2 * len(self.dependent)
+        self.size = self.global_size + self.experiments * len(self.local)
+        self.penalty = 10.0 * max(1.0, float(np.max(np.abs(self.uptake), initial=0.0)))
+
+    # -------------------------------------------------------------------------
+    @property
+    def measurement_count(self) -> int:
+        return int(self.pressure.shape[0])
+
+    # -------------------------------------------------------------------------
+    def expand(self, vector: np.ndarray) -> np.ndarray:
+        """Return the model parameters of every experiment, shape (E, K)."""
+        values = np.empty((self.experiments, len(self.parameters)), dtype=np.float64)
+        cursor = 0
+        for name in self.shared:
+            values[:, self.positions[name]] = vector[cursor]
+            cursor += 1
+        for name in self.dependent:
+            log_reference, enthalpy = vector[cursor], vector[cursor + 1]
+            with np.errstate(over="ignore"):
+                values[:, self.positions[name]] = np.exp(
+                    log_reference
+                    - enthalpy * 1000.0 / GAS_CONSTANT * self.inverse_offset
+                )
+            cursor += 2
+        if self.local:
+            local_values = vector[self.global_size :].reshape(
+                self.experiments, len(self.local)
+            )
+            for column, name in enumerate(self.local):
+                values[:, self.positions[name]] = local_values[:, column]
+        return values
+
+    # -------------------------------------------------------------------------
+    def residuals(self, vector: np.ndarray) -> np.ndarray:
+        per_point = self.expand(vector)[self.point_experiment]
+        with np.errstate(all="ignore"):
+            residuals = self.function(self.pressure, *per_point.T) - self.uptake
+        return np.where(np.isfinite(residuals), residuals, self.penalty)
+
+    # -------------------------------------------------------------------------
+    def sparsity(self) -> Any:
+        from scipy.sparse import coo_matrix
+
+        rows = self.measurement_count
+        local_count = len(self.local)
+        global_rows = np.repeat(np.arange(rows), self.global_size)
+        global_columns = np.tile(np.arange(self.global_size), rows)
+        local_rows = np.repeat(np.arange(rows), local_count)
+        local_columns = (
+            self.global_size
+            + (self.point_experiment[:, np.newaxis] * local_count)
+            + np.arange(local_count)
+        ).reshape(-1)
+        row_index = np.concatenate([global_rows, local_rows])
+        column_index = np.concatenate([global_columns, local_columns])
+        return coo_matrix(
+            (np.ones(row_index.shape[0], dtype=np.int8), (row_index, column_index)),
+            shape=(rows, self.size),
+        ).tocsr()
+
+    # -------------------------------------------------------------------------
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        lower: list[float] = []
+        upper: list[float] = []
+        for name in self.shared:
+            lower.append(self.lower[self.positions[name]])
+            upper.append(self.upper[self.positions[name]])
+        for name in self.dependent:
+            position = self.positions[name]
+            with np.errstate(divide="ignore"):
+                lower.append(float(np.log(max(self.lower[position], 0.0))))
+                upper.append(float(np.log(max(self.upper[position], 0.0))))
+            lower.append(self.enthalpy_bounds[0])
+            upper.append(self.enthalpy_bounds[1])
+        local_lower = [self.lower[self.positions[name]] for name in self.local]
+        local_upper = [self.upper[self.positions[name]] for name in self.local]
+        return (
+            np.asarray(lower + local_lower * self.experiments, dtype=np.float64),
+            np.asarray(upper + local_upper * self.experiments, dtype=np.float64),
+        )
+
+    # -------------------------------------------------------------------------
+    def initial_vector(self, estimates: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+        """Build the starting vector from independent per-experiment fits.
+
+        Keyword arguments:
+        estimates -- Parameters fitted on each experiment alone, shape (E, K), with
+        NaN rows where those fits failed.
+        fallback -- Configured initial values, used for parameters without any
+        finite estimate.
+
+        Return value:
+        Starting vector within bounds: medians for shared parameters, a linear fit
+        of ln(value) against 1/T for van't Hoff parameters and the experiment's own
+        estimates, or the median, for per-experiment parameters.
+        """
+        estimates = np.array(estimates, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            finite = np.where(np.isfinite(estimates), estimates, np.nan)
+            medians = np.nanmedian(finite, axis=0)
+        medians = np.where(np.isfinite(medians), medians, fallback)
+        estimates = np.where(np.isfinite(estimates), estimates, medians)
+        estimates = np.clip(estimates, self.lower, self.upper)
+
+        vector: list[float] = []
+        for name in self.shared:
+            vector.append(float(np.median(estimates[:, self.positions[name]])))
+        for name in self.dependent:
+            values = estimates[:, self.positions[name]]
+            positive = values > 0
+            log_reference = float(
+                np.log(np.median(values[positive])) if np.any(positive) else 0.0
+            )
+            enthalpy = 0.0
+            if np.unique(self.inverse_offset[positive]).size >= 2:
+                slope, log_reference = np.polyfit(
+                    self.inverse_offset[positive], np.log(values[positive]), 1
+                )
+                enthalpy = -float(slope) * GAS_CONSTANT / 1000.0
+            vector.extend([float(log_reference), enthalpy])
+        for row in estimates:
+            vector.extend(float(row[self.positions[name]]) for name in self.local)
+
+        lower, upper = self.bounds()
+        return np.clip(np.asarray(vector, dtype=np.float64), lower, upper)
+
+    # -------------------------------------------------------------------------
+    def solve(self, start: np.ndarray, max_evaluations: int) -> Any:
+        from scipy.optimize import least_squares
+
+        return least_squares(
+            self.residuals,
+            start,
+            jac_sparsity=self.sparsity(),
+            bounds=self.bounds(),
+            method="trf",
+            tr_solver="lsmr",
+            x_scale="jac",
+            max_nfev=max_evaluations,
+        )
+
+    # -------------------------------------------------------------------------
+    def standard_errors(self, result: Any) -> np.ndarray:
+        """Return the standard errors of the solution vector, NaN when undefined."""
+        jacobian = result.jac
+        if hasattr(jacobian, "toarray"):
+            jacobian = jacobian.toarray()
+        jacobian = np.asarray(jacobian, dtype=np.float64)
+        degrees_of_freedom = self.measurement_count - self.size
+        if degrees_of_freedom <= 0 or not np.all(np.isfinite(jacobian)):
+            return np.full(self.size, np.nan, dtype=np.float64)
+        variance = float(np.sum(result.fun**2)) / degrees_of_freedom
+        covariance = np.linalg.pinv(jacobian.T @ jacobian) * variance
+        with np.errstate(invalid="ignore"):
+            return np.sqrt(np.diag(covariance))
+
+
+###############################################################################
+class GlobalFitter:
+    """Fit the experiments of each group jointly, with parameters shared across
+    temperatures and van't Hoff rate constants.
+
+    Runs after the independent fits, which provide the starting values and the
+    score that the global model is compared against.
+    """
+
+    def __init__(self, solver: ModelSolver) -> None:
+        self.solver = solver
+
+    # -------------------------------------------------------------------------
+    def resolve_layout(
+        self, model_name: str, options: dict[str, Any]
+    ) -> tuple[list[str], list[str]]:
+        """Return the shared and van't Hoff parameters of a model.
+
+        Request options replace the ``fitting.global_fit`` defaults per model.
+        Unknown parameters and parameters listed in both roles raise ValueError.
+        """
+        settings = server_settings.fitting.global_fit
+        parameters = self.solver.model_parameters(model_name)
+        shared_options = options.get("shared_parameters") or {}
+        dependent_options = options.get("temperature_dependent") or {}
+        shared = list(
+            shared_options.get(
+                model_name, settings.shared_parameters.get(model_name, ())
+            )
+        )
+        dependent = list(
+            dependent_options.get(
+                model_name, settings.temperature_dependent.get(model_name, ())
+            )
+        )
+        unknown = sorted(set(shared + dependent) - set(parameters))
+        if unknown:
+            raise ValueError(
+                f"Unknown {model_name} parameters for global fitting: "
+                + ", ".join(unknown)
+            )
+        overlap = sorted(set(shared) & set(dependent))
+        if overlap:
+            raise ValueError(
+                f"{model_name} parameters cannot be both shared and temperature "
+                "dependent: " + ", ".join(overlap)
+            )
+        return shared, dependent
+
+    # -------------------------------------------------------------------------
+    def validate(self, options: dict[str, Any], configuration: dict[str, Any]) -> None:
+        """Check the global fit options of a request before any fitting starts."""
+        requested = options.get("models") or list(configuration)
+        missing = sorted(set(requested) - set(configuration))
+        if missing:
+            raise ValueError(
+                "Models requested for global fitting are not configured: "
+                + ", ".join(missing)
+            )
+        for model_name in requested:
+            self.resolve_layout(model_name, options)
+
+    # -------------------------------------------------------------------------
+    def fit_groups(
+        self,
+        dataset: pd.DataFrame,
+        groups: dict[str, str] | None,
+        configuration: dict[str, Any],
+        results: FitResultSet,
+        temperature_col: str,
+        pressure_col: str,
+        uptake_col: str,
+        max_iterations: int,
+        options: dict[str, Any],
+        token: CancellationToken | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fit every group of experiments with every selected model.
+
+        Keyword arguments:
+        dataset -- Processed experiments, aligned with the rows of ``results``.
+        groups -- Group label of each experiment name; None puts all experiments
+        in one group, and experiments without a label are left out.
+        configuration -- Normalized per-model configuration (bounds and initial
+        values).
+        results -- Independent fits of the same experiments.
+        temperature_col -- Temperature column of ``dataset``.
+        pressure_col -- Pressure column of ``dataset``.
+        uptake_col -- Uptake column of ``dataset``.
+        max_iterations -- Evaluation budget per experiment; a global problem gets
+        this budget times its number of experiments.
+        options -- Global fit options of the request (``models``,
+        ``shared_parameters``, ``temperature_dependent``).
+        token -- Optional cancellation token.
+
+        Return value:
+        One report per group and model, in group order.
+        """
+        settings = server_settings.fitting.global_fit
+        names = [str(name) for name in dataset["experiment"]]
+        labels = (
+            [groups.get(name) for name in names]
+            if groups is not None
+            else [DEFAULT_GROUP] * len(names)
+        )
+        members: dict[str, list[int]] = {}
+        for position, label in enumerate(labels):
+            if label is not None:
+                members.setdefault(label, []).append(position)
+        models = [
+            model_name
+            for model_name in options.get("models") or list(configuration)
+            if model_name in configuration
+        ]
+
+        reports: list[dict[str, Any]] = []
+        for label, positions in members.items():
+            if len(positions) < settings.min_experiments:
+                logger.info(
+                    "Skipping global fit of group %s: %s experiment(s)",
+                    label,
+                    len(positions),
+                )
+                continue
+            for model_name in models:
+                shared, dependent = self.resolve_layout(model_name, options)
+                if not shared and not dependent:
+                    continue
+                try:
+                    reports.append(
+                        self.fit_group(
+                            label,
+                            model_name,
+                            dataset,
+                            positions,
+                            configuration[model_name],
+                            results,
+                            (temperature_col, pressure_col, uptake_col),
+                            shared,
+                            dependent,
+                            max_iterations,
+                            token,
+                        )
+                    )
+                except FittingInterrupted as exc:
+                    logger.warning("Global fitting stopped (%s)", exc.reason)
+                    return reports
+        return reports
+
+    # -------------------------------------------------------------------------
+    def fit_group(
+        self,
+        label: str,
+        model_name: str,
+        dataset: pd.DataFrame,
+        positions: list[int],
+        model_config: dict[str, Any],
+        results: FitResultSet,
+        columns: tuple[str, str, str],
+        shared: list[str],
+        dependent: list[str],
+        max_iterations: int,
+        token: CancellationToken | None,
+    ) -> dict[str, Any]:
+        temperature_col, pressure_col, uptake_col = columns
+        fitting_settings = server_settings.fitting
+        parameters = self.solver.model_parameters(model_name)
+        # The undecorated model evaluates per-point parameter arrays elementwise.
+        function = getattr(
+            self.solver.collection.get_model(model_name),
+            "__wrapped__",
+            self.solver.collection.get_model(model_name),
+        )
+        if token is not None:
+            token.check()
+            function = token.guard(function, token.fit_deadline())
+        rows = dataset.iloc[positions]
+        problem = GlobalFitProblem(
+            function,
+            parameters,
+            list(rows[pressure_col]),
+            list(rows[uptake_col]),
+            rows[temperature_col].to_numpy(dtype=np.float64),
+            shared,
+            dependent,
+            [
+                model_config.get("min", {}).get(
+                    name, fitting_settings.parameter_min_default
+                )
+                for name in parameters
+            ],
+            [
+                model_config.get("max", {}).get(
+                    name, fitting_settings.parameter_max_default
+                )
+                for name in parameters
+            ],
+            (
+                fitting_settings.global_fit.enthalpy_min,
+                fitting_settings.global_fit.enthalpy_max,
+            ),
+        )
+        initial = np.asarray(
+            [
+                model_config.get("initial", {}).get(
+                    name, fitting_settings.parameter_initial_default
+                )
+                for name in parameters
+            ],
+            dtype=np.float64,
+        )
+        columns_of_model = results.columns[model_name]
+        independent_scores = columns_of_model.score[positions]
+        report: dict[str, Any] = {
+            "group": label,
+            "model": model_name,
+            "experiments": [str(name) for name in rows["experiment"]],
+            "temperatures": problem.temperature.tolist(),
+            "reference_temperature": problem.reference_temperature,
+            "measurement_count": problem.measurement_count,
+            "parameter_count": problem.size,
+            "independent_score": float(np.sum(independent_scores))
+            if np.all(np.isfinite(independent_scores))
+            else None,
+        }
+        if report["independent_score"] is not None:
+            report["independent_aicc"] = self.solver.compute_information_metrics(
+                report["independent_score"],
+                problem.measurement_count,
+                len(parameters) * problem.experiments,
+            )[1]
+
+        start = problem.initial_vector(columns_of_model.params[positions], initial)
+        try:
+            result = problem.solve(
+                start, max(1, int(max_iterations)) * problem.experiments
+            )
+        except FittingInterrupted:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            if isinstance(exc, FitTimeBudgetExceeded):
+                logger.warning(
+                    "Global %s fit of group %s exceeded its time budget",
+                    model_name,
+                    label,
+                )
+                report["status"] = FIT_STATUS_TIME_BUDGET
+            else:
+                logger.exception(
+                    "Global %s fit of group %s failed", model_name, label
+                )
+                report["status"] = FIT_STATUS_FAILED
+            report["error"] = str(exc)
+            return report
+
+        score = float(np.sum(result.fun**2))
+        aic, aicc = self.solver.compute_information_metrics(
+            score, problem.measurement_count, problem.size
+        )
+        errors = problem.standard_errors(result)
+        report.update(
+            {
+                "status": FIT_STATUS_OK,
+                "score": score,
+                "aic": aic,
+                "aicc": aicc,
+                "evaluations": int(result.nfev),
+                "converged": bool(result.success),
+            }
+        )
+        report.update(self.describe_solution(problem, result.x, errors))
+        return report
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def describe_solution(
+        problem: GlobalFitProblem, vector: np.ndarray, errors: np.ndarray
+    ) -> dict[str, Any]:
+        def as_number(value: float) -> float | None:
+            return float(value) if np.isfinite(value) else None
+
+        shared: dict[str, dict[str, float | None]] = {}
+        cursor = 0
+        for name in problem.shared:
+            shared[name] = {
+                "value": as_number(vector[cursor]),
+                "error": as_number(errors[cursor]),
+            }
+            cursor += 1
+        dependent: dict[str, dict[str, float | None]] = {}
+        for name in problem.dependent:
+            reference = float(np.exp(vector[cursor]))
+            dependent[name] = {
+                "reference_value": as_number(reference),
+                # Delta method: d(exp(x)) = exp(x) dx.
+                "reference_error": as_number(reference * errors[cursor]),
+                "enthalpy_kj_mol": as_number(vector[cursor + 1]),
+                "enthalpy_error": as_number(errors[cursor + 1]),
+            }
+            cursor += 2
+        values = problem.expand(vector)
+        return {
+            "shared": shared,
+            "temperature_dependent": dependent,
+            "parameters": {
+                name: [as_number(value) for value in values[:, position]]
+                for position, name in enumerate(problem.parameters)
+            },
+        }
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.server.utils.configurations import IASTSettings, server_settings
+from ADSORFIT.server.utils.services.models import AdsorptionModels
+from ADSORFIT.server.utils.services.predictions import CurvePredictionService
+
+# Largest change of ln(P_i^0) taken by one Newton step.
+IAST_MAX_LOG_STEP = 2.0
+# Temkin uptake diverges as p -> 0, so its spreading pressure integral is undefined.
+IAST_UNSUPPORTED_MODELS = ("TEMKIN",)
+
+
+###############################################################################
+class IASTSolver:
+    """Ideal Adsorbed Solution Theory over grids of compositions and pressures.
+
+    For a gas of mole fractions y_i at total pressure P, IAST looks for the
+    pure-component pressures P_i^0 at which every component has the same reduced
+    spreading pressure psi_i(P_i^0) = int_0^P_i^0 q_i(p) / p dp, subject to
+    sum(y_i P / P_i^0) = 1. The adsorbed phase then has the mole fractions
+    x_i = y_i P / P_i^0 and the total uptake 1 / sum(x_i / q_i(P_i^0)).
+
+    Newton's method runs on u_i = ln(P_i^0) with the equations written in
+    logarithms, ln psi_i - ln psi_C = 0 and ln sum(y_i P e^-u_i) = 0, for all grid
+    points at once: every iteration evaluates the isotherms and spreading
+    pressures of the still unconverged points as arrays and solves the stacked
+    C x C Newton systems in one call.
+    """
+
+    def __init__(
+        self,
+        collection: AdsorptionModels | None = None,
+        settings: IASTSettings | None = None,
+    ) -> None:
+        self.collection = collection or AdsorptionModels()
+        self.settings = settings or server_settings.fitting.iast
+        # Gauss-Legendre nodes and weights mapped from [-1, 1] to [-1, 0].
+        nodes, weights = np.polynomial.legendre.leggauss(
+            self.settings.quadrature_nodes
+        )
+        self.unit_nodes = (nodes - 1.0) / 2.0
+        self.unit_weights = weights / 2.0
+        self.closed_forms: dict[str, Callable[..., np.ndarray]] = {
+            "LANGMUIR": self.langmuir_spreading,
+            "DUAL_SITE_LANGMUIR": self.dual_site_langmuir_spreading,
+            "SIPS": self.sips_spreading,
+            "FREUNDLICH": self.freundlich_spreading,
+        }
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def langmuir_spreading(pressure: np.ndarray, k: float, qsat: float) -> np.ndarray:
+        return qsat * np.log1p(k * pressure)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def dual_site_langmuir_spreading(
+        pressure: np.ndarray, k1: float, qsat1: float, k2: float, qsat2: float
+    ) -> np.ndarray:
+        return qsat1 * np.log1p(k1 * pressure) + qsat2 * np.log1p(k2 * pressure)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sips_spreading(
+        pressure: np.ndarray, k: float, qsat: float, exponent: float
+    ) -> np.ndarray:
+        return (qsat / exponent) * np.log1p(k * pressure**exponent)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def freundlich_spreading(
+        pressure: np.ndarray, k: float, exponent: float
+    ) -> np.ndarray:
+        return exponent * (k * pressure) ** (1.0 / exponent)
+
+    # -------------------------------------------------------------------------
+    def uptake(
+        self, model_key: str, parameters: np.ndarray, pressure: np.ndarray
+    ) -> np.ndarray:
+        flat = np.asarray(pressure, dtype=np.float64).reshape(-1)
+        values = self.collection.evaluate(model_key, parameters, flat)
+        return values.reshape(np.shape(pressure))
+
+    # -------------------------------------------------------------------------
+    def spreading_pressure(
+        self,
+        model_key: str,
+        parameters: np.ndarray,
+        pressure: np.ndarray,
+        reference: float = np.inf,
+    ) -> np.ndarray:
+        """Return the reduced spreading pressure of a fitted isotherm.
+
+        Keyword arguments:
+        model_key -- Normalized model name.
+        parameters -- Fitted parameters, in model signature order.
+        pressure -- Array of pressures (Pa) of any shape.
+        reference -- Pressure below which the isotherm is known, typically the
+        highest measured pressure.
+
+        Return value:
+        Array of the same shape as ``pressure`` holding int_0^P q(p) / p dp in
+        mol/g. Models without a closed form are integrated on the ln(p) axis with
+        Gauss-Legendre quadrature, from ``quadrature_lower_ratio`` times the lower
+        of P and ``reference`` up to P. The part below that limit is taken as the
+        uptake at the limit, its value in the Henry regime. Anchoring the limit to
+        ``reference`` keeps it in that regime when P is extrapolated far beyond
+        the measurements.
+        """
+        pressure = np.asarray(pressure, dtype=np.float64)
+        closed_form = self.closed_forms.get(model_key)
+        with np.errstate(all="ignore"):
+            if closed_form is not None:
+                values = closed_form(pressure, *np.asarray(parameters, np.float64))
+            else:
+                lower = np.minimum(pressure, reference)
+                lower = lower * self.settings.quadrature_lower_ratio
+                span = np.log(pressure / lower)[..., np.newaxis]
+                nodes = pressure[..., np.newaxis] * np.exp(span * self.unit_nodes)
+                values = self.uptake(model_key, parameters, nodes) * span
+                values = values @ self.unit_weights
+                values = values + self.uptake(model_key, parameters, lower)
+        return np.where(pressure > 0, values, 0.0)
+
+    # -------------------------------------------------------------------------
+    def solve(
+        self,
+        components: Sequence[tuple[str, np.ndarray, float]],
+        fractions: np.ndarray,
+        pressure: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Solve the IAST equations for every gas composition and total pressure.
+
+        Keyword arguments:
+        components -- Normalized model name, fitted parameters and reference
+        pressure (see :meth:`spreading_pressure`) of each component's pure isotherm.
+        fractions -- Gas-phase mole fractions of shape (G, C), rows summing to one.
+        pressure -- Total pressures (Pa) of shape (G,).
+
+        Return value:
+        Dictionary of arrays: ``adsorbed_fractions``, ``loadings`` and
+        ``pure_pressures`` of shape (G, C); ``total_loading``,
+        ``spreading_pressure``, ``converged`` and ``iterations`` of shape (G,).
+        Points that did not converge hold NaN.
+        """
+        fractions = np.asarray(fractions, dtype=np.float64)
+        pressure = np.asarray(pressure, dtype=np.float64)
+        points, count = fractions.shape
+        partial = fractions * pressure[:, np.newaxis]
+        # Newton starts from the pure pressures of an ideal adsorbed phase, x = y.
+        log_pure = np.repeat(
+            np.log(np.where(pressure > 0, pressure, 1.0))[:, np.newaxis], count, axis=1
+        )
+        converged = np.zeros(points, dtype=bool)
+        iterations = np.zeros(points, dtype=np.int32)
+        active = np.flatnonzero(pressure > 0)
+        converged[pressure <= 0] = True
+
+        for _ in range(self.settings.max_iterations):
+            if active.size == 0:
+                break
+            pure = np.exp(log_pure[active])
+            psi, uptake = self.evaluate_components(components, pure)
+            with np.errstate(all="ignore"):
+                terms = partial[active] / pure
+                total = terms.sum(axis=1)
+                residuals = np.empty((active.size, count), dtype=np.float64)
+                residuals[:, :-1] = np.log(psi[:, :-1]) - np.log(psi[:, -1:])
+                residuals[:, -1] = np.log(total)
+
+                done = np.all(np.abs(residuals) <= self.settings.tolerance, axis=1)
+                converged[active[done]] = True
+                iterations[active] += 1
+                keep = ~done & np.all(np.isfinite(residuals), axis=1)
+                active, residuals = active[keep], residuals[keep]
+                if active.size == 0:
+                    break
+                slopes = uptake[keep] / psi[keep]
+                jacobian = np.zeros((active.size, count, count), dtype=np.float64)
+                diagonal = np.arange(count - 1)
+                jacobian[:, diagonal, diagonal] = slopes[:, :-1]
+                jacobian[:, :-1, -1] = -slopes[:, -1:]
+                jacobian[:, -1, :] = -terms[keep] / total[keep, np.newaxis]
+                try:
+                    step = np.linalg.solve(jacobian, -residuals[..., np.newaxis])
+                except np.linalg.LinAlgError:
+                    step = np.linalg.pinv(jacobian) @ -residuals[..., np.newaxis]
+            step = np.nan_to_num(step[..., 0], nan=0.0, posinf=0.0, neginf=0.0)
+            log_pure[active] += np.clip(step, -IAST_MAX_LOG_STEP, IAST_MAX_LOG_STEP)
+
+        pure = np.exp(log_pure)
+        psi, uptake = self.evaluate_components(components, pure)
+        with np.errstate(all="ignore"):
+            adsorbed = partial / pure
+            inverse_loading = np.where(adsorbed > 0, adsorbed / uptake, 0.0).sum(axis=1)
+            total_loading = np.where(pressure > 0, 1.0 / inverse_loading, 0.0)
+        adsorbed[pressure <= 0] = fractions[pressure <= 0]
+        loadings = adsorbed * total_loading[:, np.newaxis]
+        spreading = np.where(pressure > 0, psi[:, -1], 0.0)
+        failed = ~converged
+        for values in (adsorbed, loadings, pure):
+            values[failed] = np.nan
+        total_loading[failed] = np.nan
+        spreading[failed] = np.nan
+        return {
+            "adsorbed_fractions": adsorbed,
+            "loadings": loadings,
+            "pure_pressures": pure,
+            "total_loading": total_loading,
+            "spreading_pressure": spreading,
+            "converged": converged,
+            "iterations": iterations,
+        }
+
+    # -------------------------------------------------------------------------
+    def evaluate_components(
+        self, components: Sequence[tuple[str, np.ndarray, float]], pure: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        psi = np.empty_like(pure)
+        uptake = np.empty_like(pure)
+        for position, (model_key, parameters, reference) in enumerate(components):
+            psi[:, position] = self.spreading_pressure(
+                model_key, parameters, pure[:, position], reference
+            )
+            uptake[:, position] = self.uptake(model_key, parameters, pure[:, position])
+        return psi, uptake
+
+
+###############################################################################
+class IASTService:
+    """Mixture predictions from the pure-component fits stored in the database."""
+
+    def __init__(self, predictions: CurvePredictionService | None = None) -> None:
+        # Stored fits are read through the curve prediction snapshot, so both
+        # services see the same data and are invalidated together.
+        self.predictions = predictions or CurvePredictionService()
+        self.settings = server_settings.fitting.iast
+        self.solver = IASTSolver(self.predictions.collection, self.settings)
+
+    # -------------------------------------------------------------------------
+    def predict(
+        self,
+        components: list[dict[str, Any]],
+        compositions: list[list[float]],
+        pressure: list[float],
+    ) -> dict[str, Any]:
+        """Predict mixture adsorption for a grid of compositions and pressures.
+
+        Keyword arguments:
+        components -- One dictionary per adsorbing gas with the ``experiment_id``
+        of its stored pure isotherm and an optional ``model``; the best model of
+        the experiment is used when omitted.
+        compositions -- Gas-phase mole fractions, one list per composition with one
+        value per component; each list is normalized to sum to one.
+        pressure -- Total pressures (Pa) evaluated for every composition.
+
+        Return value:
+        Dictionary with the resolved components, and for every composition the
+        adsorbed-phase mole fractions, component and total uptakes (mol/g) and
+        reduced spreading pressure at each total pressure.
+        """
+        fractions = self.normalize_compositions(compositions, len(components))
+        grid = np.asarray(pressure, dtype=np.float64)
+        if grid.size == 0 or not np.all(np.isfinite(grid)) or np.any(grid < 0):
+            raise ValueError("Pressure grid must contain finite, non-negative values.")
+        size = fractions.shape[0] * grid.size
+        if size > self.settings.max_grid_points:
+            raise ValueError(
+                f"IAST grid of {size} points exceeds the limit of "
+                f"{self.settings.max_grid_points}."
+            )
+
+        resolved = self.resolve_components(components)
+        solution = self.solver.solve(
+            [
+                (entry["model_key"], entry["parameters"], entry["max_pressure"])
+                for entry in resolved
+            ],
+            np.repeat(fractions, grid.size, axis=0),
+            np.tile(grid, fractions.shape[0]),
+        )
+
+        to_json = self.predictions.to_json_values
+        mixtures = []
+        for position, composition in enumerate(fractions):
+            rows = slice(position * grid.size, (position + 1) * grid.size)
+            mixtures.append(
+                {
+                    "gas_fractions": composition.tolist(),
+                    "adsorbed_fractions": [
+                        to_json(values)
+                        for values in solution["adsorbed_fractions"][rows].T
+                    ],
+                    "loadings": [
+                        to_json(values) for values in solution["loadings"][rows].T
+                    ],
+                    "total_loading": to_json(solution["total_loading"][rows]),
+                    "spreading_pressure": to_json(
+                        solution["spreading_pressure"][rows]
+                    ),
+                }
+            )
+
+        # Pure-component pressures above the measured range extrapolate the fit.
+        extrapolated = (
+            solution["pure_pressures"]
+            > np.array([entry["max_pressure"] for entry in resolved])
+        ) & (np.repeat(fractions, grid.size, axis=0) > 0)
+        converged = solution["converged"]
+        return {
+            "components": [
+                {
+                    "experiment_id": entry["experiment_id"],
+                    "experiment": entry["experiment"],
+                    "model": entry["model"],
+                    "temperature": entry["temperature"],
+                    "extrapolated_points": int(extrapolated[:, index].sum()),
+                }
+                for index, entry in enumerate(resolved)
+            ],
+            "pressure": grid.tolist(),
+            "mixtures": mixtures,
+            "points": size,
+            "converged_points": int(converged.sum()),
+            "max_iterations_used": int(solution["iterations"].max(initial=0)),
+        }
+
+    # -------------------------------------------------------------------------
+    def resolve_components(
+        self, components: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        snapshot = self.predictions.load_snapshot()
+        experiments = snapshot["experiments"]
+        resolved = []
+        for component in components:
+            identifier = int(component["experiment_id"])
+            if identifier not in experiments.index:
+                raise ValueError(f"Unknown experiment ids: [{identifier}]")
+            model_name = component.get("model") or snapshot["best"].get(identifier)
+            if not model_name:
+                raise ValueError(f"Experiment {identifier} has no best model stored.")
+            model_key = self.predictions.resolve_model_key(model_name)
+            display_name = self.predictions.serializer.model_schemas[model_key][
+                "prefix"
+            ]
+            if model_key in IAST_UNSUPPORTED_MODELS:
+                raise ValueError(
+                    f"Model {display_name} does not reach Henry's law at low "
+                    "pressure and cannot be used for IAST predictions."
+                )
+            fits = snapshot["parameters"][model_key]
+            parameters = (
+                fits.loc[identifier].to_numpy(dtype=np.float64)
+                if identifier in fits.index
+                else np.array([np.nan])
+            )
+            if not np.all(np.isfinite(parameters)):
+                raise ValueError(
+                    f"Experiment {identifier} has no fitted {display_name} parameters."
+                )
+            row = experiments.loc[identifier]
+            resolved.append(
+                {
+                    "experiment_id": identifier,
+                    "experiment": str(row["experiment"]),
+                    "model": display_name,
+                    "model_key": model_key,
+                    "parameters": parameters,
+                    "temperature": float(row["temperature [K]"]),
+                    "max_pressure": float(row["max_pressure"]),
+                }
+            )
+
+        temperatures = [entry["temperature"] for entry in resolved]
+        if max(temperatures) - min(temperatures) > self.settings.temperature_tolerance:
+            raise ValueError(
+                "IAST components must be measured at the same temperature, got "
+                f"{', '.join(f'{value:g} K' for value in temperatures)}."
+            )
+        return resolved
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def normalize_compositions(
+        compositions: list[list[float]], count: int
+    ) -> np.ndarray:
+        if count < 2:
+            raise ValueError("IAST predictions need at least two components.")
+        if any(len(composition) != count for composition in compositions):
+            raise ValueError(
+                f"Every composition must list one mole fraction per component "
+                f"({count})."
+            )
+        fractions = np.asarray(compositions, dtype=np.float64).reshape(-1, count)
+        totals = fractions.sum(axis=1)
+        if (
+            not np.all(np.isfinite(fractions))
+            or np.any(fractions < 0)
+            or np.any(totals <= 0)
+        ):
+            raise ValueError(
+                "Compositions must hold non-negative mole fractions with a positive "
+                "sum."
+            )
+        return fractions / totals[:, np.newaxis]
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.server.utils.constants import INITIALIZER_FILE
+from ADSORFIT.server.utils.logger import logger
+
+INITIALIZER_FORMAT_VERSION = 1
+FEATURE_NAMES: tuple[str, ...] = (
+    "log_points",
+    "log_max_pressure",
+    "log_min_pressure",
+    "log_max_uptake",
+    "log_min_uptake",
+    "log_initial_slope",
+    "log_half_pressure",
+    "log_curvature",
+)
+# Floor applied before taking logarithms of pressures, uptakes and slopes.
+FEATURE_FLOOR = 1e-12
+# Number of lowest-pressure points used to estimate the initial slope.
+INITIAL_SLOPE_POINTS = 3
+# Fits explaining less of the uptake variance are treated as local minima and are
+# not learned from, since a finite score alone does not make a good optimum.
+MIN_TRAINING_R_SQUARED = 0.95
+
+
+# -------------------------------------------------------------------------
+def isotherm_features(pressure: np.ndarray, uptake: np.ndarray) -> np.ndarray:
+    """Summarize an isotherm with cheap, scale-aware shape descriptors.
+
+    Keyword arguments:
+    pressure -- Measured pressures.
+    uptake -- Measured uptakes aligned with ``pressure``.
+
+    Return value:
+    Vector of the features listed in ``FEATURE_NAMES``: point count, pressure and
+    uptake ranges, the slope through the origin of the lowest-pressure points,
+    the relative pressure at which half of the maximum uptake is reached and the
+    curvature (initial slope over the mean secant slope), all on log scales.
+    """
+    pressure = np.asarray(pressure, dtype=np.float64)
+    uptake = np.asarray(uptake, dtype=np.float64)
+    order = np.argsort(pressure, kind="stable")
+    pressure, uptake = pressure[order], uptake[order]
+    max_pressure = max(float(pressure[-1]), FEATURE_FLOOR)
+    max_uptake = max(float(np.max(uptake)), FEATURE_FLOOR)
+    positive = pressure[pressure > 0]
+    min_pressure = float(positive[0]) if positive.size else max_pressure * 1e-4
+    min_uptake = max(float(np.min(uptake)), max_uptake * 1e-6)
+
+    low_pressure = pressure[:INITIAL_SLOPE_POINTS]
+    low_uptake = uptake[:INITIAL_SLOPE_POINTS]
+    denominator = float(np.dot(low_pressure, low_pressure))
+    slope = float(np.dot(low_pressure, low_uptake)) / denominator if denominator else 0
+    slope = max(slope, FEATURE_FLOOR)
+    half = int(np.argmax(uptake >= 0.5 * max_uptake))
+    half_pressure = max(float(pressure[half]), min_pressure)
+
+    return np.log10(
+        [
+            float(pressure.shape[0]),
+            max_pressure,
+            min_pressure,
+            max_uptake,
+            min_uptake,
+            slope,
+            half_pressure / max_pressure,
+            max(slope * max_pressure / max_uptake, FEATURE_FLOOR),
+        ]
+    )
+
+
+###############################################################################
+class InitialParameterPredictor:
+    """Predict starting parameters of each model from past successful fits.
+
+    One nearest-neighbour regressor per model maps isotherm features to the
+    fitted parameters (log-scaled when always positive). The training samples are
+    stored with the regressors, so every retraining adds the fits currently in
+    the database to those seen before, while the database itself only holds the
+    latest run.
+    """
+
+    def __init__(self, models: dict[str, dict[str, Any]] | None = None) -> None:
+        self.models: dict[str, dict[str, Any]] = models or {}
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load(cls, path: str = INITIALIZER_FILE) -> InitialParameterPredictor | None:
+        if not os.path.isfile(path):
+            return None
+        import joblib
+
+        try:
+            bundle = joblib.load(path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Unable to load initial parameter predictor: %s", exc)
+            return None
+        if (
+            not isinstance(bundle, dict)
+            or bundle.get("version") != INITIALIZER_FORMAT_VERSION
+            or tuple(bundle.get("features", ())) != FEATURE_NAMES
+        ):
+            logger.warning("Ignoring incompatible initial parameter predictor %s", path)
+            return None
+        return cls(bundle.get("models", {}))
+
+    # -------------------------------------------------------------------------
+    def save(self, path: str = INITIALIZER_FILE) -> None:
+        import joblib
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        joblib.dump(
+            {
+                "version": INITIALIZER_FORMAT_VERSION,
+                "features": FEATURE_NAMES,
+                "models": self.models,
+            },
+            temporary_path,
+        )
+        os.replace(temporary_path, path)
+
+    # -------------------------------------------------------------------------
+    def predict(
+        self, model_name: str, parameters: list[str], features: np.ndarray
+    ) -> np.ndarray | None:
+        """Predict starting parameters for many experiments at once.
+
+        Keyword arguments:
+        model_name -- Model whose parameters are predicted.
+        parameters -- Parameter names in model signature order.
+        features -- Array of shape (N, F) built with :func:`isotherm_features`.
+
+        Return value:
+        Array of shape (N, K) in ``parameters`` order, or None when no regressor
+        was trained for this model and parameter layout.
+        """
+        entry = self.models.get(model_name)
+        if entry is None or entry["parameters"] != list(parameters):
+            return None
+        predicted = np.asarray(entry["estimator"].predict(features), dtype=np.float64)
+        predicted = predicted.reshape(features.shape[0], len(parameters))
+        log_scaled = np.asarray(entry["log_scaled"], dtype=bool)
+        predicted[:, log_scaled] = np.power(10.0, predicted[:, log_scaled])
+        return predicted
+
+    # -------------------------------------------------------------------------
+    def train(
+        self,
+        frames: Iterable[pd.DataFrame],
+        model_parameters: dict[str, list[str]],
+        neighbors: int = 5,
+        min_samples: int = 10,
+        max_samples: int = 20000,
+    ) -> dict[str, int]:
+        """Fit the per-model regressors on stored fitting results.
+
+        Keyword arguments:
+        frames -- Fitting results in the layout of the fitting tables, with the
+        measured ``pressure [Pa]`` and ``uptake [mol/g]`` vectors.
+        model_parameters -- Parameter names of every model to train.
+        neighbors -- Number of neighbours averaged by each regressor.
+        min_samples -- Models with fewer successful fits are left untrained.
+        max_samples -- Most recent samples kept per model.
+
+        Return value:
+        Number of training samples per trained model.
+        """
+        from sklearn.neighbors import KNeighborsRegressor
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler
+
+        frames = list(frames)
+        trained: dict[str, int] = {}
+        for model_name, parameters in model_parameters.items():
+            features, targets = self.collect_samples(frames, model_name, parameters)
+            previous = self.models.get(model_name)
+            if previous is not None and previous["parameters"] == list(parameters):
+                features = np.vstack([previous["features"], features])
+                targets = np.vstack([previous["targets"], targets])
+            if features.shape[0]:
+                # Refitting the same experiments again must not weigh them twice.
+                samples = np.hstack([features, targets])
+                _, first = np.unique(samples, axis=0, return_index=True)
+                keep = np.sort(first)[-max_samples:]
+                features, targets = features[keep], targets[keep]
+            if features.shape[0] < max(1, min_samples):
+                logger.info(
+                    "Not enough successful %s fits to train (%s)",
+                    model_name,
+                    features.shape[0],
+                )
+                continue
+
+            log_scaled = np.all(targets > 0, axis=0)
+            transformed = targets.copy()
+            transformed[:, log_scaled] = np.log10(transformed[:, log_scaled])
+            estimator = make_pipeline(
+                StandardScaler(),
+                KNeighborsRegressor(
+                    n_neighbors=min(neighbors, features.shape[0]), weights="distance"
+                ),
+            )
+            estimator.fit(features, transformed)
+            self.models[model_name] = {
+                "parameters": list(parameters),
+                "log_scaled": log_scaled.tolist(),
+                "features": features,
+                "targets": targets,
+                "estimator": estimator,
+            }
+            trained[model_name] = int(features.shape[0])
+        return trained
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def collect_samples(
+        frames: list[pd.DataFrame], model_name: str, parameters: list[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        features: list[np.ndarray] = []
+        targets: list[np.ndarray] = []
+        columns = [f"{model_name} {parameter}" for parameter in parameters]
+        score_column = f"{model_name} score"
+        for frame in frames:
+            if score_column not in frame or not set(columns).issubset(frame.columns):
+                continue
+            values = frame[columns].apply(pd.to_numeric, errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+            scores = pd.to_numeric(frame[score_column], errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+            # Only successful fits teach the regressor where optima lie.
+            valid = np.isfinite(scores) & np.all(np.isfinite(values), axis=1)
+            for position in np.flatnonzero(valid):
+                pressure = frame["pressure [Pa]"].iat[position]
+                uptake = frame["uptake [mol/g]"].iat[position]
+                sequence_types = (list, np.ndarray)
+                if not (
+                    isinstance(pressure, sequence_types)
+                    and isinstance(uptake, sequence_types)
+                ):
+                    continue
+                if len(pressure) == 0 or len(uptake) != len(pressure):
+                    continue
+                uptake_values = np.asarray(uptake, dtype=np.float64)
+                total = float(np.sum((uptake_values - uptake_values.mean()) ** 2))
+                r_squared = 1.0 - scores[position] / total if total > 0 else 0.0
+                if r_squared < MIN_TRAINING_R_SQUARED:
+                    continue
+                features.append(isotherm_features(pressure, uptake))
+                targets.append(values[position])
+        if not features:
+            empty = np.empty((0, len(FEATURE_NAMES)), dtype=np.float64)
+            return empty, np.empty((0, len(parameters)), dtype=np.float64)
+        return np.vstack(features), np.vstack(targets)
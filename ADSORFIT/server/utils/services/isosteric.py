@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.server.utils.configurations import IsostericHeatSettings, server_settings
+from ADSORFIT.server.utils.services.globalfit import GAS_CONSTANT
+from ADSORFIT.server.utils.services.models import AdsorptionModels
+from ADSORFIT.server.utils.services.predictions import CurvePredictionService
+
+
+###############################################################################
+class IsothermInverter:
+    """Pressures at which fitted isotherms reach given loadings, many fits at once.
+
+    Models with an explicit inverse are inverted in closed form. The others are
+    solved by bisection on ln(p), run on whole arrays: every step evaluates all
+    fits at all loadings with one call to :meth:`AdsorptionModels.evaluate`. The
+    bracket spans ``bracket_decades`` decades on either side of the highest
+    measured pressure; loadings the isotherm does not reach inside it are NaN.
+    """
+
+    def __init__(
+        self,
+        collection: AdsorptionModels | None = None,
+        settings: IsostericHeatSettings | None = None,
+    ) -> None:
+        self.collection = collection or AdsorptionModels()
+        self.settings = settings or server_settings.fitting.isosteric_heat
+        self.closed_forms: dict[str, Callable[..., np.ndarray]] = {
+            "LANGMUIR": self.langmuir_inverse,
+            "SIPS": self.sips_inverse,
+            "FREUNDLICH": self.freundlich_inverse,
+            "TEMKIN": self.temkin_inverse,
+            "TOTH": self.toth_inverse,
+            "JOVANOVIC": self.jovanovic_inverse,
+        }
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def langmuir_inverse(loading: np.ndarray, k: float, qsat: float) -> np.ndarray:
+        return loading / (k * (qsat - loading))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sips_inverse(
+        loading: np.ndarray, k: float, qsat: float, exponent: float
+    ) -> np.ndarray:
+        return (loading / (k * (qsat - loading))) ** (1.0 / exponent)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def freundlich_inverse(
+        loading: np.ndarray, k: float, exponent: float
+    ) -> np.ndarray:
+        return loading**exponent / k
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def temkin_inverse(loading: np.ndarray, k: float, beta: float) -> np.ndarray:
+        return np.exp(loading / beta) / k
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def toth_inverse(
+        loading: np.ndarray, k: float, qsat: float, exponent: float
+    ) -> np.ndarray:
+        coverage = loading / qsat
+        return coverage / (k * (1.0 - coverage**exponent) ** (1.0 / exponent))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def jovanovic_inverse(loading: np.ndarray, k: float, qsat: float) -> np.ndarray:
+        return -np.log1p(-loading / qsat) / k
+
+    # -------------------------------------------------------------------------
+    def invert(
+        self,
+        model_key: str,
+        parameters: np.ndarray,
+        loading: np.ndarray,
+        reference: np.ndarray,
+    ) -> np.ndarray:
+        """Return the pressures (Pa) at which each fit reaches the given loadings.
+
+        Keyword arguments:
+        model_key -- Normalized model name shared by all fits.
+        parameters -- Fitted parameters of shape (M, K), in model signature order.
+        loading -- Loadings (mol/g) of shape (M, L), one grid per fit.
+        reference -- Highest measured pressure of each fit, shape (M,).
+
+        Return value:
+        Array of shape (M, L) with the pressures, NaN where the fit does not
+        reach the loading.
+        """
+        parameters = np.asarray(parameters, dtype=np.float64)
+        loading = np.asarray(loading, dtype=np.float64)
+        closed_form = self.closed_forms.get(model_key)
+        with np.errstate(all="ignore"):
+            if closed_form is not None:
+                columns = [
+                    parameters[:, [index]] for index in range(parameters.shape[1])
+                ]
+                pressure = closed_form(loading, *columns)
+            else:
+                pressure = self.bisect(model_key, parameters, loading, reference)
+        valid = np.isfinite(pressure) & (pressure > 0) & (loading > 0)
+        return np.where(valid, pressure, np.nan)
+
+    # -------------------------------------------------------------------------
+    def bisect(
+        self,
+        model_key: str,
+        parameters: np.ndarray,
+        loading: np.ndarray,
+        reference: np.ndarray,
+    ) -> np.ndarray:
+        span = self.settings.bracket_decades * np.log(10.0)
+        center = np.log(np.asarray(reference, dtype=np.float64))[:, np.newaxis]
+        lower = np.broadcast_to(center - span, loading.shape).copy()
+        upper = np.broadcast_to(center + span, loading.shape).copy()
+        out = np.empty_like(loading)
+        work = np.empty_like(loading)
+        evaluate = self.collection.evaluate
+        # Only loadings bracketed by an increasing isotherm are searched.
+        bracketed = evaluate(model_key, parameters, np.exp(lower), out, work) <= loading
+        bracketed &= (
+            evaluate(model_key, parameters, np.exp(upper), out, work) >= loading
+        )
+        for _ in range(self.settings.bisection_iterations):
+            middle = 0.5 * (lower + upper)
+            uptake = evaluate(model_key, parameters, np.exp(middle), out, work)
+            below = uptake < loading
+            np.copyto(lower, middle, where=below)
+            np.copyto(upper, middle, where=~below)
+        return np.where(bracketed, np.exp(0.5 * (lower + upper)), np.nan)
+
+
+###############################################################################
+class IsostericHeatService:
+    """Isosteric heats of adsorption from stored fits at several temperatures.
+
+    For every material, the fitted isotherms of its experiments are inverted at a
+    common loading grid, and the Clausius-Clapeyron relation
+    Qst = -R * d(ln p) / d(1/T) is fitted by least squares at each loading. All
+    materials are handled together: fits sharing a model are inverted in one
+    call, and the regressions of every material and loading are computed from
+    padded (material, experiment, loading) arrays in a single pass.
+    """
+
+    def __init__(self, predictions: CurvePredictionService | None = None) -> None:
+        # Stored fits are read through the curve prediction snapshot, so both
+        # services see the same data and are invalidated together.
+        self.predictions = predictions or CurvePredictionService()
+        self.settings = server_settings.fitting.isosteric_heat
+        self.inverter = IsothermInverter(self.predictions.collection, self.settings)
+
+    # -------------------------------------------------------------------------
+    def compute(
+        self,
+        materials: list[dict[str, Any]],
+        loadings: list[float] | None = None,
+        points: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Compute isosteric heat curves for groups of experiments.
+
+        Keyword arguments:
+        materials -- One dictionary per material with a ``name``, the
+        ``experiment_ids`` of its isotherms at different temperatures and an
+        optional ``model``; each experiment's best model is used when omitted.
+        loadings -- Loading grid (mol/g) shared by all materials. When omitted,
+        each material gets ``points`` loadings spanning the range reached by all
+        of its measured isotherms.
+        points -- Number of loadings of the automatic grids.
+
+        Return value:
+        List of per-material dictionaries with the loading grid, the isosteric
+        heat and its standard error (kJ/mol), the R^2 of the van't Hoff
+        regression and the number of temperatures used at each loading.
+        """
+        resolved = [self.resolve_material(material) for material in materials]
+        grids = self.build_grids(resolved, loadings, points)
+
+        # One row per experiment across all materials.
+        rows = [entry for material in resolved for entry in material["experiments"]]
+        owners = np.repeat(
+            np.arange(len(resolved)),
+            [len(material["experiments"]) for material in resolved],
+        )
+        row_loadings = grids[owners]
+        log_pressure = np.full(row_loadings.shape, np.nan, dtype=np.float64)
+        for model_key in {entry["model_key"] for entry in rows}:
+            selected = np.array(
+                [
+                    index
+                    for index, entry in enumerate(rows)
+                    if entry["model_key"] == model_key
+                ]
+            )
+            pressure = self.inverter.invert(
+                model_key,
+                np.vstack([rows[index]["parameters"] for index in selected]),
+                row_loadings[selected],
+                np.array([rows[index]["max_pressure"] for index in selected]),
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_pressure[selected] = np.log(pressure)
+
+        # Pad to (materials, experiments, loadings) for the batched regression.
+        width = max(len(material["experiments"]) for material in resolved)
+        slots = np.concatenate(
+            [np.arange(len(material["experiments"])) for material in resolved]
+        )
+        inverse_t = np.full((len(resolved), width), np.nan, dtype=np.float64)
+        inverse_t[owners, slots] = [1.0 / entry["temperature"] for entry in rows]
+        response = np.full((len(resolved), width, grids.shape[1]), np.nan)
+        response[owners, slots] = log_pressure
+        heat, error, r_squared, counts = self.regress(inverse_t, response)
+
+        measured = np.array([entry["max_uptake"] for entry in rows])
+        beyond = row_loadings > measured[:, np.newaxis]
+        extrapolated = np.bincount(
+            owners, weights=beyond.sum(axis=1), minlength=len(resolved)
+        )
+        to_json = self.predictions.to_json_values
+        return [
+            {
+                "name": material["name"],
+                "experiments": [
+                    {
+                        key: entry[key]
+                        for key in (
+                            "experiment_id",
+                            "experiment",
+                            "model",
+                            "temperature",
+                        )
+                    }
+                    for entry in material["experiments"]
+                ],
+                "loading": grids[index].tolist(),
+                "isosteric_heat": to_json(heat[index]),
+                "isosteric_heat_error": to_json(error[index]),
+                "r_squared": to_json(r_squared[index]),
+                "temperatures_used": counts[index].tolist(),
+                "extrapolated_points": int(extrapolated[index]),
+            }
+            for index, material in enumerate(resolved)
+        ]
+
+    # -------------------------------------------------------------------------
+    def regress(
+        self, inverse_t: np.ndarray, log_pressure: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Fit ln(p) = a + b / T at every material and loading.
+
+        Keyword arguments:
+        inverse_t -- Reciprocal temperatures of shape (M, E), NaN for padding.
+        log_pressure -- ln(p) of shape (M, E, L), NaN where no pressure exists.
+
+        Return value:
+        Isosteric heat and its standard error (kJ/mol), R^2 and the number of
+        points of each regression, all of shape (M, L). Heats need at least
+        ``min_temperatures`` points; the error and R^2 need three.
+        """
+        x = np.broadcast_to(inverse_t[:, :, np.newaxis], log_pressure.shape)
+        weights = np.isfinite(x) & np.isfinite(log_pressure)
+        x = np.where(weights, x, 0.0)
+        y = np.where(weights, log_pressure, 0.0)
+        counts = weights.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_mean = x.sum(axis=1) / counts
+            y_mean = y.sum(axis=1) / counts
+            dx = np.where(weights, x - x_mean[:, np.newaxis], 0.0)
+            dy = np.where(weights, y - y_mean[:, np.newaxis], 0.0)
+            sxx = (dx * dx).sum(axis=1)
+            sxy = (dx * dy).sum(axis=1)
+            syy = (dy * dy).sum(axis=1)
+            slope = sxy / sxx
+            residual = np.clip(syy - slope * sxy, 0.0, None)
+            slope_error = np.sqrt(residual / (counts - 2) / sxx)
+            r_squared = np.where(syy > 0, 1.0 - residual / syy, 1.0)
+        usable = (counts >= self.settings.min_temperatures) & (sxx > 0)
+        heat = np.where(usable, -GAS_CONSTANT * slope / 1000.0, np.nan)
+        error = np.where(
+            usable & (counts > 2), GAS_CONSTANT * slope_error / 1000.0, np.nan
+        )
+        r_squared = np.where(usable & (counts > 2), r_squared, np.nan)
+        return heat, error, r_squared, counts
+
+    # -------------------------------------------------------------------------
+    def build_grids(
+        self,
+        materials: list[dict[str, Any]],
+        loadings: list[float] | None,
+        points: int | None,
+    ) -> np.ndarray:
+        if loadings is not None:
+            grid = np.asarray(loadings, dtype=np.float64)
+            if grid.size == 0 or not np.all(np.isfinite(grid)) or np.any(grid <= 0):
+                raise ValueError("Loading grid must contain finite, positive values.")
+            if grid.size > self.settings.max_points:
+                raise ValueError(
+                    f"Loading grid of {grid.size} points exceeds the limit of "
+                    f"{self.settings.max_points}."
+                )
+            return np.tile(grid, (len(materials), 1))
+
+        count = min(points or self.settings.default_points, self.settings.max_points)
+        # Automatic grids stay within the loadings measured at every temperature.
+        upper = np.array(
+            [
+                min(entry["max_uptake"] for entry in material["experiments"])
+                for material in materials
+            ]
+        )
+        if not np.all(np.isfinite(upper) & (upper > 0)):
+            raise ValueError("Materials need positive measured uptakes.")
+        unit = np.linspace(self.settings.loading_lower_fraction, 1.0, count)
+        return upper[:, np.newaxis] * unit
+
+    # -------------------------------------------------------------------------
+    def resolve_material(self, material: dict[str, Any]) -> dict[str, Any]:
+        snapshot = self.predictions.load_snapshot()
+        experiments = snapshot["experiments"]
+        identifiers = [int(identifier) for identifier in material["experiment_ids"]]
+        missing = [
+            identifier
+            for identifier in identifiers
+            if identifier not in experiments.index
+        ]
+        if missing:
+            raise ValueError(f"Unknown experiment ids: {missing}")
+
+        resolved = []
+        for identifier in identifiers:
+            model_name = material.get("model") or snapshot["best"].get(identifier)
+            if not model_name:
+                raise ValueError(f"Experiment {identifier} has no best model stored.")
+            model_key = self.predictions.resolve_model_key(model_name)
+            display_name = self.predictions.serializer.model_schemas[model_key][
+                "prefix"
+            ]
+            fits = snapshot["parameters"][model_key]
+            parameters = (
+                fits.loc[identifier].to_numpy(dtype=np.float64)
+                if identifier in fits.index
+                else np.array([np.nan])
+            )
+            if not np.all(np.isfinite(parameters)):
+                raise ValueError(
+                    f"Experiment {identifier} has no fitted {display_name} parameters."
+                )
+            row = experiments.loc[identifier]
+            resolved.append(
+                {
+                    "experiment_id": identifier,
+                    "experiment": str(row["experiment"]),
+                    "model": display_name,
+                    "model_key": model_key,
+                    "parameters": parameters,
+                    "temperature": float(row["temperature [K]"]),
+                    "max_pressure": float(row["max_pressure"]),
+                    "max_uptake": float(row["max_uptake"]),
+                }
+            )
+
+        temperatures = {entry["temperature"] for entry in resolved}
+        if len(temperatures) < self.settings.min_temperatures:
+            raise ValueError(
+                f"Material {material['name']} needs isotherms at "
+                f"{self.settings.min_temperatures} or more temperatures."
+            )
+        return {"name": str(material["name"]), "experiments": resolved}
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from collections.abc import Sequence
+
+from ADSORFIT.server.utils.locks import FileWriteLock
+from ADSORFIT.server.utils.constants import METHOD_STATISTICS_FILE
+from ADSORFIT.server.utils.logger import logger
+
+METHOD_STATISTICS_VERSION = 1
+# Seconds a run waits for another process merging its statistics into the file.
+METHOD_STATISTICS_LOCK_TIMEOUT = 30.0
+
+
+###############################################################################
+class MethodStatistics:
+    """Convergence and timing history of every optimization method, per model.
+
+    Each attempt of the automatic method records whether the method produced a
+    usable fit and how long it took. The history orders the fallback ladder: the
+    method with the lowest expected time per successful fit is tried first, once
+    it has been attempted often enough. Attempts of a run are merged into the file
+    under a process lock, so concurrent workers and batch processes add to the same
+    history instead of overwriting each other.
+    """
+
+    def __init__(
+        self,
+        history: dict[str, dict[str, list[float]]] | None = None,
+        path: str = METHOD_STATISTICS_FILE,
+    ) -> None:
+        self.path = path
+        # model -> method -> [attempts, successes, seconds]
+        self.history: dict[str, dict[str, list[float]]] = history or {}
+        self.recorded: dict[str, dict[str, list[float]]] = {}
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load(cls, path: str = METHOD_STATISTICS_FILE) -> MethodStatistics:
+        return cls(cls.read(path), path)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def read(path: str) -> dict[str, dict[str, list[float]]]:
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                payload = json.load(file)
+        except (OSError, ValueError) as exc:
+            logger.warning("Unable to read optimization method statistics: %s", exc)
+            return {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != METHOD_STATISTICS_VERSION
+        ):
+            logger.warning("Ignoring incompatible method statistics %s", path)
+            return {}
+        history: dict[str, dict[str, list[float]]] = {}
+        for model_name, methods in dict(payload.get("models", {})).items():
+            for method, counts in dict(methods).items():
+                if isinstance(counts, list) and len(counts) == 3:
+                    history.setdefault(str(model_name), {})[str(method)] = [
+                        float(value) for value in counts
+                    ]
+        return history
+
+    # -------------------------------------------------------------------------
+    def record(
+        self, model_name: str, method: str, succeeded: bool, seconds: float
+    ) -> None:
+        for totals in (self.history, self.recorded):
+            entry = totals.setdefault(model_name, {}).setdefault(
+                method, [0.0, 0.0, 0.0]
+            )
+            entry[0] += 1.0
+            entry[1] += 1.0 if succeeded else 0.0
+            entry[2] += max(0.0, float(seconds))
+
+    # -------------------------------------------------------------------------
+    def expected_cost(self, model_name: str, method: str) -> float:
+        """Return the expected seconds spent per successful fit of the method.
+
+        The success rate is smoothed (Laplace rule), so a method that failed its
+        first few attempts is not ruled out for good.
+        """
+        attempts, successes, seconds = self.history.get(model_name, {}).get(
+            method, [0.0, 0.0, 0.0]
+        )
+        if attempts <= 0:
+            return float("inf")
+        success_rate = (successes + 1.0) / (attempts + 2.0)
+        return (seconds / attempts) / success_rate
+
+    # -------------------------------------------------------------------------
+    def order(
+        self, model_name: str, ladder: Sequence[str], min_attempts: int
+    ) -> list[str]:
+        """Return the ladder with the historically cheapest method moved first.
+
+        Keyword arguments:
+        model_name -- Model being fitted.
+        ladder -- Configured fallback order.
+        min_attempts -- Methods attempted fewer times are not promoted.
+
+        Return value:
+        Methods in the order they are tried; the configured order is kept after
+        the promoted method, and entirely when no method has enough history.
+        """
+        methods = self.history.get(model_name, {})
+        known = [
+            method
+            for method in ladder
+            if methods.get(method, [0.0])[0] >= max(1, min_attempts)
+        ]
+        if not known:
+            return list(ladder)
+        first = min(known, key=lambda method: self.expected_cost(model_name, method))
+        return [first, *(method for method in ladder if method != first)]
+
+    # -------------------------------------------------------------------------
+    def save(self) -> None:
+        """Merge the attempts recorded by this run into the statistics file."""
+        if not self.recorded:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        lock = FileWriteLock(f"{self.path}.lock", METHOD_STATISTICS_LOCK_TIMEOUT)
+        try:
+            with lock.hold():
+                merged = self.read(self.path)
+                for model_name, methods in self.recorded.items():
+                    for method, counts in methods.items():
+                        entry = merged.setdefault(model_name, {}).setdefault(
+                            method, [0.0, 0.0, 0.0]
+                        )
+                        for position, value in enumerate(counts):
+                            entry[position] += value
+                temporary_path = f"{self.path}.{uuid.uuid4().hex[:8]}.tmp"
+                with open(temporary_path, "w", encoding="utf-8") as file:
+                    json.dump(
+                        {"version": METHOD_STATISTICS_VERSION, "models": merged},
+                        file,
+                        indent=2,
+                    )
+                os.replace(temporary_path, self.path)
+        except (OSError, TimeoutError) as exc:
+            logger.warning("Unable to save optimization method statistics: %s", exc)
+            return
+        self.history = merged
+        self.recorded = {}
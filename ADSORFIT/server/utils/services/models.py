@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import wraps
 from typing import Any
 
 import numpy as np
@@ -7,6 +9,33 @@ import numpy as np
 from ADSORFIT.server.utils.constants import FITTING_MODEL_NAMES
 
 
+# -------------------------------------------------------------------------
+def as_parameter_column(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        value = np.asarray(value, dtype=np.float64)
+    if isinstance(value, np.ndarray) and value.ndim == 1:
+        return value[:, np.newaxis]
+    return value
+
+
+# -------------------------------------------------------------------------
+def broadcast_parameters(
+    model: Callable[..., np.ndarray],
+) -> Callable[..., np.ndarray]:
+    """Let a model accept parameter vectors of shape (M,) in place of scalars.
+
+    Vectors are reshaped to (M, 1) columns, so they broadcast against an (N,)
+    pressure array and the model returns an (M, N) uptake matrix. Scalar
+    parameters keep the original (N,) output used by the optimizers.
+    """
+
+    @wraps(model)
+    def wrapper(pressure: np.ndarray, *params: Any) -> np.ndarray:
+        return model(pressure, *[as_parameter_column(value) for value in params])
+
+    return wrapper
+
+
 ###############################################################################
 class AdsorptionModels:
     def __init__(self) -> None:
@@ -23,18 +52,52 @@ class AdsorptionModels:
             "JOVANOVIC": self.jovanovic,
         }
 
-        missing = [name for name in self.model_names if name not in self.models]
+        # In-place kernels used by :meth:`evaluate`; they mirror the model functions
+        # but write into caller-provided buffers instead of allocating temporaries.
+        self.kernels = {
+            "LANGMUIR": self.langmuir_kernel,
+            "SIPS": self.sips_kernel,
+            "FREUNDLICH": self.freundlich_kernel,
+            "TEMKIN": self.temkin_kernel,
+            "TOTH": self.toth_kernel,
+            "DUBININ_RADUSHKEVICH": self.dubinin_radushkevich_kernel,
+            "DUAL_SITE_LANGMUIR": self.dual_site_langmuir_kernel,
+            "REDLICH_PETERSON": self.redlich_peterson_kernel,
+            "JOVANOVIC": self.jovanovic_kernel,
+        }
+        # Analytic parameter derivatives used by :meth:`jacobian`.
+        self.derivatives = {
+            "LANGMUIR": self.langmuir_derivatives,
+            "SIPS": self.sips_derivatives,
+            "FREUNDLICH": self.freundlich_derivatives,
+            "TEMKIN": self.temkin_derivatives,
+            "TOTH": self.toth_derivatives,
+            "DUBININ_RADUSHKEVICH": self.dubinin_radushkevich_derivatives,
+            "DUAL_SITE_LANGMUIR": self.dual_site_langmuir_derivatives,
+            "REDLICH_PETERSON": self.redlich_peterson_derivatives,
+            "JOVANOVIC": self.jovanovic_derivatives,
+        }
+
+        missing = [
+            name
+            for name in self.model_names
+            if name not in self.models
+            or name not in self.kernels
+            or name not in self.derivatives
+        ]
         if missing:
             raise ValueError(f"Model definitions missing for: {', '.join(missing)}")
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def langmuir(pressure: np.ndarray, k: float, qsat: float) -> np.ndarray:
         k_p = pressure * k
         return qsat * (k_p / (1 + k_p))
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def sips(
         pressure: np.ndarray, k: float, qsat: float, exponent: float
     ) -> np.ndarray:
@@ -43,24 +106,27 @@ class AdsorptionModels:
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def freundlich(pressure: np.ndarray, k: float, exponent: float) -> np.ndarray:
         p = np.asarray(pressure, dtype=np.float64)
-        safe_k = float(np.clip(k, 1e-12, None))
-        safe_exponent = float(np.clip(exponent, 1e-12, None))
+        safe_k = np.clip(k, 1e-12, None)
+        safe_exponent = np.clip(exponent, 1e-12, None)
         base = np.clip(p * safe_k, 1e-12, None)
         return np.power(base, 1.0 / safe_exponent)
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def temkin(pressure: np.ndarray, k: float, beta: float) -> np.ndarray:
         p = np.asarray(pressure, dtype=np.float64)
-        safe_k = float(np.clip(k, 1e-12, None))
-        safe_beta = float(np.clip(beta, 1e-12, None))
+        safe_k = np.clip(k, 1e-12, None)
+        safe_beta = np.clip(beta, 1e-12, None)
         argument = np.clip(p * safe_k, 1e-12, None)
         return safe_beta * np.log(argument)
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def toth(
         pressure: np.ndarray,
         k: float,
@@ -74,6 +140,7 @@ class AdsorptionModels:
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def dubinin_radushkevich(
         pressure: np.ndarray, qsat: float, beta: float
     ) -> np.ndarray:
@@ -84,6 +151,7 @@ class AdsorptionModels:
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def dual_site_langmuir(
         pressure: np.ndarray, k1: float, qsat1: float, k2: float, qsat2: float
     ) -> np.ndarray:
@@ -96,6 +164,7 @@ class AdsorptionModels:
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def redlich_peterson(
         pressure: np.ndarray, k: float, a: float, beta: float
     ) -> np.ndarray:
@@ -105,17 +174,369 @@ class AdsorptionModels:
 
     # -------------------------------------------------------------------------
     @staticmethod
+    @broadcast_parameters
     def jovanovic(pressure: np.ndarray, k: float, qsat: float) -> np.ndarray:
         return qsat * (1.0 - np.exp(-k * pressure))
 
     # -------------------------------------------------------------------------
-    def get_model(self, model_name: str) -> Any:
-        normalized = (
+    @staticmethod
+    def normalize_name(model_name: str) -> str:
+        return (
             model_name.replace("-", "_").replace(" ", "_").upper()
             if isinstance(model_name, str)
             else model_name
         )
+
+    # -------------------------------------------------------------------------
+    def get_model(self, model_name: str) -> Any:
+        normalized = self.normalize_name(model_name)
         try:
             return self.models[normalized]
         except KeyError as exc:
             raise ValueError(f"Model {model_name} is not supported") from exc
+
+    # -------------------------------------------------------------------------
+    def evaluate(
+        self,
+        model_name: str,
+        parameters: np.ndarray,
+        pressure: np.ndarray,
+        out: np.ndarray | None = None,
+        work: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Evaluate a model for many parameter sets in a single vectorized pass.
+
+        Keyword arguments:
+        model_name -- Name of the adsorption model to evaluate.
+        parameters -- Array of shape (M, K) holding one parameter set per row, in
+        model signature order. A single (K,) vector is treated as M = 1.
+        pressure -- Pressure grid of shape (N,), shared by every parameter set, or
+        (M, N) with one grid per parameter set.
+        out -- Optional float64 buffer of shape (M, N) receiving the uptakes.
+        work -- Optional float64 scratch buffer of shape (M, N).
+
+        Return value:
+        Array of shape (M, N) with predicted uptakes (``out`` when provided).
+        """
+        normalized = self.normalize_name(model_name)
+        try:
+            kernel = self.kernels[normalized]
+        except KeyError as exc:
+            raise ValueError(f"Model {model_name} is not supported") from exc
+
+        matrix = np.asarray(parameters, dtype=np.float64)
+        if matrix.ndim == 1:
+            matrix = matrix[np.newaxis, :]
+        grid = np.asarray(pressure, dtype=np.float64)
+        if grid.ndim == 2:
+            if grid.shape[0] != matrix.shape[0]:
+                raise ValueError(
+                    "Pressure grid rows must match the number of parameter sets"
+                )
+        else:
+            grid = grid.reshape(-1)
+        shape = (matrix.shape[0], grid.shape[-1])
+        out = self.ensure_buffer(out, shape)
+        work = self.ensure_buffer(work, shape)
+        columns = [matrix[:, [index]] for index in range(matrix.shape[1])]
+        with np.errstate(all="ignore"):
+            kernel(grid, columns, out, work)
+        return out
+
+    # -------------------------------------------------------------------------
+    def jacobian(
+        self, model_name: str, parameters: np.ndarray, pressure: np.ndarray
+    ) -> np.ndarray:
+        """Evaluate the parameter derivatives of a model for many parameter sets.
+
+        Keyword arguments:
+        model_name -- Name of the adsorption model.
+        parameters -- Array of shape (M, K) holding one parameter set per row, in
+        model signature order. A single (K,) vector is treated as M = 1.
+        pressure -- Pressure grid of shape (N,), shared by every parameter set, or
+        (M, N) with one grid per parameter set.
+
+        Return value:
+        Array of shape (M, N, K) with the analytic derivatives of the uptakes with
+        respect to each parameter.
+        """
+        normalized = self.normalize_name(model_name)
+        try:
+            derivatives = self.derivatives[normalized]
+        except KeyError as exc:
+            raise ValueError(f"Model {model_name} is not supported") from exc
+
+        matrix = np.asarray(parameters, dtype=np.float64)
+        if matrix.ndim == 1:
+            matrix = matrix[np.newaxis, :]
+        grid = np.asarray(pressure, dtype=np.float64)
+        if grid.ndim == 2:
+            if grid.shape[0] != matrix.shape[0]:
+                raise ValueError(
+                    "Pressure grid rows must match the number of parameter sets"
+                )
+        else:
+            grid = grid.reshape(-1)
+        result = np.empty(
+            (matrix.shape[0], grid.shape[-1], matrix.shape[1]), dtype=np.float64
+        )
+        columns = [matrix[:, [index]] for index in range(matrix.shape[1])]
+        with np.errstate(all="ignore"):
+            for index, values in enumerate(derivatives(grid, columns)):
+                result[:, :, index] = values
+        return result
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def ensure_buffer(buffer: np.ndarray | None, shape: tuple[int, int]) -> np.ndarray:
+        if buffer is None:
+            return np.empty(shape, dtype=np.float64)
+        if buffer.shape != shape or buffer.dtype != np.float64:
+            raise ValueError(
+                f"Output buffer must be float64 with shape {shape}, got "
+                f"{buffer.dtype} {buffer.shape}"
+            )
+        return buffer
+
+    # [IN-PLACE KERNELS]
+    # Each kernel receives the (N,) or (M, N) pressure grid, the list of (M, 1) parameter
+    # columns and two (M, N) buffers, and leaves the uptakes in ``out``.
+    ###########################################################################
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def langmuir_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, qsat = params
+        np.multiply(k, p, out=out)
+        np.add(out, 1.0, out=work)
+        np.divide(out, work, out=out)
+        np.multiply(out, qsat, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sips_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, qsat, exponent = params
+        np.power(p, exponent, out=out)
+        np.multiply(out, k, out=out)
+        np.add(out, 1.0, out=work)
+        np.divide(out, work, out=out)
+        np.multiply(out, qsat, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def freundlich_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, exponent = params
+        np.multiply(p, np.clip(k, 1e-12, None), out=out)
+        np.clip(out, 1e-12, None, out=out)
+        np.power(out, 1.0 / np.clip(exponent, 1e-12, None), out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def temkin_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, beta = params
+        np.multiply(p, np.clip(k, 1e-12, None), out=out)
+        np.clip(out, 1e-12, None, out=out)
+        np.log(out, out=out)
+        np.multiply(out, np.clip(beta, 1e-12, None), out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def toth_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, qsat, exponent = params
+        np.multiply(k, p, out=work)
+        np.power(work, exponent, out=out)
+        np.add(out, 1.0, out=out)
+        np.power(out, 1.0 / exponent, out=out)
+        np.divide(work, out, out=out)
+        np.multiply(out, qsat, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def dubinin_radushkevich_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        qsat, beta = params
+        term = np.log(np.clip(p, 1e-12, None))
+        np.multiply(-beta, term * term, out=out)
+        np.exp(out, out=out)
+        np.multiply(out, qsat, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def dual_site_langmuir_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k1, qsat1, k2, qsat2 = params
+        np.multiply(k1, p, out=work)
+        np.add(work, 1.0, out=out)
+        np.divide(work, out, out=out)
+        np.multiply(out, qsat1, out=out)
+        # The second site uses x / (1 + x) = 1 / (1 + 1 / x) to stay within the
+        # single scratch buffer; x = 0 still maps to 0 through 1 / inf.
+        np.multiply(k2, p, out=work)
+        np.reciprocal(work, out=work)
+        np.add(work, 1.0, out=work)
+        np.reciprocal(work, out=work)
+        np.multiply(work, qsat2, out=work)
+        np.add(out, work, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def redlich_peterson_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, a, beta = params
+        np.power(p, beta, out=work)
+        np.multiply(work, a, out=work)
+        np.add(work, 1.0, out=work)
+        np.multiply(k, p, out=out)
+        np.divide(out, work, out=out)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def jovanovic_kernel(
+        p: np.ndarray, params: list[np.ndarray], out: np.ndarray, work: np.ndarray
+    ) -> None:
+        k, qsat = params
+        np.multiply(k, p, out=out)
+        np.negative(out, out=out)
+        np.expm1(out, out=out)
+        np.multiply(out, -qsat, out=out)
+
+    # [ANALYTIC DERIVATIVES]
+    # Each function receives the (N,) or (M, N) pressure grid and the list of (M, 1)
+    # parameter columns, and returns the derivatives of the uptake with respect to
+    # every parameter, in signature order, as arrays broadcasting to (M, N).
+    ###########################################################################
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def log_pressure(p: np.ndarray) -> np.ndarray:
+        # Zero pressures give finite logarithms, so terms like x * ln(p) vanish
+        # there instead of turning into 0 * -inf.
+        return np.log(np.maximum(p, np.finfo(np.float64).tiny))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def langmuir_derivatives(
+        p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, qsat = params
+        denominator = 1.0 + k * p
+        return [qsat * p / (denominator * denominator), k * p / denominator]
+
+    # -------------------------------------------------------------------------
+    def sips_derivatives(
+        self, p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, qsat, exponent = params
+        p_n = p**exponent
+        k_p = k * p_n
+        denominator = 1.0 + k_p
+        slope = qsat / (denominator * denominator)
+        return [
+            slope * p_n,
+            k_p / denominator,
+            slope * k_p * self.log_pressure(p),
+        ]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def freundlich_derivatives(
+        p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, exponent = params
+        safe_k = np.clip(k, 1e-12, None)
+        safe_exponent = np.clip(exponent, 1e-12, None)
+        product = p * safe_k
+        base = np.clip(product, 1e-12, None)
+        uptake = base ** (1.0 / safe_exponent)
+        return [
+            np.where(product > 1e-12, uptake / (safe_exponent * safe_k), 0.0),
+            -uptake * np.log(base) / (safe_exponent * safe_exponent),
+        ]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def temkin_derivatives(
+        p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, beta = params
+        safe_k = np.clip(k, 1e-12, None)
+        product = p * safe_k
+        return [
+            np.where(product > 1e-12, np.clip(beta, 1e-12, None) / safe_k, 0.0),
+            np.log(np.clip(product, 1e-12, None)),
+        ]
+
+    # -------------------------------------------------------------------------
+    def toth_derivatives(
+        self, p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, qsat, exponent = params
+        k_p = k * p
+        k_p_n = k_p**exponent
+        denominator = 1.0 + k_p_n
+        scaled = denominator ** (-1.0 / exponent)
+        uptake = qsat * k_p * scaled
+        return [
+            qsat * p * scaled / denominator,
+            k_p * scaled,
+            uptake
+            * (
+                np.log(denominator) / (exponent * exponent)
+                - k_p_n * self.log_pressure(k_p) / (exponent * denominator)
+            ),
+        ]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def dubinin_radushkevich_derivatives(
+        p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        qsat, beta = params
+        term = np.log(np.clip(p, 1e-12, None))
+        squared = term * term
+        decay = np.exp(-beta * squared)
+        return [decay, -qsat * squared * decay]
+
+    # -------------------------------------------------------------------------
+    def dual_site_langmuir_derivatives(
+        self, p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k1, qsat1, k2, qsat2 = params
+        return [
+            *self.langmuir_derivatives(p, [k1, qsat1]),
+            *self.langmuir_derivatives(p, [k2, qsat2]),
+        ]
+
+    # -------------------------------------------------------------------------
+    def redlich_peterson_derivatives(
+        self, p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, a, beta = params
+        p_beta = p**beta
+        denominator = 1.0 + a * p_beta
+        uptake = k * p / denominator
+        return [
+            p / denominator,
+            -uptake * p_beta / denominator,
+            -uptake * a * p_beta * self.log_pressure(p) / denominator,
+        ]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def jovanovic_derivatives(
+        p: np.ndarray, params: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        k, qsat = params
+        decay = np.exp(-k * p)
+        return [qsat * p * decay, -np.expm1(-k * p)]
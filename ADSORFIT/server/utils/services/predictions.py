@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.server.utils.cache import LRUCache
+from ADSORFIT.server.utils.configurations import server_settings
+from ADSORFIT.server.utils.repository.isotherms import IsothermSnapshot, IsothermStore
+from ADSORFIT.server.utils.repository.serializer import DataSerializer
+from ADSORFIT.server.utils.services.models import AdsorptionModels
+
+# Lower end of auto grids, relative to the maximum pressure, for experiments whose
+# minimum recorded pressure is zero (logarithmic grids cannot start at zero).
+AUTO_GRID_MIN_RATIO = 1e-4
+PRESSURE_COLUMN = "pressure [Pa]"
+UPTAKE_COLUMN = "uptake [mol/g]"
+
+
+###############################################################################
+class CurvePredictionService:
+    def __init__(self) -> None:
+        self.serializer = DataSerializer()
+        self.collection = AdsorptionModels()
+        self.isotherms = IsothermStore()
+        settings = server_settings.fitting
+        self.default_points = settings.prediction_default_points
+        self.max_points = settings.prediction_max_points
+        self.cache = LRUCache(
+            settings.prediction_cache_size, settings.prediction_cache_ttl
+        )
+        # Stored fits are loaded once and shared by all requests until they expire
+        # or a new fitting run replaces them.
+        self.snapshot_cache = LRUCache(1, settings.prediction_cache_ttl)
+
+    # -------------------------------------------------------------------------
+    def invalidate(self) -> None:
+        self.cache.clear()
+        self.snapshot_cache.clear()
+
+    # -------------------------------------------------------------------------
+    def predict(
+        self,
+        experiment_ids: list[int],
+        models: list[str] | None = None,
+        pressure: list[float] | None = None,
+        points: int | None = None,
+        max_points: int | None = None,
+        include_measured: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Predict uptake curves for stored experiments from their fitted parameters.
+
+        Keyword arguments:
+        experiment_ids -- Identifiers of rows in the experiment table.
+        models -- Models to evaluate; when omitted the best model of each
+        experiment is used.
+        pressure -- Explicit pressure grid shared by all experiments. When omitted
+        a log-spaced grid spanning each experiment's pressure range is built.
+        points -- Number of points of the automatic grid.
+        max_points -- Maximum number of points returned per curve.
+        include_measured -- Also return the measured isotherm of each experiment.
+
+        Return value:
+        List of per-experiment dictionaries with the pressure grid and one uptake
+        series per model.
+        """
+        limit = min(max_points or self.max_points, self.max_points)
+        resolved_models = (
+            tuple(self.resolve_model_key(name) for name in models) if models else None
+        )
+        cache_key = (
+            tuple(experiment_ids),
+            resolved_models,
+            tuple(pressure) if pressure is not None else None,
+            points,
+            limit,
+            include_measured,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        snapshot = self.load_snapshot()
+        experiments: pd.DataFrame = snapshot["experiments"]
+        missing = [
+            identifier for identifier in experiment_ids if identifier not in experiments.index
+        ]
+        if missing:
+            raise ValueError(f"Unknown experiment ids: {missing}")
+        selected = experiments.loc[list(experiment_ids)]
+
+        grids = self.build_grids(selected, pressure, points or self.default_points, limit)
+        assignments = self.assign_models(selected.index, resolved_models, snapshot["best"])
+
+        curves: dict[int, list[dict[str, Any]]] = {
+            int(identifier): [] for identifier in selected.index
+        }
+        for model_key, rows in assignments.items():
+            positions = np.asarray(rows, dtype=np.intp)
+            identifiers = selected.index[positions]
+            parameters = snapshot["parameters"][model_key].reindex(identifiers)
+            matrix = parameters.to_numpy(dtype=np.float64)
+            grid = grids if grids.ndim == 1 else grids[positions]
+            # One vectorized evaluation covers every experiment assigned to a model.
+            predicted = self.collection.evaluate(model_key, matrix, grid)
+            display_name = self.serializer.model_schemas[model_key]["prefix"]
+            for identifier, values in zip(identifiers, predicted, strict=True):
+                curves[int(identifier)].append(
+                    {"model": display_name, "uptake": self.to_json_values(values)}
+                )
+
+        isotherms = self.isotherms.load() if include_measured else None
+        response = []
+        for position, (identifier, row) in enumerate(selected.iterrows()):
+            grid = grids if grids.ndim == 1 else grids[position]
+            entry = {
+                "experiment_id": int(identifier),
+                "experiment": str(row["experiment"]),
+                "pressure": grid.tolist(),
+                "curves": curves[int(identifier)],
+            }
+            if include_measured:
+                entry["measured"] = self.measured_isotherm(row, isotherms)
+            response.append(entry)
+        self.cache.put(cache_key, response)
+        return response
+
+    # -------------------------------------------------------------------------
+    def load_snapshot(self) -> dict[str, Any]:
+        snapshot = self.snapshot_cache.get("fits")
+        if snapshot is not None:
+            return snapshot
+
+        experiments = self.serializer.load_experiments()
+        if experiments.empty:
+            raise ValueError("No fitted experiments are stored in the database.")
+        experiments = experiments.set_index("id")
+
+        best = self.serializer.load_best_fit_table()
+        best_models: dict[int, str] = {}
+        if not best.empty:
+            best_models = {
+                int(identifier): str(model_name)
+                for identifier, model_name in zip(
+                    best["experiment_id"], best["best model"], strict=False
+                )
+                if isinstance(model_name, str)
+            }
+
+        parameters: dict[str, pd.DataFrame] = {}
+        for model_key in self.serializer.model_schemas:
+            names = self.parameter_names(model_key)
+            frame = self.serializer.load_model_results(model_key)
+            if frame.empty or not set(names).issubset(frame.columns):
+                parameters[model_key] = pd.DataFrame(columns=names, dtype=np.float64)
+                continue
+            parameters[model_key] = frame.set_index("experiment_id").loc[:, names]
+
+        snapshot = {
+            "experiments": experiments,
+            "best": best_models,
+            "parameters": parameters,
+        }
+        self.snapshot_cache.put("fits", snapshot)
+        return snapshot
+
+    # -------------------------------------------------------------------------
+    def measured_isotherm(
+        self, row: pd.Series, isotherms: IsothermSnapshot | None
+    ) -> dict[str, list[float | None]]:
+        experiment = str(row["experiment"])
+        pressure = uptake = None
+        if isotherms is not None and experiment in isotherms:
+            pressure, uptake = isotherms.isotherm(experiment)
+            # The store follows the latest upload, which may not have been fitted.
+            if pressure.shape[0] != int(row["measurement_count"]):
+                pressure = uptake = None
+        if pressure is None or uptake is None:
+            # Experiments missing from the store (for instance stored by the batch
+            # fitter) fall back to decoding the experiment table text.
+            pressure = np.asarray(
+                self.serializer.convert_string_to_list(row[PRESSURE_COLUMN]),
+                dtype=np.float64,
+            )
+            uptake = np.asarray(
+                self.serializer.convert_string_to_list(row[UPTAKE_COLUMN]),
+                dtype=np.float64,
+            )
+        return {
+            "pressure": self.to_json_values(pressure),
+            "uptake": self.to_json_values(uptake),
+        }
+
+    # -------------------------------------------------------------------------
+    def build_grids(
+        self,
+        experiments: pd.DataFrame,
+        pressure: list[float] | None,
+        points: int,
+        limit: int,
+    ) -> np.ndarray:
+        if pressure is not None:
+            grid = np.asarray(pressure, dtype=np.float64)
+            if grid.size == 0 or not np.all(np.isfinite(grid)) or np.any(grid < 0):
+                raise ValueError("Pressure grid must contain finite, non-negative values.")
+            return self.downsample(grid, limit)
+
+        count = min(points, limit)
+        upper = experiments["max_pressure"].to_numpy(dtype=np.float64)
+        lower = experiments["min_pressure"].to_numpy(dtype=np.float64)
+        lower = np.where(lower > 0, lower, upper * AUTO_GRID_MIN_RATIO)
+        lower = np.where(lower > 0, lower, 1.0)
+        upper = np.where(upper > lower, upper, lower * 10.0)
+        unit = np.linspace(0.0, 1.0, count)
+        log_lower = np.log(lower)[:, np.newaxis]
+        log_span = (np.log(upper) - np.log(lower))[:, np.newaxis]
+        return np.exp(log_lower + log_span * unit)
+
+    # -------------------------------------------------------------------------
+    def assign_models(
+        self,
+        identifiers: pd.Index,
+        models: tuple[str, ...] | None,
+        best_models: dict[int, str],
+    ) -> dict[str, list[int]]:
+        assignments: dict[str, list[int]] = {}
+        for position, identifier in enumerate(identifiers):
+            if models is not None:
+                selected = models
+            else:
+                best = best_models.get(int(identifier))
+                selected = (self.resolve_model_key(best),) if best else ()
+            for model_key in selected:
+                assignments.setdefault(model_key, []).append(position)
+        return assignments
+
+    # -------------------------------------------------------------------------
+    def resolve_model_key(self, model_name: str) -> str:
+        key = self.collection.normalize_name(model_name)
+        if key not in self.serializer.model_schemas:
+            raise ValueError(f"Model {model_name} is not supported")
+        return key
+
+    # -------------------------------------------------------------------------
+    def parameter_names(self, model_key: str) -> list[str]:
+        signature = inspect.signature(self.collection.get_model(model_key))
+        return list(signature.parameters.keys())[1:]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def downsample(grid: np.ndarray, limit: int) -> np.ndarray:
+        if grid.shape[0] <= limit:
+            return grid
+        indices = np.unique(np.linspace(0, grid.shape[0] - 1, limit).round().astype(int))
+        return grid[indices]
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def to_json_values(values: np.ndarray) -> list[float | None]:
+        finite = np.isfinite(values)
+        if finite.all():
+            return values.tolist()
+        return [float(value) if ok else None for value, ok in zip(values, finite)]
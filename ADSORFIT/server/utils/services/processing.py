@@ -11,6 +11,7 @@ import pandas as pd
 from ADSORFIT.server.utils.configurations import server_settings
 from ADSORFIT.server.utils.constants import DEFAULT_DATASET_COLUMN_MAPPING
 from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.services.results import FitResultSet
 
 
 ###############################################################################
@@ -34,7 +35,8 @@ class DatasetColumns:
 ###############################################################################
 class AdsorptionDataProcessor:
     def __init__(self, dataset: pd.DataFrame) -> None:
-        self.dataset = dataset.copy()
+        # The raw dataset is only read, never modified, so it is not copied.
+        self.dataset = dataset
         self.columns = DatasetColumns()
 
     # -------------------------------------------------------------------------
@@ -102,15 +104,35 @@ class AdsorptionDataProcessor:
         dataset -- Dataset that should be filtered using the resolved column mapping.
 
         Return value:
-        DataFrame limited to valid rows with non-negative measurements and
-        temperatures above zero.
+        DataFrame limited to the detected columns and to valid rows with
+        non-negative measurements and temperatures above zero. Experiment names are
+        categorical.
         """
         cols = self.columns.as_dict()
-        valid = dataset.dropna(subset=list(cols.values()))
-        valid = valid[valid[cols["temperature"]].astype(float) > 0]
-        valid = valid[valid[cols["pressure"]].astype(float) >= 0]
-        valid = valid[valid[cols["uptake"]].astype(float) >= 0]
-        return valid.reset_index(drop=True)
+        selected = list(dict.fromkeys(cols.values()))
+        # Numeric columns are used as they are; text columns are parsed once.
+        numeric = {
+            cols[name]: pd.to_numeric(dataset[cols[name]], errors="coerce")
+            for name in ("temperature", "pressure", "uptake")
+        }
+        # One combined mask selects the valid rows, so only the surviving rows of
+        # the detected columns are copied.
+        valid = (
+            dataset[cols["experiment"]].notna()
+            & (numeric[cols["temperature"]] > 0)
+            & (numeric[cols["pressure"]] >= 0)
+            & (numeric[cols["uptake"]] >= 0)
+        ).to_numpy()
+        cleaned = pd.DataFrame(
+            {
+                column: numeric[column][valid].to_numpy()
+                if column in numeric
+                else dataset[column][valid].to_numpy()
+                for column in selected
+            }
+        )
+        cleaned[cols["experiment"]] = cleaned[cols["experiment"]].astype("category")
+        return cleaned
 
     # -------------------------------------------------------------------------
     def aggregate_by_experiment(self, dataset: pd.DataFrame) -> pd.DataFrame:
@@ -120,27 +142,58 @@ class AdsorptionDataProcessor:
         dataset -- Filtered dataset containing valid measurements.
 
         Return value:
-        DataFrame with one row per experiment including pressure and uptake vectors and
-        summary stats.
+        DataFrame with one row per experiment including pressure and uptake vectors
+        (float64 arrays) and summary stats.
         """
         cols = self.columns.as_dict()
-        aggregate = {
-            cols["temperature"]: "first",
-            cols["pressure"]: list,
-            cols["uptake"]: list,
-        }
-        # ``groupby`` collects all measurements for each experiment so downstream
-        # fitting can consume full pressure/uptake vectors.
-        grouped = (
-            dataset.groupby(cols["experiment"], as_index=False)
-            .agg(aggregate)
-            .rename(columns={cols["experiment"]: "experiment"})
+        statistics = [
+            "measurement_count",
+            "min_pressure",
+            "max_pressure",
+            "min_uptake",
+            "max_uptake",
+        ]
+        if dataset.empty:
+            return pd.DataFrame(
+                columns=[
+                    "experiment",
+                    cols["temperature"],
+                    cols["pressure"],
+                    cols["uptake"],
+                    *statistics,
+                ]
+            )
+        experiments = dataset[cols["experiment"]]
+        if not isinstance(experiments.dtype, pd.CategoricalDtype):
+            experiments = experiments.astype("category")
+        experiments = experiments.cat.remove_unused_categories()
+        codes = experiments.cat.codes.to_numpy()
+        # A stable sort by experiment keeps the measurement order within each
+        # experiment, as ``groupby`` did.
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(experiments.cat.categories))
+        boundaries = np.cumsum(counts)[:-1]
+        starts = np.concatenate(([0], boundaries))
+        pressure = dataset[cols["pressure"]].to_numpy(dtype=np.float64)[order]
+        uptake = dataset[cols["uptake"]].to_numpy(dtype=np.float64)[order]
+        temperature = dataset[cols["temperature"]].to_numpy()[order]
+        # Every experiment holds views into the two sorted buffers instead of
+        # Python lists of floats, which take about four times the memory.
+        grouped = pd.DataFrame(
+            {
+                "experiment": np.asarray(experiments.cat.categories),
+                cols["temperature"]: temperature[starts],
+                cols["pressure"]: pd.Series(
+                    np.split(pressure, boundaries), dtype=object
+                ),
+                cols["uptake"]: pd.Series(np.split(uptake, boundaries), dtype=object),
+                "measurement_count": counts.astype(np.int32),
+                "min_pressure": np.minimum.reduceat(pressure, starts),
+                "max_pressure": np.maximum.reduceat(pressure, starts),
+                "min_uptake": np.minimum.reduceat(uptake, starts),
+                "max_uptake": np.maximum.reduceat(uptake, starts),
+            }
         )
-        grouped["measurement_count"] = grouped[cols["pressure"]].apply(len)
-        grouped["min_pressure"] = grouped[cols["pressure"]].apply(min)
-        grouped["max_pressure"] = grouped[cols["pressure"]].apply(max)
-        grouped["min_uptake"] = grouped[cols["uptake"]].apply(min)
-        grouped["max_uptake"] = grouped[cols["uptake"]].apply(max)
         return grouped
 
     # -------------------------------------------------------------------------
@@ -181,53 +234,31 @@ class DatasetAdapter:
     # -------------------------------------------------------------------------
     @staticmethod
     def combine_results(
-        fitting_results: dict[str, list[dict[str, Any]]],
+        fitting_results: FitResultSet,
         dataset: pd.DataFrame,
     ) -> pd.DataFrame:
         """Append model fitting metrics and parameters to the processed dataset.
 
         Keyword arguments:
-        fitting_results -- Mapping of model names to experiment-level fitting
-        diagnostics.
+        fitting_results -- Columnar fitting results, one completed row per
+        experiment of ``dataset``.
         dataset -- Aggregated dataset to be enriched with fitting outputs.
 
         Return value:
         DataFrame with additional columns per model containing the optimization
         score, method, and parameter estimates.
         """
-        if not fitting_results:
+        if not fitting_results.models:
             logger.warning("No fitting results were provided")
             return dataset
+        if fitting_results.completed == 0:
+            logger.info("Fitting produced no completed experiments")
 
-        result_df = dataset.copy()
-        for model_name, entries in fitting_results.items():
-            if not entries:
-                logger.info("Model %s produced no entries", model_name)
-                continue
-            params = entries[0].get("arguments", [])
-            # Columns for each model store experiment-level metrics aligned by order.
-            result_df[f"{model_name} score"] = [
-                entry.get("score", np.nan) for entry in entries
-            ]
-            result_df[f"{model_name} AIC"] = [
-                entry.get("aic", np.nan) for entry in entries
-            ]
-            result_df[f"{model_name} AICc"] = [
-                entry.get("aicc", np.nan) for entry in entries
-            ]
-            result_df[f"{model_name} optimization method"] = [
-                entry.get("optimization_method") for entry in entries
-            ]
-            for index, param in enumerate(params):
-                result_df[f"{model_name} {param}"] = [
-                    entry.get("optimal_params", [np.nan] * len(params))[index]
-                    for entry in entries
-                ]
-                result_df[f"{model_name} {param} error"] = [
-                    entry.get("errors", [np.nan] * len(params))[index]
-                    for entry in entries
-                ]
-        return result_df
+        # The combined frame references the dataset columns and the result arrays
+        # instead of copying them into a new consolidated block.
+        columns: dict[str, Any] = {column: dataset[column] for column in dataset}
+        columns.update(fitting_results.to_columns())
+        return pd.DataFrame(columns, index=dataset.index, copy=False)
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -253,15 +284,52 @@ class DatasetAdapter:
             )
             return dataset
 
-        ranked = dataset.copy()
-        ranked_values = ranked[metric_columns].replace({np.inf: np.nan})
-        ranked["best model"] = ranked_values.idxmin(axis=1).str.replace(
-            f" {selected_suffix}", ""
+        model_names = np.asarray(
+            [column[: -len(selected_suffix) - 1] for column in metric_columns],
+            dtype=object,
         )
-        ranked["worst model"] = ranked_values.idxmax(axis=1).str.replace(
-            f" {selected_suffix}", ""
+        # Metrics are ranked on one (experiments x models) matrix; infinite values
+        # mark fits without a valid criterion and are ignored like failed fits.
+        values = pd.DataFrame(dataset[metric_columns]).to_numpy(
+            dtype=np.float64, na_value=np.nan
         )
-        return ranked
+        values = np.where(np.isfinite(values), values, np.nan)
+        # Experiments where every fit failed (or timed out) have no model to rank.
+        rankable = ~np.all(np.isnan(values), axis=1)
+        worst = np.full(values.shape[0], None, dtype=object)
+        if rankable.any():
+            worst[rankable] = model_names[np.nanargmax(values[rankable], axis=1)]
+        # The ranked frame is built in one pass and references the existing
+        # columns; inserting the ranking columns into the frame returned by
+        # ``combine_results``, which holds one block per column, would fragment it.
+        best = DatasetAdapter.rank_models(values, model_names, 1)[:, 0]
+        columns: dict[str, Any] = {column: dataset[column] for column in dataset}
+        columns["best model"] = best
+        columns["worst model"] = worst
+        return pd.DataFrame(columns, index=dataset.index, copy=False)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def rank_models(
+        values: np.ndarray, model_names: np.ndarray, count: int
+    ) -> np.ndarray:
+        """Return the ``count`` best ranked models of every experiment.
+
+        Keyword arguments:
+        values -- Ranking metric of shape (experiments, models), lower is better.
+        model_names -- Model name of every column of ``values``.
+        count -- Number of models returned per experiment.
+
+        Return value:
+        Object array of shape (experiments, count) with model names from the best
+        one down, padded with None where fewer models have a finite metric.
+        """
+        finite = np.isfinite(values)
+        order = np.argsort(np.where(finite, values, np.inf), axis=1, kind="stable")
+        order = order[:, :count]
+        names = np.asarray(model_names, dtype=object)[order]
+        names[~np.take_along_axis(finite, order, axis=1)] = None
+        return names
 
     # -------------------------------------------------------------------------
     @staticmethod
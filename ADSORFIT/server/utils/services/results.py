@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+FIT_STATUS_PENDING = "pending"
+FIT_STATUS_OK = "ok"
+FIT_STATUS_FAILED = "failed"
+FIT_STATUS_TIME_BUDGET = "time_budget"
+FIT_STATUS_SKIPPED = "skipped"
+FIT_STATUS_APPROXIMATE = "approximate"
+FIT_STATUSES: tuple[str, ...] = (
+    FIT_STATUS_PENDING,
+    FIT_STATUS_OK,
+    FIT_STATUS_FAILED,
+    FIT_STATUS_TIME_BUDGET,
+    FIT_STATUS_SKIPPED,
+    FIT_STATUS_APPROXIMATE,
+)
+# Experiments listed individually in a refinement report.
+REFINEMENT_CHANGE_LIMIT = 20
+
+
+###############################################################################
+class ModelResultColumns:
+    """Preallocated result arrays of one model, one row per experiment."""
+
+    def __init__(self, parameters: list[str], size: int) -> None:
+        self.parameters = list(parameters)
+        self.params = np.full((size, len(self.parameters)), np.nan, dtype=np.float64)
+        self.errors = np.full((size, len(self.parameters)), np.nan, dtype=np.float64)
+        self.ci_lower = np.full(
+            (size, len(self.parameters)), np.nan, dtype=np.float64
+        )
+        self.ci_upper = np.full(
+            (size, len(self.parameters)), np.nan, dtype=np.float64
+        )
+        self.score = np.full(size, np.nan, dtype=np.float64)
+        self.aic = np.full(size, np.nan, dtype=np.float64)
+        self.aicc = np.full(size, np.nan, dtype=np.float64)
+        # Statuses and methods are stored as small integer codes, see FitResultSet.
+        self.status = np.zeros(size, dtype=np.int8)
+        self.method = np.zeros(size, dtype=np.int8)
+
+
+###############################################################################
+class FitResultSet:
+    """Columnar container for the fitting results of a whole dataset.
+
+    The solver writes the outcome of each experiment into row ``position`` of
+    per-model float64 arrays, so a run over thousands of experiments holds a few
+    arrays per model instead of one dictionary per model and experiment. Rows are
+    filled in dataset order; ``completed`` counts the rows written so far, which is
+    less than ``size`` when a run stopped early.
+    """
+
+    def __init__(self, parameters: dict[str, list[str]], size: int) -> None:
+        self.size = int(size)
+        self.columns = {
+            model_name: ModelResultColumns(names, self.size)
+            for model_name, names in parameters.items()
+        }
+        self.methods: list[str] = []
+        self.completed = 0
+
+    # -------------------------------------------------------------------------
+    @property
+    def models(self) -> list[str]:
+        return list(self.columns)
+
+    # -------------------------------------------------------------------------
+    def method_code(self, method: str | None) -> int:
+        label = method or ""
+        if label not in self.methods:
+            self.methods.append(label)
+        return self.methods.index(label)
+
+    # -------------------------------------------------------------------------
+    def store(
+        self, position: int, experiment_results: dict[str, dict[str, Any]]
+    ) -> None:
+        """Write the per-model results of one experiment into row ``position``.
+
+        Keyword arguments:
+        position -- Zero-based row of the experiment in the processed dataset.
+        experiment_results -- Dictionary returned by
+        :meth:`ModelSolver.single_experiment_fit`, or its compact checkpoint form.
+        """
+        for model_name, columns in self.columns.items():
+            data = experiment_results.get(model_name)
+            if data is None:
+                continue
+            width = len(columns.parameters)
+            params = data.get("optimal_params")
+            errors = data.get("errors")
+            if params is not None:
+                columns.params[position] = np.asarray(params, dtype=np.float64)[:width]
+            if errors is not None:
+                columns.errors[position] = np.asarray(errors, dtype=np.float64)[:width]
+            ci_lower = data.get("ci_lower")
+            ci_upper = data.get("ci_upper")
+            if ci_lower is not None and ci_upper is not None:
+                columns.ci_lower[position] = np.asarray(ci_lower, dtype=np.float64)[
+                    :width
+                ]
+                columns.ci_upper[position] = np.asarray(ci_upper, dtype=np.float64)[
+                    :width
+                ]
+            columns.score[position] = self.as_float(data.get("score"))
+            columns.aic[position] = self.as_float(data.get("aic"))
+            columns.aicc[position] = self.as_float(data.get("aicc"))
+            status = data.get("status")
+            if status not in FIT_STATUSES:
+                failed = "exception" in data or "error" in data
+                status = FIT_STATUS_FAILED if failed else FIT_STATUS_OK
+            columns.status[position] = FIT_STATUSES.index(status)
+            columns.method[position] = self.method_code(data.get("optimization_method"))
+        self.completed = max(self.completed, position + 1)
+
+    # -------------------------------------------------------------------------
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Return the completed rows as one array per metric and parameter column.
+
+        Columns follow the layout of the fitting tables: ``<model> score``, ``AIC``,
+        ``AICc``, ``optimization method`` and ``status``, then every parameter
+        followed by its standard error and its bootstrap confidence interval bounds.
+        Numeric columns are views of the result arrays.
+        """
+        rows = self.completed
+        method_labels = np.asarray(self.methods or [""], dtype=object)
+        status_labels = np.asarray(FIT_STATUSES, dtype=object)
+        data: dict[str, np.ndarray] = {}
+        for model_name, columns in self.columns.items():
+            data[f"{model_name} score"] = columns.score[:rows]
+            data[f"{model_name} AIC"] = columns.aic[:rows]
+            data[f"{model_name} AICc"] = columns.aicc[:rows]
+            data[f"{model_name} optimization method"] = method_labels[
+                columns.method[:rows]
+            ]
+            data[f"{model_name} status"] = status_labels[columns.status[:rows]]
+            for position, param in enumerate(columns.parameters):
+                data[f"{model_name} {param}"] = columns.params[:rows, position]
+                data[f"{model_name} {param} error"] = columns.errors[:rows, position]
+                data[f"{model_name} {param} ci lower"] = columns.ci_lower[
+                    :rows, position
+                ]
+                data[f"{model_name} {param} ci upper"] = columns.ci_upper[
+                    :rows, position
+                ]
+        return data
+
+    # -------------------------------------------------------------------------
+    def status_counts(self, status: str) -> dict[str, int]:
+        """Count the completed rows of every model that ended with ``status``."""
+        code = FIT_STATUSES.index(status)
+        return {
+            model_name: int(np.count_nonzero(columns.status[: self.completed] == code))
+            for model_name, columns in self.columns.items()
+        }
+
+    # -------------------------------------------------------------------------
+    def method_counts(self) -> dict[str, dict[str, int]]:
+        """Count the methods that produced the completed fits of every model."""
+        fitted = [
+            FIT_STATUSES.index(FIT_STATUS_OK),
+            FIT_STATUSES.index(FIT_STATUS_APPROXIMATE),
+        ]
+        counts: dict[str, dict[str, int]] = {}
+        for model_name, columns in self.columns.items():
+            rows = np.isin(columns.status[: self.completed], fitted)
+            codes, totals = np.unique(
+                columns.method[: self.completed][rows], return_counts=True
+            )
+            counts[model_name] = {
+                self.methods[code]: int(total) for code, total in zip(codes, totals)
+            }
+        return counts
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def as_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+
+###############################################################################
+class RefinementReport:
+    """Timing and ranking statistics of a two-tier (screen then refine) run.
+
+    Every fit records its duration, so the cost of a full-precision run can be
+    estimated without running it. A refined fit is screened first and then
+    refined, and together this costs about as much as fitting at full precision
+    directly. The models kept at screening precision are extrapolated with the
+    refine-to-screen time ratio observed for the same model. Refinements start
+    from the screened optimum, so the estimated saving is a lower bound.
+    Experiments restored from a checkpoint are not covered.
+    """
+
+    def __init__(self) -> None:
+        self.experiments = 0
+        self.refined_fits = 0
+        self.approximate_fits = 0
+        self.screen_seconds = 0.0
+        self.refine_seconds: dict[str, float] = {}
+        self.refined_screen_seconds: dict[str, float] = {}
+        self.approximate_screen_seconds: dict[str, float] = {}
+        self.ranking_changes = 0
+        self.winner_changes = 0
+        self.changed_experiments: list[dict[str, Any]] = []
+
+    # -------------------------------------------------------------------------
+    def record(
+        self,
+        experiment: str,
+        screened: dict[str, dict[str, Any]],
+        refined: dict[str, dict[str, Any]],
+        screened_ranking: list[str | None],
+        refined_ranking: list[str | None],
+    ) -> None:
+        """Add the outcome of one experiment to the report.
+
+        Keyword arguments:
+        experiment -- Experiment name.
+        screened -- Results of the screening tier, for every model.
+        refined -- Results of the refinement tier, for the refined models only.
+        screened_ranking -- Top models by the screening results.
+        refined_ranking -- Top models once the refined results replaced them.
+        """
+        self.experiments += 1
+        for model_name, data in screened.items():
+            elapsed = float(data.get("elapsed", 0.0))
+            self.screen_seconds += elapsed
+            if model_name in refined:
+                self.refined_fits += 1
+                self.add(self.refined_screen_seconds, model_name, elapsed)
+                self.add(
+                    self.refine_seconds,
+                    model_name,
+                    float(refined[model_name].get("elapsed", 0.0)),
+                )
+            elif data.get("status") == FIT_STATUS_OK:
+                self.approximate_fits += 1
+                self.add(self.approximate_screen_seconds, model_name, elapsed)
+
+        if screened_ranking == refined_ranking:
+            return
+        self.ranking_changes += 1
+        if screened_ranking[:1] != refined_ranking[:1]:
+            self.winner_changes += 1
+            if len(self.changed_experiments) < REFINEMENT_CHANGE_LIMIT:
+                self.changed_experiments.append(
+                    {
+                        "experiment": experiment,
+                        "screened_best": screened_ranking[0],
+                        "refined_best": refined_ranking[0],
+                    }
+                )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def add(totals: dict[str, float], model_name: str, seconds: float) -> None:
+        totals[model_name] = totals.get(model_name, 0.0) + seconds
+
+    # -------------------------------------------------------------------------
+    def refine_ratio(self, model_name: str | None = None) -> float:
+        screened = (
+            self.refined_screen_seconds.get(model_name, 0.0)
+            if model_name is not None
+            else sum(self.refined_screen_seconds.values())
+        )
+        refined = (
+            self.refine_seconds.get(model_name, 0.0)
+            if model_name is not None
+            else sum(self.refine_seconds.values())
+        )
+        if screened <= 0:
+            return self.refine_ratio() if model_name is not None else 1.0
+        return (screened + refined) / screened
+
+    # -------------------------------------------------------------------------
+    def to_dict(self) -> dict[str, Any]:
+        elapsed = self.screen_seconds + sum(self.refine_seconds.values())
+        saved = sum(
+            seconds * (self.refine_ratio(model_name) - 1.0)
+            for model_name, seconds in self.approximate_screen_seconds.items()
+        )
+        estimated_full = elapsed + saved
+        return {
+            "experiments": self.experiments,
+            "refined_fits": self.refined_fits,
+            "approximate_fits": self.approximate_fits,
+            "screen_seconds": round(self.screen_seconds, 3),
+            "refine_seconds": round(sum(self.refine_seconds.values()), 3),
+            "estimated_full_precision_seconds": round(estimated_full, 3),
+            "estimated_saved_seconds": round(saved, 3),
+            "estimated_saved_fraction": round(saved / estimated_full, 3)
+            if estimated_full > 0
+            else 0.0,
+            "ranking_changes": self.ranking_changes,
+            "winner_changes": self.winner_changes,
+            "changed_experiments": self.changed_experiments,
+        }
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.server.utils.configurations import ScreeningSettings
+from ADSORFIT.server.utils.constants import SCREENER_FILE
+from ADSORFIT.server.utils.logger import logger
+from ADSORFIT.server.utils.services.initializers import FEATURE_NAMES, isotherm_features
+
+SCREENER_FORMAT_VERSION = 1
+SKIP_REASON_TOO_FEW_POINTS = "too_few_points"
+SKIP_REASON_UNIDENTIFIABLE = "unidentifiable"
+SKIP_REASON_DOMINATED = "dominated"
+# Training label of experiments won by a model outside the screened candidates.
+OTHER_MODEL_LABEL = ""
+
+
+# -------------------------------------------------------------------------
+def infeasible_reasons(
+    points: np.ndarray, distinct: np.ndarray, parameter_count: int, metric: str
+) -> np.ndarray:
+    """Return why a model cannot be ranked on each experiment, or None.
+
+    Keyword arguments:
+    points -- Number of measurements of every experiment.
+    distinct -- Number of distinct pressures of every experiment.
+    parameter_count -- Number of model parameters.
+    metric -- Normalized ranking metric (``AICc``, ``AIC`` or ``score``).
+
+    Return value:
+    Object array holding a skip reason for experiments where the parameters cannot
+    be identified from the distinct pressures, or where the AICc ranking metric is
+    infinite (n - k - 1 <= 0), and None elsewhere.
+    """
+    reasons = np.full(points.shape[0], None, dtype=object)
+    if metric == "AICc":
+        reasons[points - parameter_count - 1 <= 0] = SKIP_REASON_TOO_FEW_POINTS
+    reasons[distinct < parameter_count] = SKIP_REASON_UNIDENTIFIABLE
+    return reasons
+
+
+###############################################################################
+class ModelScreener:
+    """Decide before fitting which models are not worth fitting on an experiment.
+
+    Models that cannot be ranked (see :func:`infeasible_reasons`) are always
+    skipped. With a trained classifier, models that almost never win on isotherms
+    of a similar shape are skipped too, except the ``keep_top`` most likely winners
+    of every experiment. The classifier is trained on stored best-model selections
+    and keeps its samples, so retraining extends what was learned before.
+    """
+
+    def __init__(self, bundle: dict[str, Any] | None = None) -> None:
+        self.bundle = bundle
+
+    # -------------------------------------------------------------------------
+    @property
+    def models(self) -> list[str]:
+        return list(self.bundle["models"]) if self.bundle is not None else []
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load(cls, path: str = SCREENER_FILE) -> ModelScreener | None:
+        if not os.path.isfile(path):
+            return None
+        import joblib
+
+        try:
+            bundle = joblib.load(path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Unable to load model screener: %s", exc)
+            return None
+        if (
+            not isinstance(bundle, dict)
+            or bundle.get("version") != SCREENER_FORMAT_VERSION
+            or tuple(bundle.get("features", ())) != FEATURE_NAMES
+        ):
+            logger.warning("Ignoring incompatible model screener %s", path)
+            return None
+        return cls(bundle)
+
+    # -------------------------------------------------------------------------
+    def save(self, path: str = SCREENER_FILE) -> None:
+        import joblib
+
+        if self.bundle is None:
+            raise ValueError("The model screener has not been trained.")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        joblib.dump(self.bundle, temporary_path)
+        os.replace(temporary_path, path)
+
+    # -------------------------------------------------------------------------
+    def screen(
+        self,
+        pressures: Sequence[np.ndarray],
+        uptakes: Sequence[np.ndarray],
+        parameter_counts: dict[str, int],
+        metric: str,
+        settings: ScreeningSettings,
+        features: np.ndarray | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Select the models to skip on every experiment of a dataset.
+
+        Keyword arguments:
+        pressures -- Pressure vector of every experiment.
+        uptakes -- Uptake vector of every experiment.
+        parameter_counts -- Number of parameters of every configured model.
+        metric -- Normalized ranking metric of the run.
+        settings -- Screening settings.
+        features -- Precomputed :func:`isotherm_features` of every experiment.
+
+        Return value:
+        Dictionary mapping each model to an object array with the skip reason of
+        every experiment, None where the model must be fitted.
+        """
+        size = len(pressures)
+        reasons = {
+            model_name: np.full(size, None, dtype=object)
+            for model_name in parameter_counts
+        }
+        if not settings.enabled or size == 0:
+            return reasons
+        if settings.skip_infeasible:
+            points = np.fromiter((len(values) for values in pressures), np.int64, size)
+            distinct = np.fromiter(
+                (np.unique(values).size for values in pressures), np.int64, size
+            )
+            for model_name, parameter_count in parameter_counts.items():
+                reasons[model_name] = infeasible_reasons(
+                    points, distinct, parameter_count, metric
+                )
+
+        screened = [model for model in parameter_counts if model in self.models]
+        if (
+            not settings.classifier_enabled
+            or self.bundle is None
+            or self.bundle["metric"] != metric
+            or len(screened) <= settings.keep_top
+        ):
+            return reasons
+
+        if features is None:
+            features = np.vstack(
+                [isotherm_features(p, q) for p, q in zip(pressures, uptakes)]
+            )
+        probabilities = self.probabilities(features, screened)
+        feasible = np.column_stack(
+            [np.equal(reasons[model_name], None) for model_name in screened]
+        )
+        # Infeasible models rank last, so the kept winners are models that run.
+        ranking = np.where(feasible, probabilities, -1.0)
+        order = np.argsort(-ranking, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(
+            ranks, order, np.broadcast_to(np.arange(len(screened)), order.shape), axis=1
+        )
+        dominated = (
+            feasible & (probabilities < settings.min_probability)
+            & (ranks >= settings.keep_top)
+        )
+        for column, model_name in enumerate(screened):
+            reasons[model_name][dominated[:, column]] = SKIP_REASON_DOMINATED
+        return reasons
+
+    # -------------------------------------------------------------------------
+    def probabilities(self, features: np.ndarray, models: list[str]) -> np.ndarray:
+        """Return the probability of each model being the best one, shape (N, M)."""
+        estimator = self.bundle["estimator"]
+        predicted = np.asarray(estimator.predict_proba(features), dtype=np.float64)
+        classes = [str(label) for label in estimator.classes_]
+        probabilities = np.zeros((features.shape[0], len(models)), dtype=np.float64)
+        for column, model_name in enumerate(models):
+            # Models that never won in the training data have probability zero.
+            if model_name in classes:
+                probabilities[:, column] = predicted[:, classes.index(model_name)]
+        return probabilities
+
+    # -------------------------------------------------------------------------
+    def train(
+        self,
+        frames: Iterable[pd.DataFrame],
+        model_parameters: dict[str, list[str]],
+        metric: str,
+        neighbors: int = 25,
+        min_samples: int = 50,
+        max_samples: int = 20000,
+    ) -> int:
+        """Fit the best-model classifier on stored fitting results.
+
+        Keyword arguments:
+        frames -- Fitting results with a ``best model`` column, the measured
+        ``pressure [Pa]`` and ``uptake [mol/g]`` vectors and the per-model columns.
+        model_parameters -- Parameter names of every known model.
+        metric -- Normalized ranking metric the best models were selected with.
+        neighbors -- Number of neighbours voting for each prediction.
+        min_samples -- The classifier is not trained on fewer experiments.
+        max_samples -- Most recent samples kept.
+
+        Return value:
+        Number of training samples, 0 when the classifier was not trained.
+        """
+        from sklearn.neighbors import KNeighborsClassifier
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler
+
+        samples = [
+            self.collect_samples(frame, model_parameters, metric) for frame in frames
+        ]
+        samples = [sample for sample in samples if sample[0].shape[0]]
+        previous = self.bundle
+        if previous is not None and previous["metric"] == metric:
+            samples.insert(
+                0, (previous["samples"], previous["labels"], set(previous["models"]))
+            )
+        if not samples:
+            return 0
+
+        # Only models fitted on every sample can be screened: a model missing from
+        # some runs would otherwise look like one that never wins.
+        models = [
+            model_name
+            for model_name in model_parameters
+            if all(model_name in candidates for _, _, candidates in samples)
+        ]
+        features = np.vstack([sample[0] for sample in samples])
+        labels = np.concatenate([sample[1] for sample in samples]).astype(object)
+        labels[~np.isin(labels, models)] = OTHER_MODEL_LABEL
+        keys = pd.DataFrame(features).assign(label=labels)
+        keep = np.flatnonzero(~keys.duplicated(keep="last").to_numpy())[-max_samples:]
+        features, labels = features[keep], labels[keep]
+        if features.shape[0] < max(1, min_samples) or len(models) < 2:
+            logger.info(
+                "Not enough best model selections to train the screener (%s)",
+                features.shape[0],
+            )
+            return 0
+
+        estimator = make_pipeline(
+            StandardScaler(),
+            KNeighborsClassifier(
+                n_neighbors=min(neighbors, features.shape[0]), weights="distance"
+            ),
+        )
+        estimator.fit(features, labels.astype(str))
+        self.bundle = {
+            "version": SCREENER_FORMAT_VERSION,
+            "features": FEATURE_NAMES,
+            "metric": metric,
+            "models": models,
+            "samples": features,
+            "labels": labels,
+            "estimator": estimator,
+        }
+        return int(features.shape[0])
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def collect_samples(
+        frame: pd.DataFrame, model_parameters: dict[str, list[str]], metric: str
+    ) -> tuple[np.ndarray, np.ndarray, set[str]]:
+        empty = np.empty((0, len(FEATURE_NAMES)), dtype=np.float64)
+        candidates = {
+            model_name
+            for model_name in model_parameters
+            if f"{model_name} {metric}" in frame.columns
+        }
+        if "best model" not in frame.columns or not candidates:
+            return empty, np.empty(0, dtype=object), candidates
+
+        features: list[np.ndarray] = []
+        labels: list[str] = []
+        for position in range(frame.shape[0]):
+            best = frame["best model"].iat[position]
+            pressure = frame["pressure [Pa]"].iat[position]
+            uptake = frame["uptake [mol/g]"].iat[position]
+            if not isinstance(best, str) or not best:
+                continue
+            if not isinstance(pressure, (list, np.ndarray)) or len(pressure) == 0:
+                continue
+            if ModelScreener.has_dominated_skip(
+                frame, position, pressure, candidates, model_parameters, metric
+            ):
+                # The skipped model had no chance to win this experiment.
+                continue
+            features.append(isotherm_features(pressure, uptake))
+            labels.append(best)
+        if not features:
+            return empty, np.empty(0, dtype=object), candidates
+        return np.vstack(features), np.asarray(labels, dtype=object), candidates
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def has_dominated_skip(
+        frame: pd.DataFrame,
+        position: int,
+        pressure: Sequence[float],
+        candidates: set[str],
+        model_parameters: dict[str, list[str]],
+        metric: str,
+    ) -> bool:
+        # Stored results only record that a fit was skipped; skips that the
+        # feasibility rules explain are recomputed to tell them apart.
+        points = np.asarray([len(pressure)], dtype=np.int64)
+        distinct = np.asarray([np.unique(np.asarray(pressure)).size], dtype=np.int64)
+        for model_name in candidates:
+            status_column = f"{model_name} status"
+            if status_column not in frame.columns:
+                continue
+            if frame[status_column].iat[position] != "skipped":
+                continue
+            parameter_count = len(model_parameters[model_name])
+            reason = infeasible_reasons(points, distinct, parameter_count, metric)[0]
+            if reason is None:
+                return True
+        return False
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Relative distance kept from a bound when mapping a physical value into the
+# unconstrained space, so that initial guesses sitting on a bound stay finite.
+BOUND_MARGIN = 1e-9
+# Positive two-sided bounds spanning at least this ratio are mapped on a log scale,
+# so that rate constants bounded by e.g. [1e-6, 10] are explored evenly per decade.
+LOG_SCALE_RATIO = 1e3
+# Edge length, in internal units, of the initial Nelder-Mead simplex along every
+# transformed parameter: two logistic units move a mid-range value by about 40% of
+# its range (or of its decades), and two log units by a factor of about 7.
+SIMPLEX_INTERNAL_STEP = 2.0
+
+
+###############################################################################
+class ParameterTransform:
+    """Smooth reparameterization of box-constrained parameters.
+
+    Two-sided bounds use a logistic map (applied to the logarithm of the parameter
+    when the bounds are positive and span several decades), one-sided bounds an
+    exponential map and unbounded parameters are left untouched. Unconstrained optimizers work on the
+    internal vector, which always maps to a physical vector within bounds without
+    the flat regions produced by clipping.
+    """
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray) -> None:
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+        finite_lower = np.isfinite(self.lower)
+        finite_upper = np.isfinite(self.upper)
+        self.fixed = finite_lower & finite_upper & (self.upper <= self.lower)
+        self.two_sided = finite_lower & finite_upper & ~self.fixed
+        self.lower_only = finite_lower & ~finite_upper
+        self.upper_only = ~finite_lower & finite_upper
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.log_scaled = (
+                self.two_sided
+                & (self.lower > 0.0)
+                & (self.upper >= self.lower * LOG_SCALE_RATIO)
+            )
+            safe_lower = np.where(self.log_scaled, self.lower, 1.0)
+            safe_upper = np.where(self.log_scaled, self.upper, 1.0)
+        # Logistic maps operate between ``base_lower`` and ``base_upper``, which are
+        # the log-bounds for log-scaled parameters and the plain bounds otherwise.
+        self.base_lower = np.where(self.log_scaled, np.log(safe_lower), self.lower)
+        self.base_upper = np.where(self.log_scaled, np.log(safe_upper), self.upper)
+        self.width = np.where(self.two_sided, self.base_upper - self.base_lower, 1.0)
+
+    # -------------------------------------------------------------------------
+    def to_internal(self, params: np.ndarray) -> np.ndarray:
+        physical = np.asarray(params, dtype=np.float64)
+        internal = physical.copy()
+        if np.any(self.two_sided):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                base = np.where(
+                    self.log_scaled, np.log(np.maximum(physical, 0.0)), physical
+                )
+            ratio = (base - self.base_lower) / self.width
+            ratio = np.clip(ratio, BOUND_MARGIN, 1.0 - BOUND_MARGIN)
+            internal = np.where(
+                self.two_sided, np.log(ratio) - np.log1p(-ratio), internal
+            )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if np.any(self.lower_only):
+                offset = np.maximum(physical - self.lower, BOUND_MARGIN)
+                internal = np.where(self.lower_only, np.log(offset), internal)
+            if np.any(self.upper_only):
+                offset = np.maximum(self.upper - physical, BOUND_MARGIN)
+                internal = np.where(self.upper_only, np.log(offset), internal)
+        return np.where(self.fixed, 0.0, internal)
+
+    # -------------------------------------------------------------------------
+    def to_external(self, internal: np.ndarray) -> np.ndarray:
+        values = np.asarray(internal, dtype=np.float64)
+        physical = values.copy()
+        with np.errstate(over="ignore"):
+            if np.any(self.two_sided):
+                # tanh form of the logistic function avoids overflow for large |z|
+                ratio = 0.5 * (1.0 + np.tanh(0.5 * values))
+                base = self.base_lower + self.width * ratio
+                base = np.where(self.log_scaled, np.exp(base), base)
+                physical = np.where(self.two_sided, base, physical)
+            if np.any(self.lower_only):
+                physical = np.where(
+                    self.lower_only, self.lower + np.exp(values), physical
+                )
+            if np.any(self.upper_only):
+                physical = np.where(
+                    self.upper_only, self.upper - np.exp(values), physical
+                )
+        return np.where(self.fixed, self.lower, physical)
+
+    # -------------------------------------------------------------------------
+    def gradient(self, internal: np.ndarray) -> np.ndarray:
+        """Derivative of each physical parameter with respect to its internal value.
+
+        Keyword arguments:
+        internal -- Parameter vector expressed in the unconstrained space.
+
+        Return value:
+        Array holding the diagonal of the Jacobian of :meth:`to_external`.
+        """
+        values = np.asarray(internal, dtype=np.float64)
+        derivative = np.ones_like(values)
+        with np.errstate(over="ignore"):
+            if np.any(self.two_sided):
+                ratio = 0.5 * (1.0 + np.tanh(0.5 * values))
+                base_derivative = self.width * ratio * (1.0 - ratio)
+                base = self.base_lower + self.width * ratio
+                base_derivative = np.where(
+                    self.log_scaled, np.exp(base) * base_derivative, base_derivative
+                )
+                derivative = np.where(self.two_sided, base_derivative, derivative)
+            if np.any(self.lower_only):
+                derivative = np.where(self.lower_only, np.exp(values), derivative)
+            if np.any(self.upper_only):
+                derivative = np.where(self.upper_only, -np.exp(values), derivative)
+        return np.where(self.fixed, 0.0, derivative)
+
+    # -------------------------------------------------------------------------
+    def covariance_to_external(
+        self, internal: np.ndarray, covariance: np.ndarray | None
+    ) -> np.ndarray | None:
+        """Propagate an internal-space covariance to physical parameters (delta method).
+
+        Keyword arguments:
+        internal -- Optimal parameter vector in the unconstrained space.
+        covariance -- Covariance matrix estimated for the internal parameters.
+
+        Return value:
+        Covariance matrix of the physical parameters, or None when unavailable.
+        """
+        if covariance is None:
+            return None
+        derivative = self.gradient(internal)
+        return covariance * np.outer(derivative, derivative)
+
+    # -------------------------------------------------------------------------
+    def from_unit(self, unit: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+        """Map points of the unit hypercube onto the bounded parameter space.
+
+        Keyword arguments:
+        unit -- Array of shape (M, K) with coordinates in [0, 1].
+        fallback -- Values used for parameters without two-sided bounds.
+
+        Return value:
+        Array of shape (M, K) with physical parameter values, spread uniformly on
+        the same (linear or logarithmic) scale used by the transform.
+        """
+        coordinates = np.asarray(unit, dtype=np.float64)
+        base = self.base_lower + self.width * coordinates
+        base = np.where(self.log_scaled, np.exp(base), base)
+        physical = np.where(self.two_sided, base, np.asarray(fallback, dtype=np.float64))
+        return np.where(self.fixed, self.lower, physical)
+
+    # -------------------------------------------------------------------------
+    def initial_simplex(
+        self, internal: np.ndarray, step: float = SIMPLEX_INTERNAL_STEP
+    ) -> np.ndarray:
+        """Build a Nelder-Mead starting simplex around an internal parameter vector.
+
+        SciPy's default simplex perturbs each coordinate by 5% of its value, which
+        collapses to a 0.00025 step for internal values near zero, i.e. for every
+        parameter starting mid-range. Transformed coordinates are dimensionless, so
+        a fixed internal step explores all of them on the same footing.
+
+        Keyword arguments:
+        internal -- Starting parameter vector in the unconstrained space.
+        step -- Simplex edge length along transformed coordinates.
+
+        Return value:
+        Array of shape (K + 1, K) holding the simplex vertices.
+        """
+        start = np.asarray(internal, dtype=np.float64)
+        transformed = self.two_sided | self.lower_only | self.upper_only
+        default = np.where(start != 0.0, 0.05 * start, 0.00025)
+        steps = np.where(transformed, step, default)
+        return np.vstack([start, start + np.diag(steps)])
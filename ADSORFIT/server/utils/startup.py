@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import importlib
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from ADSORFIT.server.utils.logger import logger
+
+
+###############################################################################
+# -------------------------------------------------------------------------
+def preimport_modules(modules: Iterable[str]) -> dict[str, float]:
+    """Import the given modules ahead of time and record how long each one took.
+
+    Keyword arguments:
+    modules -- Fully qualified module names to import.
+
+    Return value:
+    Dictionary mapping module names to their import time in seconds. Modules that
+    cannot be imported are logged and omitted.
+    """
+    timings: dict[str, float] = {}
+    for module_name in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+        except ImportError as exc:
+            logger.warning("Warm-up import of %s failed: %s", module_name, exc)
+            continue
+        timings[module_name] = time.perf_counter() - start
+    return timings
+
+
+# -------------------------------------------------------------------------
+def run_timed_steps(steps: dict[str, Callable[[], Any]]) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    for step_name, step in steps.items():
+        start = time.perf_counter()
+        step()
+        timings[step_name] = time.perf_counter() - start
+    return timings
+
+
+# -------------------------------------------------------------------------
+def format_timings(timings: dict[str, float]) -> str:
+    return ", ".join(f"{name}={elapsed:.3f}s" for name, elapsed in timings.items())
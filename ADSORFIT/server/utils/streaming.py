@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from collections.abc import AsyncIterator
+from typing import Any
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+# -------------------------------------------------------------------------
+def to_json_safe(value: Any) -> Any:
+    """Recursively convert a payload into strict JSON values.
+
+    NumPy scalars become Python numbers and non-finite floats become None, since
+    NaN and Infinity are rejected by browsers' ``JSON.parse``.
+    """
+    if isinstance(value, dict):
+        return {str(key): to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_safe(item) for item in value]
+    if hasattr(value, "item") and callable(value.item):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+# -------------------------------------------------------------------------
+def format_event(event: str, data: Any) -> str:
+    payload = json.dumps(to_json_safe(data), allow_nan=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+###############################################################################
+class EventChannel:
+    """Hand Server-Sent Events from a worker thread to an async response stream."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    # -------------------------------------------------------------------------
+    def publish(self, event: str, data: Any) -> None:
+        message = format_event(event, data)
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+
+    # -------------------------------------------------------------------------
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+    # -------------------------------------------------------------------------
+    async def stream(self) -> AsyncIterator[str]:
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                break
+            yield message
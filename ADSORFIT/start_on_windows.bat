@@ -190,6 +190,7 @@ REM ============================================================================
 :load_env
 set "FASTAPI_HOST=127.0.0.1"
 set "FASTAPI_PORT=8000"
+set "FASTAPI_WORKERS=1"
 set "UI_HOST=127.0.0.1"
 set "UI_PORT=7861"
 set "RELOAD=false"
@@ -213,10 +214,12 @@ if exist "%DOTENV%" (
   echo [INFO] No .env overrides found at "%DOTENV%". Using defaults.
 )
 
-echo [INFO] FASTAPI_HOST=!FASTAPI_HOST! FASTAPI_PORT=!FASTAPI_PORT! UI_HOST=!UI_HOST! UI_PORT=!UI_PORT! RELOAD=!RELOAD!
+echo [INFO] FASTAPI_HOST=!FASTAPI_HOST! FASTAPI_PORT=!FASTAPI_PORT! FASTAPI_WORKERS=!FASTAPI_WORKERS! UI_HOST=!UI_HOST! UI_PORT=!UI_PORT! RELOAD=!RELOAD!
 set "UI_URL=http://!UI_HOST!:!UI_PORT!"
 set "RELOAD_FLAG="
 if /i "!RELOAD!"=="true" set "RELOAD_FLAG=--reload"
+set "WORKERS_FLAG="
+if /i not "!RELOAD!"=="true" if not "!FASTAPI_WORKERS!"=="1" set "WORKERS_FLAG=--workers !FASTAPI_WORKERS!"
 
 REM ============================================================================
 REM Start backend and frontend
@@ -228,7 +231,7 @@ if not exist "%python_exe%" (
 
 echo [RUN] Launching backend via uvicorn (!UVICORN_MODULE!)
 call :kill_port %FASTAPI_PORT%
-start "" /b "%uv_exe%" run --python "%python_exe%" python -m uvicorn %UVICORN_MODULE% --host %FASTAPI_HOST% --port %FASTAPI_PORT% %RELOAD_FLAG% --log-level info
+start "" /b "%uv_exe%" run --python "%python_exe%" python -m uvicorn %UVICORN_MODULE% --host %FASTAPI_HOST% --port %FASTAPI_PORT% %RELOAD_FLAG% !WORKERS_FLAG! --log-level info
 
 if not exist "%FRONTEND_DIR%\node_modules" (
   echo [STEP] Installing frontend dependencies...